@@ -3,15 +3,24 @@ Modular client structure for Hypertensor CLI.
 """
 
 import asyncio
+import functools
 import logging
+import threading
+from contextlib import contextmanager
 from typing import Any, Dict, Optional
 
 from substrateinterface import SubstrateInterface
 
 from ..models.requests import *
 from ..models.responses import *
+from .archive import ArchiveCache, ArchiveView
 from .chain import ChainClient
+from .dryrun import DEFAULT_DRY_RUN_WINDOW, DryRunner
+from .epoch import EpochClock
+from .signing import DEFAULT_SIGNING_ERA_PERIOD, SigningContext
 from .subnet import SubnetClient
+from .transport import ResilientTransport, RetryPolicy, connect_with_retry
+from .tx import DEFAULT_SUBMIT_WINDOW, read_chain_context, submit_pipelined
 from .wallet import WalletClient
 
 logger = logging.getLogger(__name__)
@@ -24,8 +33,16 @@ class HypertensorClient:
         self.config = config
         self.substrate = None
         self.ws_connection = None
+        self.transport = None
+        # Pins reads to the block given with --at-block
+        self.archive = None
+        # Caches dry run results between commands of one session
+        self.dry_runner = None
+        # Serializes RPC requests when the client is shared between threads
+        self.rpc_lock = threading.RLock()
 
         # Initialize modular clients
+        self.epoch_clock = None
         self.subnet = None
         self.wallet = None
         self.chain = None
@@ -36,13 +53,26 @@ class HypertensorClient:
         """Connect to the Hypertensor blockchain."""
         try:
             url = rpc_url or self.config.network.endpoint
-            self.substrate = SubstrateInterface(url=url, ss58_format=0)
+            policy = RetryPolicy.from_config(self.config.network)
+            self.substrate = connect_with_retry(
+                lambda: SubstrateInterface(
+                    url=url,
+                    ss58_format=0,
+                    ws_options={"timeout": self.config.network.timeout},
+                ),
+                url,
+                policy,
+            )
+            self.transport = ResilientTransport(self.substrate, url, policy)
+            self._serialize_rpc_requests(self.substrate)
+            self.dry_runner = None
             logger.info(f"Connected to blockchain at {url}")
 
-            # Initialize modular clients
-            self.subnet = SubnetClient(self.substrate)
+            # Initialize modular clients, sharing one epoch clock
+            self.epoch_clock = EpochClock(self.substrate)
+            self.subnet = SubnetClient(self.substrate, self.epoch_clock)
             self.wallet = WalletClient(self.substrate)
-            self.chain = ChainClient(self.substrate)
+            self.chain = ChainClient(self.substrate, self.epoch_clock)
 
             return True
         except Exception as e:
@@ -53,6 +83,30 @@ class HypertensorClient:
             self.chain = ChainClient(None)
             return False
 
+    def _serialize_rpc_requests(self, substrate):
+        """Guard the connection's RPC requests with the client lock.
+
+        SubstrateInterface shares one websocket and request counter between
+        callers, so concurrent flow steps must not interleave requests.
+        Requests go through the resilient transport, so a retry or reconnect
+        also happens under the lock. With ``at_block`` configured they are
+        also pinned to that block and served from the archive cache.
+        """
+        rpc_request = self.transport.wrap(substrate.rpc_request)
+        at_block = self.config.network.at_block
+        if at_block is not None:
+            self.archive = ArchiveView.resolve(
+                rpc_request, at_block, ArchiveCache(self.config.network.archive_path)
+            )
+            rpc_request = self.archive.wrap(rpc_request)
+
+        @functools.wraps(rpc_request)
+        def locked_rpc_request(*args, **kwargs):
+            with self.rpc_lock:
+                return rpc_request(*args, **kwargs)
+
+        substrate.rpc_request = locked_rpc_request
+
     async def connect_websocket(self, ws_url: Optional[str] = None):
         """Connect to WebSocket endpoint."""
         try:
@@ -90,6 +144,10 @@ class HypertensorClient:
         """Get all subnets data."""
         return self.subnet.get_subnets_data(active_only)
 
+    def iter_subnets_data(self):
+        """Iterate over subnets as SubnetRecord objects as they are read."""
+        return self.subnet.iter_subnets_data()
+
     def add_subnet_node(self, request: SubnetNodeAddRequest, keypair=None):
         """Add a node to a subnet."""
         return self.subnet.add_subnet_node(request, keypair)
@@ -152,6 +210,27 @@ class HypertensorClient:
             subnet_id, node_id, shares, keypair
         )
 
+    def remove_node_stake_automatically(
+        self,
+        subnet_id: int,
+        node_id: int,
+        key_name: str = None,
+        keypair=None,
+        address: str = None,
+    ):
+        """Remove all of an account's delegate stake from a node."""
+        return self.subnet.remove_node_stake_automatically(
+            subnet_id, node_id, key_name, keypair, address
+        )
+
+    def remove_subnet_stake_automatically(
+        self, subnet_id: int, key_name: str = None, keypair=None, address: str = None
+    ):
+        """Remove all of an account's delegate stake from a subnet."""
+        return self.subnet.remove_subnet_stake_automatically(
+            subnet_id, key_name, keypair, address
+        )
+
     def transfer_node_delegate_stake(
         self, subnet_id: int, node_id: int, to_account: str, shares: int, keypair=None
     ):
@@ -172,10 +251,26 @@ class HypertensorClient:
         """Get detailed status of a specific subnet node."""
         return self.subnet.get_subnet_node_status(subnet_id, node_id)
 
+    def get_subnet_nodes_status(self, subnet_id: int):
+        """Get the status of every node in a subnet."""
+        return self.subnet.get_subnet_nodes_status(subnet_id)
+
+    def get_node_records(self, nodes: list, block_hash: Optional[str] = None):
+        """Read the records of many nodes at one block."""
+        return self.subnet.get_node_records(nodes, block_hash)
+
+    def get_subnet_snapshot(self, subnet_id: int, block_hash: str):
+        """Read the parameters, nodes and stakes of a subnet at one block."""
+        return self.subnet.get_subnet_snapshot(subnet_id, block_hash)
+
     def get_subnet_nodes(self, subnet_id: int):
         """Get subnet nodes."""
         return self.subnet.get_subnet_nodes(subnet_id)
 
+    def iter_subnet_node_records(self, subnet_id: int):
+        """Iterate over subnet nodes as compact NodeRecord objects."""
+        return self.subnet.iter_subnet_node_records(subnet_id)
+
     def remove_subnet(self, subnet_id: int, keypair=None):
         """Remove a subnet."""
         return self.subnet.remove_subnet(subnet_id, keypair)
@@ -288,14 +383,32 @@ class HypertensorClient:
         return self.subnet.check_subnet_activation_requirements(subnet_id)
 
     # Staking information methods
-    def get_node_staking_info(self, subnet_id: int, node_id: int):
+    def discover_assets(
+        self,
+        addresses: list,
+        subnets: bool = True,
+        stakes: bool = True,
+        nodes: bool = True,
+    ):
+        """Discover subnets, stakes and nodes belonging to any of the addresses."""
+        return self.subnet.discover_assets(addresses, subnets, stakes, nodes)
+
+    def get_node_staking_info(
+        self, subnet_id: int, node_id: int, user_address: str = None
+    ):
         """Get node staking information."""
-        return self.subnet.get_node_staking_info(subnet_id, node_id)
+        return self.subnet.get_node_staking_info(subnet_id, node_id, user_address)
 
     def get_subnet_staking_info(self, subnet_id: int, user_address: str = None):
         """Get subnet staking information."""
         return self.subnet.get_subnet_staking_info(subnet_id, user_address)
 
+    def get_delegator_stats(
+        self, subnet_id: int, node_id: Optional[int] = None, top: int = 10
+    ):
+        """Aggregate the delegate stake share holders of a subnet or node."""
+        return self.subnet.get_delegator_stats(subnet_id, node_id, top)
+
     def get_general_staking_info(self, user_address: str = None):
         """Get general staking information."""
         return self.subnet.get_general_staking_info(user_address)
@@ -368,6 +481,10 @@ class HypertensorClient:
         """Get current epoch."""
         return self.chain.get_current_epoch()
 
+    def get_balances(self, addresses: list, block_hash: Optional[str] = None):
+        """Get balances and nonces of many accounts."""
+        return self.chain.get_balances(addresses, block_hash)
+
     def get_peers(self):
         """Get network peers."""
         return self.chain.get_peers()
@@ -409,10 +526,61 @@ class HypertensorClient:
         """Get the current chain head."""
         return self.chain.get_chain_head()
 
+    def get_head_block(self):
+        """Get the number and hash of the best block."""
+        return self.chain.get_head_block()
+
+    def resolve_block(self, block: Optional[str] = None):
+        """Get the number and hash of a block given by number or hash."""
+        return self.chain.resolve_block(block)
+
     def get_runtime_version(self):
         """Get the runtime version."""
         return self.chain.get_runtime_version()
 
+    @contextmanager
+    def signing_context(self, era_period: int = DEFAULT_SIGNING_ERA_PERIOD):
+        """
+        Share one SigningContext between the write methods called in the block.
+
+        Calls are composed and signed without re-reading the runtime, genesis
+        hash and nonce for every extrinsic.
+        """
+        if not self.substrate:
+            raise Exception("Not connected to blockchain")
+        context = SigningContext(self.substrate, era_period)
+        with context.installed():
+            yield context
+
+    # Offline transactions
+    def read_chain_context(self, metadata: bool = True):
+        """Read the chain context needed to sign extrinsics offline."""
+        return read_chain_context(self.substrate, metadata)
+
+    def submit_extrinsics(self, extrinsics, window: int = DEFAULT_SUBMIT_WINDOW):
+        """Submit signed extrinsics with several requests in flight at once."""
+        if not self.substrate:
+            raise Exception("Not connected to blockchain")
+        if self.archive is not None:
+            raise Exception("Cannot submit extrinsics while reading at a past block")
+        with self.rpc_lock:
+            yield from submit_pipelined(self.substrate, extrinsics, window)
+
+    def dry_run(self, calls, keypair, window: int = DEFAULT_DRY_RUN_WINDOW):
+        """
+        Estimate fees and dry-run composed calls before they are signed.
+
+        Results are cached by call hash, see DryRunner.
+        """
+        if not self.substrate:
+            raise Exception("Not connected to blockchain")
+        if self.archive is not None:
+            raise Exception("Cannot dry-run calls while reading at a past block")
+        with self.rpc_lock:
+            if self.dry_runner is None:
+                self.dry_runner = DryRunner(self.substrate)
+            return self.dry_runner.evaluate(calls, keypair, window)
+
     # ===== LEGACY METHODS (for backward compatibility) =====
 
     def list_subnets(self, active_only: bool = False):
@@ -0,0 +1,226 @@
+"""
+Historical reads for the Hypertensor client.
+
+Pins a connection's RPC requests to one block, so every read path sees the
+chain as it was at that block, and caches the results of requests made at
+finalized blocks on disk. State at a finalized block never changes, so each
+cached result is kept permanently, under a hash of the request that names
+the block.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Set, Tuple, Union
+
+from .transport import WRITE_METHODS
+
+logger = logging.getLogger(__name__)
+
+# Position of the block hash parameter of RPC methods that read at a block
+BLOCK_HASH_PARAMS = {
+    "state_getStorage": 1,
+    "state_getStorageAt": 1,
+    "state_getKeysPaged": 3,
+    "state_queryStorageAt": 1,
+    "state_call": 2,
+    "state_getMetadata": 0,
+    "state_getRuntimeVersion": 0,
+    "chain_getRuntimeVersion": 0,
+    "chain_getHeader": 0,
+    "chain_getBlock": 0,
+}
+
+# RPC methods that report the chain head, answered with the pinned block
+HEAD_METHODS = ("chain_getHead", "chain_getFinalizedHead")
+
+
+def parse_block_id(at_block: str) -> Union[int, str]:
+    """
+    Parse a block number or 0x-prefixed block hash.
+
+    Raises:
+        ValueError: If the value is neither
+    """
+    value = at_block.strip()
+    if value.isdigit():
+        return int(value)
+    if value.lower().startswith("0x") and len(value) == 66:
+        try:
+            int(value, 16)
+            return value.lower()
+        except ValueError:
+            pass
+    raise ValueError(f"Invalid block {at_block!r}: expected a number or block hash")
+
+
+def _result(response: Dict[str, Any]) -> Any:
+    if "error" in response:
+        raise Exception(response["error"].get("message", response["error"]))
+    return response.get("result")
+
+
+class ArchiveCache:
+    """On-disk store of RPC results, keyed by a hash of the request."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path).expanduser()
+
+    @staticmethod
+    def key(method: str, params: list) -> str:
+        request = json.dumps([method, params], separators=(",", ":"))
+        return hashlib.sha256(request.encode()).hexdigest()
+
+    def _file(self, key: str) -> Path:
+        return self.path / key[:2] / f"{key[2:]}.json"
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Look up a result, returning whether it was found and the result."""
+        try:
+            with open(self._file(key), "r") as f:
+                return True, json.load(f)["result"]
+        except FileNotFoundError:
+            return False, None
+        except (OSError, ValueError, KeyError) as e:
+            logger.debug(f"Ignoring unreadable archive entry {key}: {e}")
+            return False, None
+
+    def put(self, key: str, result: Any):
+        """Store a result, atomically so concurrent readers never see a partial file."""
+        file = self._file(key)
+        try:
+            file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=file.parent, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"result": result}, f)
+            os.replace(tmp, file)
+        except OSError as e:
+            logger.debug(f"Failed to write archive entry {key}: {e}")
+
+
+class ArchiveView:
+    """
+    RPC wrapper reading chain state at one block.
+
+    Reads without a block hash are sent for the pinned block and requests for
+    the chain head return it. If the pinned block is finalized, results of
+    requests at it and its ancestors are served from and stored in the cache.
+    Transactions are refused.
+    """
+
+    def __init__(
+        self,
+        block_hash: str,
+        block_number: int,
+        finalized: bool,
+        cache: Optional[ArchiveCache] = None,
+    ):
+        self.block_hash = block_hash
+        self.block_number = block_number
+        self.finalized = finalized
+        self.cache = cache if finalized else None
+        self.finalized_hashes: Set[str] = {block_hash} if finalized else set()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def resolve(
+        cls,
+        rpc_request: Callable[..., Any],
+        at_block: str,
+        cache: Optional[ArchiveCache] = None,
+    ) -> "ArchiveView":
+        """
+        Pin a block given by number or hash, checking whether it is finalized.
+
+        Raises:
+            ValueError: If the block is malformed or not found
+        """
+        block_id = parse_block_id(at_block)
+        if isinstance(block_id, int):
+            block_hash = _result(rpc_request("chain_getBlockHash", [block_id]))
+            if block_hash is None:
+                raise ValueError(f"Block {block_id} not found")
+            block_number = block_id
+        else:
+            header = _result(rpc_request("chain_getHeader", [block_id]))
+            if header is None:
+                raise ValueError(f"Block {block_id} not found")
+            block_hash, block_number = block_id, int(header["number"], 16)
+
+        finalized_hash = _result(rpc_request("chain_getFinalizedHead", []))
+        finalized_header = _result(rpc_request("chain_getHeader", [finalized_hash]))
+        finalized = block_number <= int(finalized_header["number"], 16)
+        if finalized and not isinstance(block_id, int):
+            # A hash below the finalized head may still be on an abandoned fork
+            canonical = _result(rpc_request("chain_getBlockHash", [block_number]))
+            finalized = canonical == block_hash
+
+        if not finalized:
+            logger.warning(
+                f"Block {block_number} is not finalized, its state will not be cached"
+            )
+        return cls(block_hash, block_number, finalized, cache)
+
+    def wrap(self, rpc_request: Callable[..., Any]) -> Callable[..., Any]:
+        """Get a version of an rpc_request function that reads at the pinned block."""
+
+        def archive_rpc_request(method, params, result_handler=None):
+            return self.request(rpc_request, method, params, result_handler)
+
+        return archive_rpc_request
+
+    def request(
+        self,
+        rpc_request: Callable[..., Any],
+        method: str,
+        params: Any,
+        result_handler: Optional[Callable[..., Any]] = None,
+    ) -> Any:
+        """Send one RPC request at the pinned block, using the cache if possible."""
+        if method in WRITE_METHODS:
+            raise ValueError("Transactions cannot be submitted at a past block")
+        if result_handler is not None:
+            return rpc_request(method, params, result_handler)
+        if method in HEAD_METHODS:
+            return {"jsonrpc": "2.0", "result": self.block_hash}
+
+        params = list(params or [])
+        cacheable = False
+        index = BLOCK_HASH_PARAMS.get(method)
+        if index is not None:
+            params += [None] * (index + 1 - len(params))
+            if params[index] is None:
+                params[index] = self.block_hash
+            cacheable = params[index] in self.finalized_hashes
+        elif method == "chain_getBlockHash":
+            if not params or params[0] is None:
+                return {"jsonrpc": "2.0", "result": self.block_hash}
+            cacheable = (
+                self.finalized
+                and isinstance(params[0], int)
+                and params[0] <= self.block_number
+            )
+
+        if not cacheable or self.cache is None:
+            return rpc_request(method, params, result_handler)
+
+        key = ArchiveCache.key(method, params)
+        found, result = self.cache.get(key)
+        if found:
+            self.hits += 1
+        else:
+            self.misses += 1
+            response = rpc_request(method, params, result_handler)
+            if "error" in response:
+                return response
+            result = response.get("result")
+            self.cache.put(key, result)
+
+        if method == "chain_getHeader" and result:
+            # Runtime metadata is read at the parent block, which is final too
+            self.finalized_hashes.add(result["parentHash"])
+        return {"jsonrpc": "2.0", "result": result}
@@ -5,11 +5,15 @@ Handles all chain-related blockchain operations.
 """
 
 import logging
-from typing import Optional
+from typing import List, Optional
 
+from scalecodec.utils.ss58 import ss58_decode
 from substrateinterface import SubstrateInterface
 
 from ..models.responses import *
+from .archive import parse_block_id
+from .epoch import EpochClock, EpochClockUnavailable
+from .storage import query_many
 
 logger = logging.getLogger(__name__)
 
@@ -17,8 +21,9 @@ logger = logging.getLogger(__name__)
 class ChainClient:
     """Client for chain operations."""
 
-    def __init__(self, substrate: SubstrateInterface):
+    def __init__(self, substrate: SubstrateInterface, epoch_clock: EpochClock = None):
         self.substrate = substrate
+        self.epoch_clock = epoch_clock or EpochClock(substrate)
 
     def get_network_stats(self):
         """Get network statistics using storage queries."""
@@ -66,26 +71,25 @@ class ChainClient:
             raise
 
     def get_current_epoch(self):
-        """Get current epoch using storage query."""
+        """Get the current epoch, computed locally from the block height."""
         try:
             if not self.substrate:
                 raise Exception("Not connected to blockchain")
 
-            # Try different storage functions for epoch
             try:
-                # Try Network.CurrentEpoch first
+                epoch_data = self.epoch_clock.status()
+            except EpochClockUnavailable:
+                # Runtimes without an epoch length constant only have storage
                 current_epoch = self.substrate.query(
                     module="Network", storage_function="CurrentEpoch", params=[]
                 )
                 epoch_value = current_epoch.value if current_epoch else 0
-            except:
-                # Fallback to a default value if storage function doesn't exist
-                epoch_value = 0
+                epoch_data = {"current_epoch": epoch_value}
 
             return EpochInfoResponse(
                 success=True,
                 message="Current epoch retrieved successfully",
-                data={"current_epoch": epoch_value},
+                data=epoch_data,
             )
         except Exception as e:
             logger.error(f"Failed to get current epoch: {str(e)}")
@@ -121,6 +125,70 @@ class ChainClient:
             logger.error(f"Failed to get balance: {str(e)}")
             raise
 
+    def get_balances(self, addresses: List[str], block_hash: str = None):
+        """
+        Get free, reserved and frozen balances and nonces of many accounts.
+
+        System.Account is read for every address in batched multi-key
+        queries instead of one query per address.
+
+        Args:
+            addresses: SS58 addresses
+            block_hash: Block to read at, defaults to the best block
+        """
+        try:
+            if not self.substrate:
+                raise Exception("Not connected to blockchain")
+
+            unique = list(dict.fromkeys(addresses))
+            valid = []
+            for address in unique:
+                try:
+                    ss58_decode(address)
+                    valid.append(address)
+                except Exception:
+                    pass
+
+            account_infos = query_many(
+                self.substrate, "System", "Account", valid, block_hash
+            )
+            values = dict(zip(valid, account_infos))
+
+            accounts = []
+            for address in unique:
+                if address not in values:
+                    accounts.append({"address": address, "error": "Invalid address"})
+                    continue
+
+                info = values[address] or {}
+                data = info.get("data") or {}
+                free = data.get("free", 0)
+                reserved = data.get("reserved", 0)
+                accounts.append(
+                    {
+                        "address": address,
+                        "free": free,
+                        "reserved": reserved,
+                        "frozen": data.get("frozen", data.get("misc_frozen", 0)),
+                        "total": free + reserved,
+                        "nonce": info.get("nonce", 0),
+                    }
+                )
+
+            return BalancesResponse.model_construct(
+                success=True,
+                message=f"Retrieved balances of {len(valid)} accounts",
+                data={
+                    "accounts": accounts,
+                    "total_free": sum(a.get("free", 0) for a in accounts),
+                    "total_reserved": sum(a.get("reserved", 0) for a in accounts),
+                },
+                address_count=len(accounts),
+            )
+        except Exception as e:
+            logger.error(f"Failed to get balances: {str(e)}")
+            raise
+
     def get_peers(self):
         """Get network peers using system_peers RPC."""
         try:
@@ -366,20 +434,15 @@ class ChainClient:
             if not self.substrate:
                 raise Exception("Not connected to blockchain")
 
-            # Get account balance
+            # System.Account holds both the balance and the nonce
             account_info = self.substrate.query(
                 module="System", storage_function="Account", params=[address]
             )
-
-            # Try to get account nonce - handle missing storage function
-            try:
-                nonce = self.substrate.query(
-                    module="System", storage_function="AccountNonce", params=[address]
-                )
-                nonce_value = nonce.value if nonce else 0
-            except Exception:
-                # If AccountNonce doesn't exist, use a default value
-                nonce_value = 0
+            nonce_value = (
+                account_info.value.get("nonce", 0)
+                if account_info and account_info.value
+                else 0
+            )
 
             balance = (
                 account_info.value["data"]["free"]
@@ -425,6 +488,44 @@ class ChainClient:
             logger.error(f"Failed to get chain head: {str(e)}")
             raise
 
+    def get_head_block(self) -> dict:
+        """Get the number and hash of the best block."""
+        if not self.substrate:
+            raise Exception("Not connected to blockchain")
+
+        block_hash = self.substrate.get_chain_head()
+        return {
+            "block_number": self.substrate.get_block_number(block_hash),
+            "block_hash": block_hash,
+        }
+
+    def resolve_block(self, block: Optional[str] = None) -> dict:
+        """
+        Get the number and hash of a block given by number or hash.
+
+        Args:
+            block: Block number or hash, defaults to the best block
+
+        Raises:
+            ValueError: If the block is malformed or not found
+        """
+        if not self.substrate:
+            raise Exception("Not connected to blockchain")
+
+        if block is None:
+            return self.get_head_block()
+
+        block_id = parse_block_id(block)
+        if isinstance(block_id, int):
+            block_hash = self.substrate.get_block_hash(block_id)
+            block_number = block_id if block_hash else None
+        else:
+            block_hash = block_id
+            block_number = self.substrate.get_block_number(block_hash)
+        if not block_hash or block_number is None:
+            raise ValueError(f"Block {block} not found")
+        return {"block_number": block_number, "block_hash": block_hash}
+
     def get_runtime_version(self):
         """Get the runtime version."""
         try:
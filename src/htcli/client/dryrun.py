@@ -0,0 +1,236 @@
+"""
+Dry runs of composed calls for the Hypertensor client.
+
+Before a destructive operation is signed for submission, each of its calls
+is evaluated against the best block: payment_queryInfo gives the fee and
+weight, and system_dryRun applies the extrinsic without including it to
+tell whether it would succeed. Requests for every call are pipelined on
+one connection, and results are cached by call hash.
+"""
+
+import hashlib
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..utils.agent import AgentKeypair
+from .signing import SigningContext
+from .tx import pipeline_requests, rpc_error_message
+
+# Dry run requests awaiting a response from the node at once
+DEFAULT_DRY_RUN_WINDOW = 64
+
+# Seconds a dry run result is reused for the same call and signer
+DEFAULT_DRY_RUN_CACHE_TTL = 30.0
+
+# Fee estimation needs a well-formed but not a valid signature
+_PLACEHOLDER_SIGNATURE = "0x" + "00" * 64
+
+# Variant names of the runtime's DispatchError and TransactionValidityError
+DISPATCH_ERRORS = (
+    "Other",
+    "CannotLookup",
+    "BadOrigin",
+    "Module",
+    "ConsumerRemaining",
+    "NoProviders",
+    "TooManyConsumers",
+    "Token",
+    "Arithmetic",
+    "Transactional",
+    "Exhausted",
+    "Corruption",
+    "Unavailable",
+    "RootNotAllowed",
+)
+INVALID_TRANSACTIONS = (
+    "Call",
+    "Payment",
+    "Future",
+    "Stale",
+    "BadProof",
+    "AncientBirthBlock",
+    "ExhaustsResources",
+    "Custom",
+    "BadMandatory",
+    "MandatoryValidation",
+    "BadSigner",
+)
+UNKNOWN_TRANSACTIONS = ("CannotLookup", "NoUnsignedValidator", "Custom")
+
+
+def call_hash(call) -> str:
+    """Blake2-256 hash of a composed call's encoding."""
+    data = bytes.fromhex(str(call.data)[2:])
+    return "0x" + hashlib.blake2b(data, digest_size=32).hexdigest()
+
+
+def _variant(names: Sequence[str], index: int) -> str:
+    return names[index] if index < len(names) else f"#{index}"
+
+
+def _module_error(metadata, pallet_index: int, error_index: int) -> str:
+    """Name a pallet error from the metadata, falling back to its indices."""
+    try:
+        pallet = metadata.get_pallet_by_index(pallet_index)
+        error = metadata.get_module_error(pallet_index, error_index)
+        return f"{pallet.name}.{error.name}"
+    except Exception:
+        return f"Module error {error_index} of pallet {pallet_index}"
+
+
+def decode_apply_result(data: str, metadata=None) -> Tuple[bool, Optional[str]]:
+    """
+    Decode the ApplyExtrinsicResult returned by system_dryRun.
+
+    The result is ``Result<Result<(), DispatchError>, TransactionValidityError>``:
+    the outer error means the extrinsic would not be included, the inner one
+    that it would be included but its dispatch would fail.
+
+    Returns:
+        Whether the extrinsic would succeed, and the reason when it would not
+    """
+    raw = bytes.fromhex(data[2:] if data.startswith("0x") else data)
+    if raw[0] == 1:
+        if raw[1] == 0:
+            name = _variant(INVALID_TRANSACTIONS, raw[2])
+            kind = "Invalid transaction"
+        else:
+            name = _variant(UNKNOWN_TRANSACTIONS, raw[2])
+            kind = "Unknown transaction"
+        if name == "Custom":
+            name = f"Custom({raw[3]})"
+        return False, f"{kind}: {name}"
+
+    if raw[1] == 0:
+        return True, None
+    name = _variant(DISPATCH_ERRORS, raw[2])
+    if name == "Module":
+        return False, _module_error(metadata, raw[3], raw[4])
+    return False, f"Dispatch error: {name}"
+
+
+class DryRunner:
+    """
+    Evaluate composed calls before they are signed for submission.
+
+    Each call is signed for its own dry run with the account's current
+    nonce, since every call is applied on its own to the best block. Keys
+    without a private key get a placeholder signature, which is enough for
+    the fee but not for a dry run.
+    """
+
+    def __init__(self, substrate, cache_ttl: float = DEFAULT_DRY_RUN_CACHE_TTL):
+        self.substrate = substrate
+        self.cache_ttl = cache_ttl
+        # Dry runs keep their own nonces, apart from real submissions
+        self.signing = SigningContext(substrate)
+        self._cache: Dict[Tuple[str, str, bool], Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def _cached(self, key) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry and time.monotonic() - entry[0] < self.cache_ttl:
+                return entry[1]
+            return None
+
+    def _state_nonce(self, address: str) -> int:
+        # The nonce in state rather than the pool's next index, since dry runs
+        # apply to the best block without any pending transactions
+        account = self.substrate.query("System", "Account", [address])
+        return (account.value or {}).get("nonce", 0)
+
+    def evaluate(
+        self, calls: Sequence[Any], keypair, window: int = DEFAULT_DRY_RUN_WINDOW
+    ) -> List[Dict[str, Any]]:
+        """
+        Dry-run calls for a signer, with every call's requests in flight at once.
+
+        The caller must hold the connection's RPC lock.
+
+        Args:
+            calls: Composed calls
+            keypair: Signer; without a private key only fees are estimated
+            window: Requests awaiting a response from the node at once
+
+        Returns:
+            One result per call, in order, with ``fee``, ``weight`` and
+            ``success``: True or False, or None when no dry run was possible
+        """
+        address = keypair.ss58_address
+        # Keys held by the key agent sign there, without a private key here
+        signed = isinstance(keypair, AgentKeypair) or bool(
+            getattr(keypair, "private_key", None)
+        )
+        results: List[Optional[Dict[str, Any]]] = [None] * len(calls)
+        misses: Dict[Tuple[str, str, bool], List[int]] = {}
+
+        for index, call in enumerate(calls):
+            key = (call_hash(call), address, signed)
+            cached = self._cached(key)
+            if cached is not None:
+                results[index] = cached
+            else:
+                misses.setdefault(key, []).append(index)
+
+        if misses:
+            evaluated = self._evaluate_misses(calls, misses, keypair, signed, window)
+            now = time.monotonic()
+            with self._lock:
+                for key, result in evaluated.items():
+                    self._cache[key] = (now, result)
+                    for index in misses[key]:
+                        results[index] = result
+
+        return [dict(result) for result in results]
+
+    def _evaluate_misses(self, calls, misses, keypair, signed, window):
+        nonce = self._state_nonce(keypair.ss58_address)
+        evaluated: Dict[Tuple[str, str, bool], Dict[str, Any]] = {}
+
+        # Signing reads chain state when the context loads, so every call is
+        # signed before requests are pipelined on the connection
+        requests = []
+        for key, indices in misses.items():
+            call = calls[indices[0]]
+            extra = {} if signed else {"signature": _PLACEHOLDER_SIGNATURE}
+            extrinsic = self.signing.create_signed_extrinsic(
+                call, keypair, nonce=nonce, **extra
+            )
+            evaluated[key] = {
+                "call_module": call.value["call_module"],
+                "call_function": call.value["call_function"],
+                "call_hash": key[0],
+                "fee": None,
+                "weight": None,
+                "success": None,
+                "message": None if signed else "No private key to dry-run with",
+            }
+            data = str(extrinsic.data)
+            requests.append(((key, "fee"), "payment_queryInfo", [data]))
+            if signed:
+                requests.append(((key, "dry_run"), "system_dryRun", [data]))
+
+        for (key, kind), message in pipeline_requests(
+            self.substrate, requests, window
+        ):
+            result = evaluated[key]
+            if "error" in message:
+                reason = rpc_error_message(message["error"])
+                if kind == "dry_run":
+                    result["message"] = f"Dry run unavailable: {reason}"
+                elif result["message"] is None:
+                    result["message"] = f"Fee unavailable: {reason}"
+            elif kind == "fee":
+                info = message.get("result") or {}
+                fee = info.get("partialFee", 0)
+                result["fee"] = int(fee, 0) if isinstance(fee, str) else int(fee)
+                result["weight"] = info.get("weight")
+            else:
+                success, reason = decode_apply_result(
+                    message["result"], self.substrate.metadata
+                )
+                result["success"] = success
+                result["message"] = reason
+        return evaluated
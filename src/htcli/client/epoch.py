@@ -0,0 +1,148 @@
+"""
+Local epoch clock for the Hypertensor client.
+
+Epochs are a fixed number of blocks long, so once the epoch length is known
+the epoch of any block can be computed without querying CurrentEpoch.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Block time assumed when the runtime does not expose one, in milliseconds
+DEFAULT_BLOCK_TIME_MS = 6000
+
+
+class EpochClockUnavailable(Exception):
+    """Raised when the runtime does not expose an epoch length."""
+
+
+class EpochClock:
+    """
+    Compute epochs from block heights.
+
+    The epoch length, block time and the offset between the block-derived
+    epoch and CurrentEpoch are read once. After that each reading costs at
+    most one header request, and none while the last head is under a block
+    time old.
+    """
+
+    def __init__(self, substrate):
+        self.substrate = substrate
+        self.epoch_length: Optional[int] = None
+        self.block_time_ms = DEFAULT_BLOCK_TIME_MS
+        # Difference between the block-derived epoch and CurrentEpoch
+        self.epoch_offset = 0
+        self._head: Optional[int] = None
+        self._head_at = 0.0
+        self._lock = threading.Lock()
+
+    def _constant(self, module: str, name: str) -> Optional[int]:
+        try:
+            constant = self.substrate.get_constant(module, name)
+        except Exception as e:
+            logger.debug(f"Constant {module}.{name} unavailable: {e}")
+            return None
+        value = getattr(constant, "value", None)
+        return value if isinstance(value, int) and value > 0 else None
+
+    def load(self):
+        """
+        Read the epoch length, block time and epoch offset once.
+
+        Raises:
+            EpochClockUnavailable: If the epoch length cannot be read
+        """
+        if self.epoch_length is not None:
+            return
+        if not self.substrate:
+            raise Exception("Not connected to blockchain")
+
+        epoch_length = self._constant("Network", "EpochLength")
+        if epoch_length is None:
+            raise EpochClockUnavailable("Network.EpochLength is not available")
+
+        expected_block_time = self._constant("Babe", "ExpectedBlockTime")
+        minimum_period = self._constant("Timestamp", "MinimumPeriod")
+        if expected_block_time:
+            self.block_time_ms = expected_block_time
+        elif minimum_period:
+            self.block_time_ms = minimum_period * 2
+
+        # Align with CurrentEpoch in case epochs were not counted from genesis
+        block_number = self._read_head()
+        try:
+            current_epoch = self.substrate.query(
+                module="Network", storage_function="CurrentEpoch"
+            )
+            value = getattr(current_epoch, "value", None)
+            if isinstance(value, int):
+                self.epoch_offset = block_number // epoch_length - value
+        except Exception as e:
+            logger.debug(f"CurrentEpoch unavailable, assuming no offset: {e}")
+
+        self.epoch_length = epoch_length
+        self.observe(block_number)
+
+    def _read_head(self) -> int:
+        response = self.substrate.rpc_request("chain_getHeader", [])
+        if "error" in response:
+            raise Exception(response["error"].get("message", response["error"]))
+        return int(response["result"]["number"], 16)
+
+    def observe(self, block_number: int):
+        """Record a new best block number."""
+        with self._lock:
+            if self._head is None or block_number >= self._head:
+                self._head = block_number
+                self._head_at = time.monotonic()
+
+    def block_number(self) -> int:
+        """
+        Get the best block number.
+
+        The last observed head is reused until a block time has passed since
+        it was seen, after which the latest header is read.
+        """
+        self.load()
+        with self._lock:
+            fresh = time.monotonic() - self._head_at < self.block_time_ms / 1000
+            if fresh:
+                return self._head
+        block_number = self._read_head()
+        self.observe(block_number)
+        return block_number
+
+    def epoch_at(self, block_number: int) -> int:
+        """Get the epoch of a block."""
+        self.load()
+        return block_number // self.epoch_length - self.epoch_offset
+
+    def current_epoch(self) -> int:
+        """Get the current epoch."""
+        return self.epoch_at(self.block_number())
+
+    def status(self, block_number: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get the epoch, position in the epoch and time to the next epoch.
+
+        Args:
+            block_number: Block to describe, defaults to the best block
+        """
+        self.load()
+        if block_number is None:
+            block_number = self.block_number()
+        epoch_length = self.epoch_length
+        block_in_epoch = block_number % epoch_length
+        blocks_remaining = epoch_length - block_in_epoch
+        return {
+            "current_epoch": self.epoch_at(block_number),
+            "block_number": block_number,
+            "epoch_length": epoch_length,
+            "block_in_epoch": block_in_epoch,
+            "blocks_until_next_epoch": blocks_remaining,
+            "seconds_until_next_epoch": blocks_remaining * self.block_time_ms / 1000,
+        }
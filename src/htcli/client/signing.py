@@ -0,0 +1,182 @@
+"""
+Reusable signing context for the Hypertensor client.
+
+Composing and signing an extrinsic through SubstrateInterface re-reads the
+chain head, runtime version, genesis hash and account nonce every time. A
+signing context reads them once, keeps a finalized era checkpoint and
+tracks nonces locally, so a batch of N extrinsics costs N encodes and
+signatures plus a constant number of RPC requests.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from .epoch import DEFAULT_BLOCK_TIME_MS
+from .tx import offline_substrate, read_chain_context
+
+# Mortal era length in blocks for extrinsics signed with a context
+DEFAULT_SIGNING_ERA_PERIOD = 64
+
+
+class CallTemplate:
+    """A call function resolved once: its module, function and argument names."""
+
+    def __init__(self, signer, module: str, function: str):
+        call_function = signer.get_metadata_call_function(module, function)
+        if call_function is None:
+            raise ValueError(f"Call {module}.{function} not found in metadata")
+        self.signer = signer
+        self.module = module
+        self.function = function
+        value = call_function.value
+        fields = value.get("fields", value.get("args")) or []
+        self.arg_names = tuple(field["name"] for field in fields)
+
+    def compose(self, params: Dict[str, Any]):
+        """
+        Encode a call with the given parameters.
+
+        Raises:
+            ValueError: If parameters are missing or unknown
+        """
+        missing = [name for name in self.arg_names if name not in params]
+        unknown = [name for name in params if name not in self.arg_names]
+        if missing or unknown:
+            raise ValueError(
+                f"{self.module}.{self.function}: missing parameters {missing}, "
+                f"unknown parameters {unknown}"
+            )
+        return self.signer.compose_call(
+            call_module=self.module, call_function=self.function, call_params=params
+        )
+
+
+class SigningContext:
+    """
+    Compose and sign extrinsics with chain state read once.
+
+    Genesis hash, runtime version and a finalized checkpoint block are read
+    when the context loads. Calls are composed from templates and signed on
+    a SubstrateInterface that shares the connection's decoded metadata but
+    answers its runtime lookups from that state, so neither needs an RPC
+    request. The checkpoint is re-read once half the era period has passed,
+    and nonces are read once per account and then counted locally.
+    """
+
+    def __init__(
+        self,
+        substrate,
+        era_period: int = DEFAULT_SIGNING_ERA_PERIOD,
+        block_time_ms: int = DEFAULT_BLOCK_TIME_MS,
+    ):
+        self.substrate = substrate
+        self.era_period = era_period
+        self.block_time_ms = block_time_ms
+        self.context: Optional[Dict[str, Any]] = None
+        self._signer = None
+        self._loaded_at = 0.0
+        self._templates: Dict[Tuple[str, str], CallTemplate] = {}
+        self._nonces: Dict[str, int] = {}
+        self._lock = threading.RLock()
+
+    def load(self):
+        """Read the chain state, again once the era checkpoint is half spent."""
+        with self._lock:
+            max_age = self.era_period * self.block_time_ms / 1000 / 2
+            age = time.monotonic() - self._loaded_at
+            if self._signer is not None and age < max_age:
+                return
+
+            context = read_chain_context(self.substrate, metadata=False)
+            previous = self.context
+            if previous and context["spec_version"] != previous["spec_version"]:
+                # Calls are resolved against the runtime's metadata
+                self._templates.clear()
+            self.context = context
+            self._signer = offline_substrate(context, runtime_from=self.substrate)
+            self._loaded_at = time.monotonic()
+
+    def template(self, module: str, function: str) -> CallTemplate:
+        """Get the template of a call, resolving it on first use."""
+        self.load()
+        with self._lock:
+            key = (module, function)
+            if key not in self._templates:
+                self._templates[key] = CallTemplate(self._signer, module, function)
+            return self._templates[key]
+
+    def compose_call(self, call_module: str, call_function: str, call_params=None):
+        """Compose a call without RPC requests, like SubstrateInterface.compose_call."""
+        template = self.template(call_module, call_function)
+        return template.compose(call_params or {})
+
+    def next_nonce(self, address: str) -> int:
+        """Get the next nonce of an account, reading it from the node once."""
+        with self._lock:
+            if address not in self._nonces:
+                self._nonces[address] = self.substrate.get_account_nonce(address) or 0
+            nonce = self._nonces[address]
+            self._nonces[address] += 1
+            return nonce
+
+    def reset_nonce(self, address: str):
+        """Forget an account's nonce so it is read from the node again."""
+        with self._lock:
+            self._nonces.pop(address, None)
+
+    def create_signed_extrinsic(
+        self, call, keypair, era: dict = None, nonce: int = None, **kwargs
+    ):
+        """
+        Sign a call, like SubstrateInterface.create_signed_extrinsic.
+
+        Extrinsics are mortal for ``era_period`` blocks from the checkpoint
+        unless an era is given.
+        """
+        self.load()
+        if nonce is None:
+            nonce = self.next_nonce(keypair.ss58_address)
+        if era is None:
+            era = {"period": self.era_period}
+        if "current" not in era and "phase" not in era:
+            era = {**era, "current": self.context["checkpoint"]["number"]}
+        return self._signer.create_signed_extrinsic(
+            call=call, keypair=keypair, era=era, nonce=nonce, **kwargs
+        )
+
+    @contextmanager
+    def installed(self) -> Iterator["SigningContext"]:
+        """
+        Route the connection's compose_call and create_signed_extrinsic here.
+
+        Write methods call these on the shared SubstrateInterface, so every
+        extrinsic they build while installed uses the context. A failed
+        submission makes nonces be read again, since it may not have used one.
+        """
+        substrate = self.substrate
+        names = ("compose_call", "create_signed_extrinsic", "submit_extrinsic")
+        previous = {name: vars(substrate).get(name) for name in names}
+        submit_extrinsic = substrate.submit_extrinsic
+
+        def submit_and_track(*args, **kwargs):
+            try:
+                return submit_extrinsic(*args, **kwargs)
+            except Exception:
+                with self._lock:
+                    self._nonces.clear()
+                raise
+
+        substrate.compose_call = self.compose_call
+        substrate.create_signed_extrinsic = self.create_signed_extrinsic
+        substrate.submit_extrinsic = submit_and_track
+        try:
+            yield self
+        finally:
+            for name, method in previous.items():
+                if method is None:
+                    # Drop the instance attribute so the class method applies
+                    vars(substrate).pop(name, None)
+                else:
+                    setattr(substrate, name, method)
@@ -0,0 +1,73 @@
+"""
+Batched storage reads shared by the client modules.
+"""
+
+from typing import Any, List, Optional, Tuple
+
+# Storage keys read per state_queryStorageAt request
+MULTI_QUERY_BATCH_SIZE = 500
+
+
+def query_keys(
+    substrate,
+    entries: List[Tuple[str, str, List[Any]]],
+    block_hash: Optional[str] = None,
+) -> List[Any]:
+    """
+    Read many storage entries with batched state_queryStorageAt requests.
+
+    Args:
+        substrate: Connected SubstrateInterface
+        entries: (module, storage function, key parameters) of each entry
+        block_hash: Block to read at, defaults to the best block
+
+    Returns:
+        Decoded values in the order of entries
+    """
+    values = []
+    for start in range(0, len(entries), MULTI_QUERY_BATCH_SIZE):
+        storage_keys = [
+            substrate.create_storage_key(module, storage_function, params)
+            for module, storage_function, params in entries[
+                start : start + MULTI_QUERY_BATCH_SIZE
+            ]
+        ]
+        results = {
+            storage_key.to_hex(): getattr(value, "value", value)
+            for storage_key, value in substrate.query_multi(
+                storage_keys, block_hash=block_hash
+            )
+        }
+        values.extend(results.get(key.to_hex()) for key in storage_keys)
+    return values
+
+
+def query_many(
+    substrate,
+    module: str,
+    storage_function: str,
+    params_list: List[Any],
+    block_hash: Optional[str] = None,
+) -> List[Any]:
+    """
+    Read many keys of one storage map with batched state_queryStorageAt requests.
+
+    Args:
+        substrate: Connected SubstrateInterface
+        module: Pallet name
+        storage_function: Storage map name
+        params_list: Key parameters of each entry to read
+        block_hash: Block to read at, defaults to the best block
+
+    Returns:
+        Decoded values in the order of params_list
+    """
+    entries = [
+        (
+            module,
+            storage_function,
+            list(params) if isinstance(params, (list, tuple)) else [params],
+        )
+        for params in params_list
+    ]
+    return query_keys(substrate, entries, block_hash)
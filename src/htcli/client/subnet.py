@@ -5,21 +5,56 @@ Handles all subnet-related blockchain operations.
 """
 
 import logging
+import time
 
+from scalecodec.utils.ss58 import ss58_decode
 from substrateinterface import SubstrateInterface
 
+from ..models.records import NodeRecord, SubnetRecord
 from ..models.requests import SubnetNodeAddRequest, SubnetRegisterRequest
 from ..models.responses import *
+from ..utils.delegators import DEFAULT_TOP_HOLDERS, DelegatorAggregate
 from ..utils.password import get_secure_password
+from ..utils.shares import shares_to_balance, shares_to_balances
+from .epoch import EpochClock, EpochClockUnavailable
+from .storage import query_keys, query_many
 
 logger = logging.getLogger(__name__)
 
+# Storage keys fetched per state_getKeysPaged request when scanning maps
+MAP_PAGE_SIZE = 1000
+
+# SubnetsData fields compared by subnet diff
+SUBNET_DIFF_FIELDS = ("name", "repo", "description", "misc", "state", "start_epoch")
+
+# Per-subnet Network storage compared by subnet diff, by get_subnet_data field
+SUBNET_DIFF_STORAGE = {
+    "owner": "SubnetOwner",
+    "churn_limit": "ChurnDenominator",
+    "registration_queue_epochs": "SubnetNodeRegistrationEpochs",
+    "max_node_penalties": "MaxSubnetNodePenalties",
+    "max_registered_nodes": "MaxRegisteredSubnetNodes",
+    "registration_epoch": "SubnetRegistrationEpoch",
+    "penalty_count": "SubnetPenaltyCount",
+    "total_nodes": "TotalSubnetNodes",
+    "total_active_nodes": "TotalActiveSubnetNodes",
+    "node_activation_interval": "SubnetNodeActivationInterval",
+    "total_delegate_stake_balance": "TotalSubnetDelegateStakeBalance",
+    "total_delegate_stake_shares": "TotalSubnetDelegateStakeShares",
+}
+
 
 class SubnetClient:
     """Client for subnet operations."""
 
-    def __init__(self, substrate: SubstrateInterface):
+    def __init__(self, substrate: SubstrateInterface, epoch_clock: EpochClock = None):
         self.substrate = substrate
+        self.epoch_clock = epoch_clock or EpochClock(substrate)
+        # Delegator statistics of the block they were last read at, and when
+        # that block was read as the chain head
+        self._delegator_block = None
+        self._delegator_stats = {}
+        self._delegator_head_at = 0.0
 
     def register_subnet(self, request: SubnetRegisterRequest, keypair=None):
         """Register a new subnet using Network.register_subnet with real transaction submission."""
@@ -300,40 +335,21 @@ class SubnetClient:
             )
 
             # Parse the subnet data - handle both full data and partial data
-            raw_data = subnet_data.value if subnet_data else {}
-
-            # Ensure raw_data is a dict
-            if raw_data is None:
-                raw_data = {}
+            record = SubnetRecord.from_storage(
+                subnet_id, subnet_data.value if subnet_data else None
+            )
+            has_data = not record.is_empty
 
             # Build comprehensive subnet info based on available data
             parsed_data = {
                 "subnet_id": subnet_id,
-                "id": (
-                    raw_data.get("id", subnet_id)
-                    if isinstance(raw_data, dict)
-                    else subnet_id
-                ),
-                "name": (
-                    raw_data.get("name", f"Subnet-{subnet_id}")
-                    if isinstance(raw_data, dict)
-                    else f"Subnet-{subnet_id}"
-                ),
-                "repo": raw_data.get("repo", "") if isinstance(raw_data, dict) else "",
-                "description": (
-                    raw_data.get("description", "")
-                    if isinstance(raw_data, dict)
-                    else ""
-                ),
-                "misc": raw_data.get("misc", "") if isinstance(raw_data, dict) else "",
-                "state": (
-                    raw_data.get("state", "Registered")
-                    if isinstance(raw_data, dict) and raw_data
-                    else "Partial"
-                ),
-                "start_epoch": (
-                    raw_data.get("start_epoch", 0) if isinstance(raw_data, dict) else 0
-                ),
+                "id": record.id if record.id is not None else subnet_id,
+                "name": record.name or f"Subnet-{subnet_id}",
+                "repo": record.repo or "",
+                "description": record.description or "",
+                "misc": record.misc or "",
+                "state": (record.state or "Registered") if has_data else "Partial",
+                "start_epoch": record.start_epoch or 0,
                 "churn_limit": self._safe_query_value("ChurnDenominator", subnet_id, 0),
                 "min_stake": self._safe_query_value(
                     "MinStakeBalance", None, 0
@@ -380,16 +396,19 @@ class SubnetClient:
                 "total_delegate_stake_shares": self._safe_query_value(
                     "TotalSubnetDelegateStakeShares", subnet_id, 0
                 ),
-                "data_completeness": "full" if raw_data else "partial",
-                "raw_data": raw_data,  # Keep raw data for debugging
+                "data_completeness": "full" if has_data else "partial",
             }
 
-            return SubnetInfoResponse(
+            # Storage fields not parsed above are kept alongside the parsed data
+            if record.extra:
+                parsed_data["extra_data"] = record.extra
+
+            return SubnetInfoResponse.model_construct(
                 success=True,
                 message="Subnet data retrieved successfully"
                 + (
                     " (partial data - subnet exists but not fully registered)"
-                    if not raw_data
+                    if not has_data
                     else ""
                 ),
                 data=parsed_data,
@@ -426,7 +445,7 @@ class SubnetClient:
             return default_value
 
     def get_subnets_data(self, active_only: bool = False):
-        """Get all subnets data using storage queries."""
+        """Get all subnets as SubnetRecord objects using storage queries."""
         try:
             if not self.substrate:
                 raise Exception("Not connected to blockchain")
@@ -437,18 +456,9 @@ class SubnetClient:
             )
 
             total_count = total_subnets.value if total_subnets else 0
-            subnets = []
-
-            # Query each subnet
-            for subnet_id in range(1, total_count + 1):
-                subnet_data = self.substrate.query(
-                    module="Network", storage_function="SubnetsData", params=[subnet_id]
-                )
+            subnets = list(self._iter_subnets(total_count))
 
-                if subnet_data and subnet_data.value:
-                    subnets.append({"subnet_id": subnet_id, "data": subnet_data.value})
-
-            return SubnetsListResponse(
+            return SubnetsListResponse.model_construct(
                 success=True,
                 message=f"Retrieved {len(subnets)} subnets",
                 data={"subnets": subnets},
@@ -457,6 +467,27 @@ class SubnetClient:
             logger.error(f"Failed to get subnets data: {str(e)}")
             raise
 
+    def iter_subnets_data(self):
+        """Yield a SubnetRecord for each subnet as its storage is read."""
+        if not self.substrate:
+            raise Exception("Not connected to blockchain")
+
+        total_subnets = self.substrate.query(
+            module="Network", storage_function="TotalSubnetUids", params=[]
+        )
+        total_count = total_subnets.value if total_subnets else 0
+        yield from self._iter_subnets(total_count)
+
+    def _iter_subnets(self, total_count: int):
+        """Yield a SubnetRecord for each populated subnet ID up to total_count."""
+        for subnet_id in range(1, total_count + 1):
+            subnet_data = self.substrate.query(
+                module="Network", storage_function="SubnetsData", params=[subnet_id]
+            )
+
+            if subnet_data and subnet_data.value:
+                yield SubnetRecord.from_storage(subnet_id, subnet_data.value)
+
     def add_subnet_node(self, request: SubnetNodeAddRequest, keypair=None):
         """Add a node to a subnet using Network.add_subnet_node with real transaction submission."""
         try:
@@ -1121,12 +1152,7 @@ class SubnetClient:
             if not self.substrate:
                 raise Exception("Not connected to blockchain")
 
-            # Get current epoch
-            current_epoch = self.substrate.query(
-                module="Network",
-                storage_function="CurrentEpoch",
-            )
-            current_epoch_value = current_epoch.value if current_epoch else 0
+            current_epoch_value = self._current_epoch()
 
             # Try to get node from active nodes first
             node_data = self.substrate.query(
@@ -1136,36 +1162,8 @@ class SubnetClient:
             )
 
             if node_data and node_data.value:
-                # Node is active
-                raw_data = node_data.value
-                if not isinstance(raw_data, dict):
-                    raw_data = {}
-
-                node_info = {
-                    "node_id": node_id,
-                    "subnet_id": subnet_id,
-                    "classification": "Active",  # Will be refined based on data
-                    "hotkey": raw_data.get("hotkey", ""),
-                    "peer_id": raw_data.get("peer_id", ""),
-                    "stake": raw_data.get("stake", 0),
-                    "delegate_reward_rate": raw_data.get("delegate_reward_rate", 0),
-                    "registration_epoch": raw_data.get("registration_epoch", 0),
-                    "start_epoch": raw_data.get("start_epoch", 0),
-                    "current_epoch": current_epoch_value,
-                    "attestation_ratio": raw_data.get("attestation_ratio", 0),
-                    "penalties": raw_data.get("penalties", 0),
-                    "grace_epochs": raw_data.get("grace_epochs", 0),
-                    "idle_epochs": raw_data.get("idle_epochs", 0),
-                    "status": "Active",
-                }
-
-                # Determine classification based on attestation ratio
-                attestation_ratio = raw_data.get("attestation_ratio", 0)
-                if attestation_ratio >= 66:
-                    node_info["classification"] = "Included"
-                else:
-                    node_info["classification"] = "Idle"
-
+                # Node is active, classified by its attestation ratio
+                record = NodeRecord.from_storage(subnet_id, node_id, node_data.value)
             else:
                 # Try to get from registered nodes
                 registered_node_data = self.substrate.query(
@@ -1176,27 +1174,12 @@ class SubnetClient:
 
                 if registered_node_data and registered_node_data.value:
                     # Node is registered but not active
-                    raw_data = registered_node_data.value
-                    if not isinstance(raw_data, dict):
-                        raw_data = {}
-
-                    node_info = {
-                        "node_id": node_id,
-                        "subnet_id": subnet_id,
-                        "classification": "Registered",
-                        "hotkey": raw_data.get("hotkey", ""),
-                        "peer_id": raw_data.get("peer_id", ""),
-                        "stake": raw_data.get("stake", 0),
-                        "delegate_reward_rate": raw_data.get("delegate_reward_rate", 0),
-                        "registration_epoch": raw_data.get("registration_epoch", 0),
-                        "start_epoch": raw_data.get("start_epoch", 0),
-                        "current_epoch": current_epoch_value,
-                        "attestation_ratio": 0,
-                        "penalties": 0,
-                        "grace_epochs": raw_data.get("grace_epochs", 0),
-                        "idle_epochs": raw_data.get("idle_epochs", 0),
-                        "status": "Registered",
-                    }
+                    record = NodeRecord.from_storage(
+                        subnet_id,
+                        node_id,
+                        registered_node_data.value,
+                        status="Registered",
+                    )
                 else:
                     # Node not found
                     return NodeAddResponse(
@@ -1205,18 +1188,182 @@ class SubnetClient:
                         data={},
                     )
 
-            return NodeAddResponse(
+            return NodeAddResponse.model_construct(
                 success=True,
                 message=f"Node {node_id} status retrieved successfully",
-                data={"node": node_info},
+                data={"node": record.to_status(current_epoch_value)},
             )
 
         except Exception as e:
             logger.error(f"Failed to get subnet node status: {str(e)}")
             raise
 
+    def get_subnet_nodes_status(self, subnet_id: int):
+        """
+        Get the status of every node in a subnet.
+
+        The current epoch is read once and both node maps are read with one
+        paged map query each, instead of two or three queries per node.
+        """
+        try:
+            if not self.substrate:
+                raise Exception("Not connected to blockchain")
+
+            current_epoch_value = self._current_epoch()
+
+            # Active entries take precedence, as in get_subnet_node_status
+            records = {}
+            for storage_function, status in (
+                ("RegisteredSubnetNodesData", "Registered"),
+                ("SubnetNodesData", "Active"),
+            ):
+                for keys, value in self._scan_map(
+                    storage_function, [subnet_id], strict=True
+                ):
+                    if value:
+                        node_id = keys[-1]
+                        records[node_id] = NodeRecord.from_storage(
+                            subnet_id, node_id, value, status
+                        )
+
+            nodes = [
+                records[node_id].to_status(current_epoch_value)
+                for node_id in sorted(records)
+            ]
+            registered_count = sum(
+                1 for record in records.values() if record.status == "Registered"
+            )
+
+            return NodesListResponse.model_construct(
+                success=True,
+                message=f"Retrieved status of {len(nodes)} nodes",
+                data={"current_epoch": current_epoch_value, "nodes": nodes},
+                nodes=nodes,
+                total_count=len(nodes),
+                active_count=len(nodes) - registered_count,
+                registered_count=registered_count,
+            )
+
+        except Exception as e:
+            logger.error(f"Failed to get subnet nodes status: {str(e)}")
+            raise
+
+    def get_node_records(self, nodes: list, block_hash: str = None) -> dict:
+        """
+        Read the records of many nodes across subnets at one block.
+
+        Active node data is read for every node in batched multi-key queries,
+        and registered node data only for the nodes that are not active.
+
+        Args:
+            nodes: (subnet_id, node_id) pairs
+            block_hash: Block to read at, defaults to the best block
+
+        Returns:
+            Dict of (subnet_id, node_id) to NodeRecord, or None if not found
+        """
+        if not self.substrate:
+            raise Exception("Not connected to blockchain")
+
+        records = {}
+        pending = [tuple(node) for node in nodes]
+        for storage_function, status in (
+            ("SubnetNodesData", "Active"),
+            ("RegisteredSubnetNodesData", "Registered"),
+        ):
+            values = query_many(
+                self.substrate, "Network", storage_function, pending, block_hash
+            )
+            for (subnet_id, node_id), value in zip(pending, values):
+                if value:
+                    records[(subnet_id, node_id)] = NodeRecord.from_storage(
+                        subnet_id, node_id, value, status
+                    )
+            pending = [node for node in pending if node not in records]
+
+        for node in pending:
+            records[node] = None
+        return records
+
+    def get_subnet_snapshot(self, subnet_id: int, block_hash: str) -> dict:
+        """
+        Read the parameters, nodes and stakes of a subnet at one block.
+
+        Both node maps are read with one paged map query each, and every
+        other entry in a single batched multi-key query over the keys they
+        determine. Parameters whose storage item the runtime does not define
+        are left out rather than failing the snapshot.
+
+        Returns:
+            Dict with ``parameters`` by name, ``nodes`` by node ID and the
+            names of ``unavailable`` parameters
+        """
+        if not self.substrate:
+            raise Exception("Not connected to blockchain")
+
+        records = {}
+        for storage_function, status in (
+            ("RegisteredSubnetNodesData", "Registered"),
+            ("SubnetNodesData", "Active"),
+        ):
+            for keys, value in self._scan_map(
+                storage_function, [subnet_id], strict=True, block_hash=block_hash
+            ):
+                if value:
+                    node_id = keys[-1]
+                    records[node_id] = NodeRecord.from_storage(
+                        subnet_id, node_id, value, status
+                    )
+
+        available, unavailable = {}, []
+        for name, storage_function in SUBNET_DIFF_STORAGE.items():
+            if self.substrate.get_metadata_storage_function(
+                "Network", storage_function
+            ):
+                available[name] = storage_function
+            else:
+                logger.debug(f"Network.{storage_function} is not in the metadata")
+                unavailable.append(name)
+
+        entries = [("Network", "SubnetsData", [subnet_id])]
+        entries += [
+            ("Network", storage_function, [subnet_id])
+            for storage_function in available.values()
+        ]
+        for node_id, record in sorted(records.items()):
+            entries.append(
+                ("Network", "NodeDelegateStakeBalance", [subnet_id, node_id])
+            )
+            if record.hotkey:
+                entries.append(
+                    ("Network", "AccountSubnetStake", [record.hotkey, subnet_id])
+                )
+        values = iter(query_keys(self.substrate, entries, block_hash))
+
+        subnet = SubnetRecord.from_storage(subnet_id, next(values))
+        parameters = {field: getattr(subnet, field) for field in SUBNET_DIFF_FIELDS}
+        for name in available:
+            parameters[name] = next(values)
+
+        nodes = {}
+        for node_id, record in sorted(records.items()):
+            status = record.to_status()
+            nodes[node_id] = {
+                "status": record.status,
+                "classification": status["classification"],
+                "hotkey": status["hotkey"],
+                "peer_id": status["peer_id"],
+                "delegate_reward_rate": status["delegate_reward_rate"],
+                "attestation_ratio": status["attestation_ratio"],
+                "penalties": status["penalties"],
+                "delegate_stake": next(values) or 0,
+                "stake": (next(values) or 0) if record.hotkey else 0,
+            }
+
+        return {"parameters": parameters, "nodes": nodes, "unavailable": unavailable}
+
     def get_subnet_nodes(self, subnet_id: int):
-        """Get subnet nodes using storage queries."""
+        """Get subnet nodes as NodeRecord objects using storage queries."""
         try:
             if not self.substrate:
                 raise Exception("Not connected to blockchain")
@@ -1229,20 +1376,9 @@ class SubnetClient:
             )
 
             total_count = total_nodes.value if total_nodes else 0
-            nodes = []
-
-            # Query each node
-            for node_id in range(1, total_count + 1):
-                node_data = self.substrate.query(
-                    module="Network",
-                    storage_function="SubnetNodesData",
-                    params=[subnet_id, node_id],
-                )
+            nodes = list(self._iter_nodes(subnet_id, total_count))
 
-                if node_data and node_data.value:
-                    nodes.append({"node_id": node_id, "data": node_data.value})
-
-            return NodesListResponse(
+            return NodesListResponse.model_construct(
                 success=True,
                 message=f"Retrieved {len(nodes)} nodes for subnet {subnet_id}",
                 data={"nodes": nodes},
@@ -1251,6 +1387,31 @@ class SubnetClient:
             logger.error(f"Failed to get subnet nodes: {str(e)}")
             raise
 
+    def iter_subnet_node_records(self, subnet_id: int):
+        """Yield a NodeRecord for each active node in a subnet."""
+        if not self.substrate:
+            raise Exception("Not connected to blockchain")
+
+        total_nodes = self.substrate.query(
+            module="Network",
+            storage_function="TotalSubnetNodes",
+            params=[subnet_id],
+        )
+        total_count = total_nodes.value if total_nodes else 0
+        yield from self._iter_nodes(subnet_id, total_count)
+
+    def _iter_nodes(self, subnet_id: int, total_count: int):
+        """Yield a NodeRecord for each populated node ID up to total_count."""
+        for node_id in range(1, total_count + 1):
+            node_data = self.substrate.query(
+                module="Network",
+                storage_function="SubnetNodesData",
+                params=[subnet_id, node_id],
+            )
+
+            if node_data and node_data.value:
+                yield NodeRecord.from_storage(subnet_id, node_id, node_data.value)
+
     # Additional subnet operations based on discovered Network pallet methods
     def remove_subnet(self, subnet_id: int, keypair=None):
         """Remove a subnet using Network.remove_subnet."""
@@ -2345,25 +2506,27 @@ class SubnetClient:
                 "SubnetNodePenalties", subnet_id, node_id, default_value=0
             )
 
-            # Calculate user's stake value (if shares available)
-            user_stake_value = 0
-            if user_node_shares > 0 and node_delegate_stake > 0:
-                # Calculate proportional stake value
-                user_stake_value = (
-                    user_node_shares / node_delegate_stake
-                ) * node_delegate_stake
+            # Convert the user's shares with the pool's balance and share totals
+            total_node_shares = self._safe_query_value(
+                "TotalNodeDelegateStakeShares", subnet_id, node_id, default_value=0
+            )
+            user_stake_value = shares_to_balance(
+                user_node_shares, node_delegate_stake, total_node_shares
+            )
 
             staking_info = {
                 "subnet_id": subnet_id,
                 "node_id": node_id,
                 "node_delegate_stake": node_delegate_stake,
                 "node_reward_rate": node_reward_rate,
+                "total_node_shares": total_node_shares,
                 "user_node_shares": user_node_shares,
                 "user_stake_value": user_stake_value,
                 "node_performance": node_performance,
                 "node_classification": node_classification,
                 "node_penalties": node_penalties,
                 "total_delegators": self._get_node_delegator_count(subnet_id, node_id),
+                "delegators": self._get_delegators(subnet_id, node_id),
                 "estimated_rewards": self._calculate_node_rewards(
                     node_delegate_stake, node_reward_rate
                 ),
@@ -2417,13 +2580,13 @@ class SubnetClient:
             # Get subnet statistics
             subnet_stats = self._safe_query_value("SubnetStatistics", subnet_id, {})
 
-            # Calculate user's stake value (if shares available)
-            user_stake_value = 0
-            if user_subnet_shares > 0 and subnet_delegate_stake > 0:
-                # Calculate proportional stake value
-                user_stake_value = (
-                    user_subnet_shares / subnet_delegate_stake
-                ) * subnet_delegate_stake
+            # Convert the user's shares with the pool's balance and share totals
+            total_subnet_shares = self._safe_query_value(
+                "TotalSubnetDelegateStakeShares", subnet_id, default_value=0
+            )
+            user_stake_value = shares_to_balance(
+                user_subnet_shares, subnet_delegate_stake, total_subnet_shares
+            )
 
             # Get subnet nodes for additional context
             subnet_nodes = self._get_subnet_nodes(subnet_id)
@@ -2432,11 +2595,13 @@ class SubnetClient:
                 "subnet_id": subnet_id,
                 "subnet_delegate_stake": subnet_delegate_stake,
                 "subnet_reward_rate": subnet_reward_rate,
+                "total_subnet_shares": total_subnet_shares,
                 "user_subnet_shares": user_subnet_shares,
                 "user_stake_value": user_stake_value,
                 "subnet_performance": subnet_performance,
                 "subnet_stats": subnet_stats,
                 "total_delegators": self._get_subnet_delegator_count(subnet_id),
+                "delegators": self._get_delegators(subnet_id),
                 "total_nodes": len(subnet_nodes),
                 "active_nodes": len(
                     [
@@ -2465,6 +2630,69 @@ class SubnetClient:
                 data={},
             )
 
+    def get_delegator_stats(
+        self,
+        subnet_id: int,
+        node_id: int = None,
+        top: int = DEFAULT_TOP_HOLDERS,
+        block_hash: str = None,
+    ) -> dict:
+        """
+        Aggregate the delegate stake share holders of a subnet or node.
+
+        SubnetDelegateStakeShares or NodeDelegateStakeShares is read under
+        the subnet or node prefix page by page, and each entry is folded
+        into the count, total, top holders and histogram as it arrives.
+        Results are cached for the block they were read at. Without a block,
+        the last head read is reused for one block time, so cached calls make
+        no request.
+
+        Args:
+            subnet_id: Subnet ID
+            node_id: Node ID for node delegators, None for subnet delegators
+            top: Number of largest holders to list
+            block_hash: Block to read at, defaults to the best block
+        """
+        if not self.substrate:
+            raise Exception("Not connected to blockchain")
+
+        now = time.monotonic()
+        read_head = False
+        if block_hash is None:
+            head_age = now - self._delegator_head_at
+            if self._delegator_head_at and head_age < (
+                self.epoch_clock.block_time_ms / 1000
+            ):
+                block_hash = self._delegator_block
+            else:
+                block_hash = self.substrate.get_chain_head()
+                read_head = True
+        if block_hash != self._delegator_block:
+            self._delegator_block = block_hash
+            self._delegator_stats = {}
+            self._delegator_head_at = 0.0
+        if read_head:
+            self._delegator_head_at = now
+
+        key = (subnet_id, node_id, top)
+        if key not in self._delegator_stats:
+            if node_id is None:
+                storage_function, prefix = "SubnetDelegateStakeShares", [subnet_id]
+            else:
+                storage_function = "NodeDelegateStakeShares"
+                prefix = [subnet_id, node_id]
+
+            aggregate = DelegatorAggregate(top)
+            for keys, shares in self._scan_map(
+                storage_function, prefix, strict=True, block_hash=block_hash
+            ):
+                aggregate.add(keys[-1], shares)
+
+            stats = aggregate.to_dict()
+            stats["block_hash"] = block_hash
+            self._delegator_stats[key] = stats
+        return self._delegator_stats[key]
+
     def get_general_staking_info(self, user_address: str = None):
         """Get general staking information across all subnets."""
         try:
@@ -2486,7 +2714,7 @@ class SubnetClient:
             total_network_stake = 0
 
             for subnet in subnets:
-                subnet_id = subnet.get("subnet_id")
+                subnet_id = subnet.subnet_id
                 if subnet_id:
                     # Get subnet staking info
                     subnet_staking = self.get_subnet_staking_info(
@@ -2544,27 +2772,252 @@ class SubnetClient:
                 data={},
             )
 
+    def discover_assets(
+        self,
+        addresses: list,
+        subnets: bool = True,
+        stakes: bool = True,
+        nodes: bool = True,
+    ):
+        """
+        Discover subnets, stakes and nodes belonging to any of the addresses.
+
+        Each storage map is scanned once and matched against all addresses
+        by public key, so the cost does not grow with the number of addresses.
+        A map that cannot be read fails the discovery rather than leaving its
+        assets out.
+        """
+        try:
+            if not self.substrate:
+                raise Exception("Not connected to blockchain")
+
+            accounts = {}
+            for address in addresses:
+                accounts.setdefault(self._account_id(address), address)
+
+            assets = {"subnets": [], "stakes": [], "nodes": []}
+            if subnets:
+                assets["subnets"] = self._discover_owned_subnets(accounts)
+            if stakes:
+                assets["stakes"] = self._discover_stake_positions(accounts)
+            if nodes:
+                assets["nodes"] = self._discover_nodes(accounts)
+
+            return AssetDiscoveryResponse.model_construct(
+                success=True,
+                message=(
+                    f"Discovered {sum(len(v) for v in assets.values())} assets "
+                    f"for {len(accounts)} addresses"
+                ),
+                data=assets,
+                address_count=len(accounts),
+            )
+        except Exception as e:
+            logger.error(f"Failed to discover assets: {str(e)}")
+            raise
+
+    def _current_epoch(self) -> int:
+        """Get the current epoch from the epoch clock, or storage as a fallback."""
+        try:
+            return self.epoch_clock.current_epoch()
+        except EpochClockUnavailable:
+            current_epoch = self.substrate.query(
+                module="Network", storage_function="CurrentEpoch"
+            )
+            return current_epoch.value if current_epoch else 0
+
+    @staticmethod
+    def _account_id(address) -> str:
+        """Normalize an SS58 address to its public key for comparison."""
+        try:
+            return ss58_decode(str(address))
+        except Exception:
+            return str(address)
+
+    def _scan_map(
+        self,
+        storage_function: str,
+        params: list = None,
+        strict: bool = False,
+        block_hash: str = None,
+    ):
+        """
+        Yield (key values, value) pairs from a Network storage map.
+
+        Read errors end the scan quietly unless ``strict`` is set.
+        """
+        try:
+            result = self.substrate.query_map(
+                module="Network",
+                storage_function=storage_function,
+                params=params or [],
+                block_hash=block_hash,
+                page_size=MAP_PAGE_SIZE,
+            )
+            for key, value in result:
+                keys = key if isinstance(key, (tuple, list)) else (key,)
+                yield (
+                    tuple(getattr(k, "value", k) for k in keys),
+                    getattr(value, "value", value),
+                )
+        except Exception as e:
+            if strict:
+                raise
+            logger.debug(f"Failed to scan {storage_function}: {e}")
+
+    def _discover_owned_subnets(self, accounts: dict) -> list:
+        """Match SubnetOwner entries against the accounts."""
+        owned = []
+        for (subnet_id,), owner in self._scan_map("SubnetOwner", strict=True):
+            address = accounts.get(self._account_id(owner))
+            if address is None:
+                continue
+
+            record = SubnetRecord.from_storage(
+                subnet_id, self._safe_query_value("SubnetsData", subnet_id)
+            )
+            owned.append(
+                {
+                    "subnet_id": subnet_id,
+                    "path": record.name or f"subnet-{subnet_id}",
+                    "state": record.state or "Unknown",
+                    "owner": address,
+                }
+            )
+        return owned
+
+    def _discover_nodes(self, accounts: dict) -> list:
+        """Match active and registered node hotkeys/coldkeys against the accounts."""
+        found = []
+        for storage_function, status in (
+            ("SubnetNodesData", "Active"),
+            ("RegisteredSubnetNodesData", "Registered"),
+        ):
+            for (subnet_id, node_id), value in self._scan_map(storage_function, strict=True):
+                record = NodeRecord.from_storage(subnet_id, node_id, value, status)
+                coldkey = (record.extra or {}).get("coldkey")
+                for key in (record.hotkey, coldkey):
+                    address = key and accounts.get(self._account_id(key))
+                    if address:
+                        found.append(
+                            {
+                                "subnet_id": subnet_id,
+                                "node_id": node_id,
+                                "status": status,
+                                "hotkey": record.hotkey,
+                                "address": address,
+                            }
+                        )
+                        break
+        return found
+
+    def _discover_stake_positions(self, accounts: dict) -> list:
+        """Match subnet and node delegate stake shares against the accounts."""
+        positions = []
+        # Pool (balance, shares) totals, read once per subnet or node
+        subnet_pools = {}
+        node_pools = {}
+        position_pools = []
+
+        for (subnet_id, account), shares in self._scan_map(
+            "SubnetDelegateStakeShares", strict=True
+        ):
+            address = accounts.get(self._account_id(account))
+            if address is None or not shares:
+                continue
+
+            if subnet_id not in subnet_pools:
+                subnet_pools[subnet_id] = (
+                    self._safe_query_value(
+                        "TotalSubnetDelegateStakeBalance", subnet_id, default_value=0
+                    ),
+                    self._safe_query_value(
+                        "TotalSubnetDelegateStakeShares", subnet_id, default_value=0
+                    ),
+                )
+            position_pools.append(subnet_pools[subnet_id])
+            positions.append(
+                {
+                    "subnet_id": subnet_id,
+                    "node_id": None,
+                    "type": "subnet_delegate",
+                    "shares": shares,
+                    "status": "active",
+                    "address": address,
+                }
+            )
+
+        # Three-key maps are scanned per subnet so the account key is decoded
+        total_subnet_uids = self.substrate.query(
+            module="Network", storage_function="TotalSubnetUids"
+        )
+        total_subnets = total_subnet_uids.value or 0
+        for subnet_id in range(1, total_subnets + 1):
+            for (node_id, account), shares in self._scan_map(
+                "NodeDelegateStakeShares", [subnet_id], strict=True
+            ):
+                address = accounts.get(self._account_id(account))
+                if address is None or not shares:
+                    continue
+
+                pool_key = (subnet_id, node_id)
+                if pool_key not in node_pools:
+                    node_pools[pool_key] = (
+                        self._safe_query_value(
+                            "NodeDelegateStakeBalance",
+                            subnet_id,
+                            node_id,
+                            default_value=0,
+                        ),
+                        self._safe_query_value(
+                            "TotalNodeDelegateStakeShares",
+                            subnet_id,
+                            node_id,
+                            default_value=0,
+                        ),
+                    )
+                position_pools.append(node_pools[pool_key])
+                positions.append(
+                    {
+                        "subnet_id": subnet_id,
+                        "node_id": node_id,
+                        "type": "node_delegate",
+                        "shares": shares,
+                        "status": "active",
+                        "address": address,
+                    }
+                )
+
+        # Convert every position in one pass
+        amounts = shares_to_balances(
+            [position["shares"] for position in positions],
+            [pool[0] for pool in position_pools],
+            [pool[1] for pool in position_pools],
+        )
+        for position, amount in zip(positions, amounts):
+            position["amount"] = amount
+
+        return positions
+
     # ============================================================================
     # Helper Methods for Staking Information
     # ============================================================================
 
     def _get_node_delegator_count(self, subnet_id: int, node_id: int) -> int:
         """Get the number of delegators for a specific node."""
-        try:
-            # This would query the actual delegator count from the blockchain
-            # For now, return a placeholder value
-            return 0
-        except Exception:
-            return 0
+        return self._get_delegators(subnet_id, node_id)["count"]
 
     def _get_subnet_delegator_count(self, subnet_id: int) -> int:
         """Get the number of delegators for a subnet."""
+        return self._get_delegators(subnet_id)["count"]
+
+    def _get_delegators(self, subnet_id: int, node_id: int = None) -> dict:
+        """Get delegator statistics, or empty statistics if they cannot be read."""
         try:
-            # This would query the actual delegator count from the blockchain
-            # For now, return a placeholder value
-            return 0
-        except Exception:
-            return 0
+            return self.get_delegator_stats(subnet_id, node_id)
+        except Exception as e:
+            logger.debug(f"Failed to read delegators of subnet {subnet_id}: {e}")
+            return DelegatorAggregate().to_dict()
 
     def _get_subnet_nodes(self, subnet_id: int) -> list:
         """Get all nodes for a subnet."""
@@ -2685,9 +3138,19 @@ class SubnetClient:
     # ============================================================================
 
     def remove_node_stake_automatically(
-        self, subnet_id: int, node_id: int, key_name: str = None, keypair=None
+        self,
+        subnet_id: int,
+        node_id: int,
+        key_name: str = None,
+        keypair=None,
+        address: str = None,
     ):
-        """Automatically remove all stake from a node after node removal."""
+        """
+        Automatically remove all stake from a node after node removal.
+
+        Without a keypair the call is only composed, removing the shares of
+        ``address``.
+        """
         try:
             if not self.substrate:
                 raise Exception("Not connected to blockchain")
@@ -2705,7 +3168,9 @@ class SubnetClient:
                 keypair = load_keypair(key_name, password)
 
             # First, get the current stake amount for this node
-            node_stake_info = self.get_node_staking_info(subnet_id, node_id)
+            if keypair:
+                address = keypair.ss58_address
+            node_stake_info = self.get_node_staking_info(subnet_id, node_id, address)
             if not node_stake_info.success:
                 return StakeRemoveResponse(
                     success=False,
@@ -2745,14 +3210,6 @@ class SubnetClient:
                     extrinsic=extrinsic, wait_for_inclusion=True
                 )
 
-                # Calculate the estimated stake value that was removed
-                node_delegate_stake = stake_data.get("node_delegate_stake", 0)
-                estimated_removed_value = 0
-                if node_delegate_stake > 0:
-                    estimated_removed_value = (
-                        user_node_shares / node_delegate_stake
-                    ) * node_delegate_stake
-
                 return StakeRemoveResponse(
                     success=True,
                     message="Automatic stake removal completed successfully",
@@ -2760,7 +3217,7 @@ class SubnetClient:
                     block_number=receipt.block_number,
                     data={
                         "receipt": receipt,
-                        "removed_amount": estimated_removed_value,
+                        "removed_amount": stake_data.get("user_stake_value", 0),
                         "shares_removed": user_node_shares,
                         "subnet_id": subnet_id,
                         "node_id": node_id,
@@ -2776,7 +3233,7 @@ class SubnetClient:
                     block_number=None,
                     data={
                         "call_data": call_data,
-                        "removed_amount": 0,
+                        "removed_amount": stake_data.get("user_stake_value", 0),
                         "shares_removed": user_node_shares,
                         "subnet_id": subnet_id,
                         "node_id": node_id,
@@ -2793,9 +3250,14 @@ class SubnetClient:
             )
 
     def remove_subnet_stake_automatically(
-        self, subnet_id: int, key_name: str = None, keypair=None
+        self, subnet_id: int, key_name: str = None, keypair=None, address: str = None
     ):
-        """Automatically remove all stake from a subnet after subnet removal."""
+        """
+        Automatically remove all stake from a subnet after subnet removal.
+
+        Without a keypair the call is only composed, removing the shares of
+        ``address``.
+        """
         try:
             if not self.substrate:
                 raise Exception("Not connected to blockchain")
@@ -2813,7 +3275,9 @@ class SubnetClient:
                 keypair = load_keypair(key_name, password)
 
             # First, get the current stake amount for this subnet
-            subnet_stake_info = self.get_subnet_staking_info(subnet_id)
+            if keypair:
+                address = keypair.ss58_address
+            subnet_stake_info = self.get_subnet_staking_info(subnet_id, address)
             if not subnet_stake_info.success:
                 return StakeRemoveResponse(
                     success=False,
@@ -2852,14 +3316,6 @@ class SubnetClient:
                     extrinsic=extrinsic, wait_for_inclusion=True
                 )
 
-                # Calculate the estimated stake value that was removed
-                subnet_delegate_stake = stake_data.get("subnet_delegate_stake", 0)
-                estimated_removed_value = 0
-                if subnet_delegate_stake > 0:
-                    estimated_removed_value = (
-                        user_subnet_shares / subnet_delegate_stake
-                    ) * subnet_delegate_stake
-
                 return StakeRemoveResponse(
                     success=True,
                     message="Automatic subnet stake removal completed successfully",
@@ -2867,7 +3323,7 @@ class SubnetClient:
                     block_number=receipt.block_number,
                     data={
                         "receipt": receipt,
-                        "removed_amount": estimated_removed_value,
+                        "removed_amount": stake_data.get("user_stake_value", 0),
                         "shares_removed": user_subnet_shares,
                         "subnet_id": subnet_id,
                         "node_id": None,
@@ -2883,7 +3339,7 @@ class SubnetClient:
                     block_number=None,
                     data={
                         "call_data": call_data,
-                        "removed_amount": 0,
+                        "removed_amount": stake_data.get("user_stake_value", 0),
                         "shares_removed": user_subnet_shares,
                         "subnet_id": subnet_id,
                         "node_id": None,
@@ -0,0 +1,233 @@
+"""
+Resilient RPC transport for the Hypertensor client.
+
+Wraps a SubstrateInterface connection's RPC requests with a per-call
+deadline, jittered exponential backoff for idempotent reads, automatic
+reconnection after transport errors and a circuit breaker per endpoint.
+"""
+
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from websocket import WebSocketConnectionClosedException, WebSocketTimeoutException
+
+logger = logging.getLogger(__name__)
+
+# Errors after which the connection is assumed broken and the call may be retried.
+# RPC errors reported by the node (SubstrateRequestException) are not retried.
+TRANSIENT_ERRORS = (
+    WebSocketConnectionClosedException,
+    WebSocketTimeoutException,
+    OSError,
+)
+
+# RPC methods that change chain state and are never replayed
+WRITE_METHODS = ("author_submitExtrinsic", "author_submitAndWatchExtrinsic")
+
+# Backoff between retries, in seconds
+BASE_DELAY = 0.25
+MAX_DELAY = 5.0
+
+# Consecutive transport failures that open an endpoint's circuit, and how long
+# it stays open before a trial request is let through
+FAILURE_THRESHOLD = 5
+RESET_TIMEOUT = 30.0
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised when requests to an endpoint are short-circuited."""
+
+
+@dataclass
+class RetryPolicy:
+    """How idempotent requests are retried."""
+
+    retry_attempts: int = 3
+    # Deadline for one call, including retries, in seconds
+    timeout: float = 30.0
+    base_delay: float = BASE_DELAY
+    max_delay: float = MAX_DELAY
+
+    @classmethod
+    def from_config(cls, network_config) -> "RetryPolicy":
+        """Build a policy from NetworkConfig.retry_attempts and timeout."""
+        return cls(
+            retry_attempts=max(0, network_config.retry_attempts),
+            timeout=float(network_config.timeout),
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry number ``attempt`` (0-based), with full jitter."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    requests fail immediately. Once ``reset_timeout`` has passed one trial
+    request is allowed; its success closes the circuit again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(
+        self,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        reset_timeout: float = RESET_TIMEOUT,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> bool:
+        """Check whether a request may be sent."""
+        with self._lock:
+            state = self.state
+            if state == self.HALF_OPEN:
+                # Let one trial request through and hold the rest
+                self.opened_at = time.monotonic()
+                return True
+            return state == self.CLOSED
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(endpoint: str) -> CircuitBreaker:
+    """Get the circuit breaker shared by all connections to an endpoint."""
+    with _breakers_lock:
+        if endpoint not in _breakers:
+            _breakers[endpoint] = CircuitBreaker()
+        return _breakers[endpoint]
+
+
+def connect_with_retry(
+    connect: Callable[[], Any], endpoint: str, policy: RetryPolicy
+) -> Any:
+    """Open a connection, retrying transport errors with backoff."""
+    breaker = get_circuit_breaker(endpoint)
+    for attempt in range(policy.retry_attempts + 1):
+        if not breaker.allow():
+            raise CircuitOpenError(f"Circuit open for {endpoint}")
+        try:
+            connection = connect()
+        except TRANSIENT_ERRORS as e:
+            breaker.record_failure()
+            if attempt >= policy.retry_attempts:
+                raise
+            delay = policy.backoff(attempt)
+            logger.warning(f"Connecting to {endpoint} failed ({e}), retrying")
+            time.sleep(delay)
+        else:
+            breaker.record_success()
+            return connection
+
+
+class ResilientTransport:
+    """Retrying wrapper around a SubstrateInterface connection's rpc_request."""
+
+    def __init__(self, substrate, endpoint: str, policy: RetryPolicy):
+        self.substrate = substrate
+        self.endpoint = endpoint
+        self.policy = policy
+        self.breaker = get_circuit_breaker(endpoint)
+
+    def wrap(self, rpc_request: Callable[..., Any]) -> Callable[..., Any]:
+        """Get a resilient version of an rpc_request function."""
+
+        def resilient_rpc_request(method, params, result_handler=None):
+            return self.request(rpc_request, method, params, result_handler)
+
+        return resilient_rpc_request
+
+    def request(
+        self,
+        rpc_request: Callable[..., Any],
+        method: str,
+        params: Any,
+        result_handler: Optional[Callable[..., Any]] = None,
+    ) -> Any:
+        """
+        Send one RPC request under the retry policy.
+
+        Reads are retried with backoff, after reconnecting, until they succeed
+        or the call's deadline passes. Submissions and subscriptions are sent
+        once, since replaying them could repeat a transaction.
+        """
+        idempotent = result_handler is None and method not in WRITE_METHODS
+        attempts = self.policy.retry_attempts + 1 if idempotent else 1
+        deadline = time.monotonic() + self.policy.timeout
+
+        for attempt in range(attempts):
+            if not self.breaker.allow():
+                raise CircuitOpenError(
+                    f"Circuit open for {self.endpoint} after repeated failures"
+                )
+
+            # Reads must finish by the deadline; long-running submissions
+            # only need the node to keep responding
+            if idempotent:
+                self._set_timeout(max(deadline - time.monotonic(), 0.001))
+            else:
+                self._set_timeout(self.policy.timeout)
+
+            try:
+                result = rpc_request(method, params, result_handler)
+            except TRANSIENT_ERRORS as e:
+                self.breaker.record_failure()
+                self._reconnect()
+
+                delay = self.policy.backoff(attempt)
+                if attempt + 1 >= attempts or time.monotonic() + delay >= deadline:
+                    raise
+                logger.warning(
+                    f"RPC {method} failed ({type(e).__name__}: {e}), "
+                    f"retrying in {delay:.2f}s"
+                )
+                time.sleep(delay)
+            else:
+                self.breaker.record_success()
+                return result
+
+    def _set_timeout(self, timeout: float):
+        """Bound the socket reads of the next attempt."""
+        websocket = getattr(self.substrate, "websocket", None)
+        if websocket is not None:
+            websocket.settimeout(timeout)
+
+    def _reconnect(self):
+        """Replace a connection left in an unknown state by a failed request."""
+        try:
+            self.substrate.connect_websocket()
+        except Exception as e:
+            logger.debug(f"Reconnecting to {self.endpoint} failed: {e}")
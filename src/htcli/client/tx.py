@@ -0,0 +1,337 @@
+"""
+Offline transaction pipeline for the Hypertensor client.
+
+Calls are composed on a connected host and written out as unsigned payloads,
+together with the chain context needed to sign them: genesis hash, runtime
+version, metadata and a finalized checkpoint block for mortal eras. A host
+without network access signs the payloads with explicit nonces, and the
+signed extrinsics are later submitted in bulk with several requests in
+flight at once.
+"""
+
+import json
+import logging
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+
+from substrateinterface import SubstrateInterface
+
+logger = logging.getLogger(__name__)
+
+# Record types in payload and signed extrinsic files
+CONTEXT = "context"
+CALL = "call"
+EXTRINSIC = "extrinsic"
+
+# Mortal era length in blocks, counted from the checkpoint block. Offline
+# signing takes a while, so the default is the longest era whose birth block
+# is still the checkpoint itself: about seven hours of blocks.
+MAX_ERA_PERIOD = 4096
+DEFAULT_ERA_PERIOD = MAX_ERA_PERIOD
+
+# Submissions awaiting a response from the node at once
+DEFAULT_SUBMIT_WINDOW = 32
+
+_EMPTY_HASH = "0x" + "00" * 32
+
+
+def read_chain_context(substrate, metadata: bool = True) -> Dict[str, Any]:
+    """
+    Read the chain context needed to sign extrinsics offline.
+
+    The checkpoint is the finalized head, which mortal eras are counted
+    from, so an extrinsic signed against it stays valid for the era period
+    after the payloads were built.
+
+    Args:
+        substrate: Connected SubstrateInterface
+        metadata: Include the runtime metadata, needed only by the signer
+    """
+    if not substrate:
+        raise Exception("Not connected to blockchain")
+
+    checkpoint_hash = substrate.get_chain_finalised_head()
+    substrate.init_runtime(block_hash=checkpoint_hash)
+    context = {
+        "type": CONTEXT,
+        "chain": substrate.chain,
+        "ss58_format": substrate.ss58_format,
+        "genesis_hash": substrate.get_block_hash(0),
+        "spec_version": substrate.runtime_version,
+        "transaction_version": substrate.transaction_version,
+        "checkpoint": {
+            "number": substrate.get_block_number(checkpoint_hash),
+            "hash": checkpoint_hash,
+        },
+    }
+    if metadata:
+        response = substrate.rpc_request("state_getMetadata", [checkpoint_hash])
+        if "error" in response:
+            raise Exception(response["error"].get("message", response["error"]))
+        context["metadata"] = response["result"]
+    return context
+
+
+def call_payload(call) -> Dict[str, Any]:
+    """Describe a composed call: its encoding plus readable arguments for review."""
+    return {
+        "type": CALL,
+        "call_module": call.value["call_module"],
+        "call_function": call.value["call_function"],
+        "call_args": call.value["call_args"],
+        "call": str(call.data),
+    }
+
+
+class _OfflineSocket:
+    """Stand-in websocket for a SubstrateInterface that must never connect."""
+
+    def send(self, *args, **kwargs):
+        raise ConnectionError("No network access while signing offline")
+
+    recv = send
+
+    def close(self):
+        pass
+
+
+class OfflineRPC:
+    """
+    Answer the RPC requests made while signing from a chain context.
+
+    SubstrateInterface reads the runtime, genesis hash and era block hash
+    through RPC requests when it encodes and signs an extrinsic. These are
+    all known from the context, so signing runs the library's own encoding
+    without a connection. Any other request fails.
+    """
+
+    def __init__(self, context: Dict[str, Any]):
+        self.context = context
+        self.checkpoint = context["checkpoint"]
+
+    def __call__(self, method, params=None, result_handler=None):
+        params = params or []
+        checkpoint_hash = self.checkpoint["hash"]
+        if method == "rpc_methods":
+            result = {"methods": ["chain_getHead", "state_getRuntimeVersion"]}
+        elif method == "system_chain":
+            result = self.context["chain"]
+        elif method == "chain_getHead":
+            result = checkpoint_hash
+        elif method == "chain_getHeader" and params[:1] in ([], [checkpoint_hash]):
+            # The context holds a single runtime, so the checkpoint is
+            # reported without a parent to be used as the runtime block
+            result = {
+                "number": hex(self.checkpoint["number"]),
+                "parentHash": _EMPTY_HASH,
+            }
+        elif method == "chain_getBlockHash" and params[:1] == [0]:
+            result = self.context["genesis_hash"]
+        elif method == "chain_getBlockHash" and params[:1] == [
+            self.checkpoint["number"]
+        ]:
+            result = checkpoint_hash
+        elif method == "state_getRuntimeVersion":
+            result = {
+                "specVersion": self.context["spec_version"],
+                "transactionVersion": self.context["transaction_version"],
+            }
+        elif method == "state_getMetadata":
+            result = self.context["metadata"]
+        else:
+            return {"error": {"message": f"{method} is not available offline"}}
+        return {"jsonrpc": "2.0", "result": result}
+
+
+def offline_substrate(context: Dict[str, Any], runtime_from=None) -> SubstrateInterface:
+    """
+    Create a SubstrateInterface that signs from a chain context without a node.
+
+    Args:
+        context: Chain context from read_chain_context
+        runtime_from: Connected SubstrateInterface whose decoded metadata and
+            type registry are shared, instead of decoding the context's
+            metadata. Its runtime must be the one the context was read at.
+
+    Raises:
+        ValueError: If the context has no metadata and no runtime is shared
+    """
+    if runtime_from is None and not context.get("metadata"):
+        raise ValueError("Payload context has no metadata to sign with")
+
+    substrate = SubstrateInterface(
+        websocket=_OfflineSocket(),
+        ss58_format=context.get("ss58_format"),
+        auto_discover=False,
+    )
+    substrate.rpc_request = OfflineRPC(context)
+    if runtime_from is not None:
+        # Runtime lookups then find the version already set and stop there
+        substrate.runtime_config = runtime_from.runtime_config
+        substrate.metadata = runtime_from.metadata
+        substrate.runtime_version = context["spec_version"]
+        substrate.transaction_version = context["transaction_version"]
+        return substrate
+
+    substrate.config["auto_discover"] = True
+    substrate.init_runtime()
+    return substrate
+
+
+def sign_payload(
+    substrate,
+    context: Dict[str, Any],
+    payload: Dict[str, Any],
+    keypair,
+    nonce: int,
+    era_period: Optional[int] = DEFAULT_ERA_PERIOD,
+) -> Dict[str, Any]:
+    """
+    Sign one call payload with an explicit nonce.
+
+    Args:
+        substrate: SubstrateInterface from offline_substrate, or a connected one
+        context: Chain context the payload was built with
+        payload: Call payload from call_payload
+        keypair: Signing keypair
+        nonce: Account nonce of the extrinsic
+        era_period: Mortal era length from the checkpoint block, or None for
+            an immortal extrinsic
+
+    Returns:
+        Signed extrinsic record with the hex encoding and extrinsic hash
+    """
+    from scalecodec.base import ScaleBytes
+
+    call = substrate.runtime_config.create_scale_object(
+        "Call", data=ScaleBytes(payload["call"]), metadata=substrate.metadata
+    )
+    call.decode()
+
+    era = None
+    if era_period:
+        era = {"period": era_period, "current": context["checkpoint"]["number"]}
+
+    extrinsic = substrate.create_signed_extrinsic(
+        call=call, keypair=keypair, era=era, nonce=nonce
+    )
+    return {
+        "type": EXTRINSIC,
+        "call_module": payload["call_module"],
+        "call_function": payload["call_function"],
+        "signer": keypair.ss58_address,
+        "nonce": nonce,
+        "era_period": era_period,
+        "extrinsic": str(extrinsic.data),
+        "extrinsic_hash": f"0x{extrinsic.extrinsic_hash.hex()}",
+    }
+
+
+def read_records(lines: Iterable[str], source: str) -> Iterator[Dict[str, Any]]:
+    """
+    Read NDJSON payload or extrinsic records lazily.
+
+    Raises:
+        ValueError: If a line is not a JSON object
+    """
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{source}:{line_number}: invalid JSON: {e.msg}")
+        if not isinstance(record, dict):
+            raise ValueError(f"{source}:{line_number}: expected a JSON object")
+        yield record
+
+
+def pipeline_requests(
+    substrate, requests: Iterable[Tuple[Any, str, list]], window: int
+) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+    """
+    Send RPC requests with up to ``window`` of them in flight.
+
+    Requests are written on the connection's websocket without waiting for
+    the previous response, so throughput is bound by the node rather than
+    the round trip. Nothing is retried. The caller must hold the
+    connection's RPC lock while the responses are consumed.
+
+    Args:
+        substrate: Connected SubstrateInterface
+        requests: ``(tag, method, params)`` tuples, consumed lazily
+        window: Requests awaiting a response at once
+
+    Yields:
+        ``(tag, response)`` in the order the node answers
+    """
+    websocket = substrate.websocket
+    pending: Dict[int, Any] = {}
+    requests = iter(requests)
+    exhausted = False
+
+    while pending or not exhausted:
+        while not exhausted and len(pending) < window:
+            request = next(requests, None)
+            if request is None:
+                exhausted = True
+                break
+            tag, method, params = request
+            request_id = substrate.request_id
+            substrate.request_id += 1
+            websocket.send(
+                json.dumps(
+                    {
+                        "jsonrpc": "2.0",
+                        "method": method,
+                        "params": params,
+                        "id": request_id,
+                    }
+                )
+            )
+            pending[request_id] = tag
+
+        if not pending:
+            break
+
+        message = json.loads(websocket.recv())
+        if message.get("id") not in pending:
+            logger.debug(f"Ignoring unrelated message in pipeline: {message}")
+            continue
+        yield pending.pop(message["id"]), message
+
+
+def rpc_error_message(error: Dict[str, Any]) -> str:
+    """Format an RPC error, with the reason a node carries in its data."""
+    reason = error.get("message", str(error))
+    if error.get("data"):
+        reason = f"{reason}: {error['data']}"
+    return reason
+
+
+def submit_pipelined(
+    substrate,
+    extrinsics: Iterable[Dict[str, Any]],
+    window: int = DEFAULT_SUBMIT_WINDOW,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Submit signed extrinsics with up to ``window`` requests in flight.
+
+    Each extrinsic is sent with author_submitExtrinsic through
+    pipeline_requests, so submissions are never retried. The caller must
+    hold the connection's RPC lock while the results are consumed.
+
+    Yields:
+        The extrinsic record with ``success`` and the node's ``result`` hash
+        or error ``message``, in the order the node answers
+    """
+    requests = (
+        (record, "author_submitExtrinsic", [record["extrinsic"]])
+        for record in extrinsics
+    )
+    for record, message in pipeline_requests(substrate, requests, window):
+        if "error" in message:
+            reason = rpc_error_message(message["error"])
+            yield {**record, "success": False, "message": reason}
+        else:
+            yield {**record, "success": True, "result": message.get("result")}
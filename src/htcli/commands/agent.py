@@ -0,0 +1,187 @@
+"""
+Key agent commands.
+
+Start an agent that keeps unlocked keys in memory, and add keys to it, so
+write commands sign through it without asking for passwords.
+"""
+
+import signal
+import sys
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+
+from ..utils.agent import (
+    AGENT_SOCKET_ENV,
+    DEFAULT_KEY_TTL,
+    AgentClient,
+    KeyAgent,
+    agent_socket_path,
+)
+from ..utils.formatting import format_table, print_error, print_info, print_success
+from ..utils.password import get_secure_password
+
+app = typer.Typer(name="agent", help="Keep unlocked keys in a key agent")
+console = Console()
+
+
+def _client() -> AgentClient:
+    path = agent_socket_path()
+    if not path.exists():
+        print_error(
+            f"No key agent is running on {path}; start one with htcli agent start"
+        )
+        raise typer.Exit(1)
+    return AgentClient(path)
+
+
+@app.command()
+def start(
+    ttl: int = typer.Option(
+        DEFAULT_KEY_TTL,
+        "--ttl",
+        help="Seconds keys are held when added without --ttl (0 = until removed)",
+    ),
+    socket_path: Optional[Path] = typer.Option(
+        None,
+        "--socket",
+        help=f"Socket path (default: ${AGENT_SOCKET_ENV} or ~/.htcli/agent.sock)",
+    ),
+):
+    """Run the key agent in the foreground until interrupted."""
+    if ttl < 0:
+        print_error("--ttl must not be negative")
+        raise typer.Exit(1)
+
+    agent = KeyAgent(socket_path, default_ttl=ttl)
+    try:
+        agent.bind()
+    except Exception as e:
+        print_error(f"Failed to start key agent: {str(e)}")
+        raise typer.Exit(1)
+
+    print_success(f"Key agent listening on {agent.path}")
+    if agent.path != agent_socket_path():
+        print_info(
+            f"Point commands at it with: export {AGENT_SOCKET_ENV}={agent.path}"
+        )
+    print_info("Add keys with: htcli agent add --key-name <name>")
+    print_info("Ctrl-C stops the agent and forgets every key.")
+
+    # Exit through serve_forever's cleanup, which forgets keys and removes
+    # the socket
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        agent.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print_info("Key agent stopped; all keys forgotten.")
+
+
+@app.command()
+def add(
+    key_name: str = typer.Option(..., "--key-name", "-k", help="Key to unlock"),
+    ttl: Optional[int] = typer.Option(
+        None,
+        "--ttl",
+        help="Seconds to hold the key (0 = until removed; default: the agent's)",
+    ),
+):
+    """Unlock a key once and hand it to the key agent."""
+    if ttl is not None and ttl < 0:
+        print_error("--ttl must not be negative")
+        raise typer.Exit(1)
+
+    client = _client()
+    from ..utils.crypto import load_keypair
+
+    try:
+        password = get_secure_password(
+            key_name,
+            prompt_message="Enter password to unlock keypair for the key agent",
+            allow_default=True,
+            use_agent=False,
+        )
+        keypair = load_keypair(key_name, password, use_agent=False)
+        client.add(key_name, keypair, ttl)
+    except Exception as e:
+        print_error(f"Failed to add key {key_name}: {str(e)}")
+        raise typer.Exit(1)
+    finally:
+        client.close()
+
+    print_success(f"Key {key_name} ({keypair.ss58_address}) added to the key agent")
+
+
+@app.command("list")
+def list_keys(
+    format_type: str = typer.Option(
+        "table", "--format", "-f", help="Output format (table/json)"
+    ),
+):
+    """List the keys the key agent holds."""
+    client = _client()
+    try:
+        keys = client.list()
+    except Exception as e:
+        print_error(f"Failed to list agent keys: {str(e)}")
+        raise typer.Exit(1)
+    finally:
+        client.close()
+
+    if not keys:
+        console.print("The key agent holds no keys.")
+        return
+
+    if format_type == "json":
+        console.print_json(data=keys)
+    else:
+        rows = [
+            [
+                key["name"],
+                key["key_type"],
+                key["ss58_address"],
+                "never" if key["expires_in"] is None else f"{key['expires_in']}s",
+            ]
+            for key in keys
+        ]
+        console.print(
+            format_table(["Name", "Type", "Address", "Expires In"], rows, "Agent Keys")
+        )
+
+
+@app.command()
+def remove(
+    key_name: str = typer.Option(..., "--key-name", "-k", help="Key to forget"),
+):
+    """Make the key agent forget a key."""
+    client = _client()
+    try:
+        removed = client.remove(key_name)
+    except Exception as e:
+        print_error(f"Failed to remove key {key_name}: {str(e)}")
+        raise typer.Exit(1)
+    finally:
+        client.close()
+
+    if not removed:
+        print_error(f"The key agent does not hold {key_name}")
+        raise typer.Exit(1)
+    print_success(f"Key {key_name} removed from the key agent")
+
+
+@app.command()
+def lock():
+    """Make the key agent forget every key."""
+    client = _client()
+    try:
+        removed = client.remove_all()
+    except Exception as e:
+        print_error(f"Failed to lock the key agent: {str(e)}")
+        raise typer.Exit(1)
+    finally:
+        client.close()
+
+    print_success(f"Key agent locked; {removed} keys forgotten")
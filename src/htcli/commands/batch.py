@@ -0,0 +1,101 @@
+"""
+Batch Commands
+
+Runs many subnet, node, stake and chain operations in a single process with
+one shared connection and one unlock per key.
+"""
+
+import sys
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from ..client import HypertensorClient
+from ..dependencies import get_client, get_config
+from ..utils.batch import BatchRunner, load_operations
+from ..utils.formatting import format_balance
+from ..utils.streaming import StreamWriter, open_stream
+
+app = typer.Typer(name="batch", help="Run many operations in one process")
+
+
+@app.command()
+def run(
+    ops_file: Optional[Path] = typer.Argument(
+        None,
+        help="Operations file (.yaml/.yml or NDJSON); NDJSON is read from stdin "
+        "when omitted or '-'",
+    ),
+    parallel_reads: int = typer.Option(
+        1,
+        "--parallel-reads",
+        "-p",
+        help="Worker connections for read-only operations (1 = sequential)",
+    ),
+    fail_fast: bool = typer.Option(
+        False, "--fail-fast", help="Stop at the first failed operation"
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Write NDJSON results to a file"
+    ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Report each signed operation's fee and expected success "
+        "without submitting anything",
+    ),
+):
+    """Run a list of operations and report one NDJSON result per operation."""
+    if parallel_reads < 1:
+        typer.echo("--parallel-reads must be at least 1", err=True)
+        raise typer.Exit(1)
+
+    try:
+        if ops_file is None or str(ops_file) == "-":
+            ops = load_operations(stream=sys.stdin)
+        else:
+            ops = load_operations(ops_file)
+    except Exception as e:
+        typer.echo(f"Failed to load operations: {str(e)}", err=True)
+        raise typer.Exit(1)
+
+    client = get_client()
+    runner = BatchRunner(
+        client,
+        parallel_reads=parallel_reads,
+        client_factory=lambda: HypertensorClient(get_config()),
+        signing_context=True,
+    )
+
+    failed = fee = 0
+    try:
+        runner.unlock_keys(ops)
+        with open_stream(output) as stream:
+            writer = StreamWriter(stream)
+            if dry_run:
+                for result in runner.dry_run(ops):
+                    failed += result["success"] is False
+                    fee += result.get("fee") or 0
+                    writer.write(result)
+            else:
+                for result in runner.run(ops, fail_fast=fail_fast):
+                    failed += not result["success"]
+                    writer.write(result)
+    except Exception as e:
+        typer.echo(f"Batch run failed: {str(e)}", err=True)
+        raise typer.Exit(1)
+
+    if dry_run:
+        typer.echo(
+            f"{writer.count} signed operations dry-run, {failed} would fail, "
+            f"total fee {format_balance(fee)}",
+            err=True,
+        )
+    else:
+        typer.echo(
+            f"{writer.count} of {len(ops)} operations run, {failed} failed",
+            err=True,
+        )
+    if failed:
+        raise typer.Exit(1)
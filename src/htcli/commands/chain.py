@@ -2,15 +2,18 @@
 Flattened chain commands - 3-level hierarchy.
 """
 
+from pathlib import Path
 from typing import Optional
 
 import typer
 from rich.console import Console
+from rich.table import Table
 
 from ..dependencies import get_client
-from ..utils.formatting import (format_account_info, format_epoch_info,
-                                format_network_stats, format_table,
-                                print_error)
+from ..utils.formatting import (format_account_info, format_balance,
+                                format_epoch_info, format_network_stats,
+                                format_table, print_error)
+from ..utils.streaming import is_streaming_format, stream_rows
 from ..utils.validation import (validate_address, validate_block_number,
                                 validate_limit)
 
@@ -96,14 +99,107 @@ def account(
         raise typer.Exit(1)
 
 
+def _read_addresses_file(path: Path) -> list:
+    """Read one address per line, ignoring blank lines and # comments."""
+    addresses = []
+    with open(path, "r") as f:
+        for line in f:
+            address = line.split("#", 1)[0].strip()
+            if address:
+                addresses.append(address)
+    return addresses
+
+
 @app.command()
 def balance(
-    address: str = typer.Option(..., "--address", "-a", help="Account address"),
+    address: Optional[str] = typer.Option(
+        None, "--address", "-a", help="Account address"
+    ),
+    addresses_file: Optional[Path] = typer.Option(
+        None, "--addresses-file", help="File with one address per line"
+    ),
+    wallet_keys: bool = typer.Option(
+        False, "--wallet-keys", help="Include every local wallet key"
+    ),
     format_type: str = typer.Option(
-        "table", "--format", "-f", help="Output format (table/json)"
+        "table", "--format", "-f", help="Output format (table/json/ndjson/csv)"
     ),
 ):
-    """Get account balance."""
+    """Get account balance, or balances of many accounts in one batched read."""
+    if addresses_file is None and not wallet_keys:
+        if address is None:
+            print_error("Provide --address, --addresses-file or --wallet-keys.")
+            raise typer.Exit(1)
+        _show_balance(address, format_type)
+        return
+
+    # Collect addresses, labelling wallet keys with their names
+    addresses = [address] if address else []
+    names = {}
+    try:
+        if addresses_file is not None:
+            addresses.extend(_read_addresses_file(addresses_file))
+        if wallet_keys:
+            from ..utils.crypto import list_keys
+
+            for key in list_keys():
+                addresses.append(key["ss58_address"])
+                names.setdefault(key["ss58_address"], key["name"])
+    except Exception as e:
+        print_error(f"Failed to read addresses: {str(e)}")
+        raise typer.Exit(1)
+
+    if not addresses:
+        print_error("No addresses to look up.")
+        raise typer.Exit(1)
+
+    client = get_client()
+    try:
+        response = client.get_balances(addresses)
+    except Exception as e:
+        print_error(f"Failed to get balances: {str(e)}")
+        raise typer.Exit(1)
+
+    accounts = response.data["accounts"]
+    for account in accounts:
+        account["name"] = names.get(account["address"])
+
+    if is_streaming_format(format_type):
+        stream_rows(accounts, format_type)
+        return
+    if format_type == "json":
+        console.print_json(data=response.data)
+        return
+
+    table = Table(title=f"Balances of {len(accounts)} accounts")
+    table.add_column("Address", style="cyan")
+    table.add_column("Name", style="white")
+    table.add_column("Free", style="green", justify="right")
+    table.add_column("Reserved", style="yellow", justify="right")
+    table.add_column("Nonce", justify="right")
+
+    for account in accounts:
+        if "error" in account:
+            error = f"[red]{account['error']}[/red]"
+            table.add_row(account["address"], account["name"] or "", error, "", "")
+            continue
+        table.add_row(
+            account["address"],
+            account["name"] or "",
+            format_balance(account["free"]),
+            format_balance(account["reserved"]),
+            str(account["nonce"]),
+        )
+
+    console.print(table)
+    console.print(
+        f"Total free: {format_balance(response.data['total_free'])}, "
+        f"reserved: {format_balance(response.data['total_reserved'])}"
+    )
+
+
+def _show_balance(address: str, format_type: str):
+    """Show the balance of a single account."""
     client = get_client()
 
     # Validate inputs
@@ -60,6 +60,9 @@ network:
   # Number of retry attempts for failed connections
   retry_attempts: {config.network.retry_attempts}
 
+  # Cache of chain state read with --at-block at finalized blocks
+  archive_path: "{config.network.archive_path}"
+
 # Output Configuration
 # Settings for CLI output formatting and display
 output:
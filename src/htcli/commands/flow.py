@@ -5,12 +5,15 @@ Provides access to automated workflows that combine multiple CLI operations
 into streamlined, user-friendly processes.
 """
 
+from typing import Optional
+
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
 from ..flows import AVAILABLE_FLOWS
+from ..flows.checkpoint import load_checkpoint
 from ..utils.formatting import print_error, print_info, print_success
 
 app = typer.Typer(name="flow", help="Automated workflows for common tasks")
@@ -113,6 +116,16 @@ def run(
     skip_confirmation: bool = typer.Option(
         False, "--yes", "-y", help="Skip confirmation prompts where possible"
     ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        "-w",
+        help="Number of independent steps to run in parallel; steps run together "
+        "must not touch the same context keys",
+    ),
+    resume: Optional[str] = typer.Option(
+        None, "--resume", help="Resume a failed flow from its checkpoint ID"
+    ),
 ):
     """Execute an automated flow"""
     if flow_name not in AVAILABLE_FLOWS:
@@ -120,11 +133,37 @@ def run(
         print_error(f"Flow '{flow_name}' not found. Available flows: {available}")
         raise typer.Exit(1)
 
+    if workers < 1:
+        print_error("Workers must be at least 1")
+        raise typer.Exit(1)
+
     flow_class = AVAILABLE_FLOWS[flow_name]
 
+    checkpoint = None
+    if resume:
+        try:
+            checkpoint = load_checkpoint(resume)
+        except Exception as e:
+            print_error(f"Failed to load checkpoint '{resume}': {str(e)}")
+            raise typer.Exit(1)
+
+        if checkpoint is None:
+            print_error(f"No checkpoint found for flow ID '{resume}'")
+            raise typer.Exit(1)
+        if checkpoint.get("flow") != flow_class.__name__:
+            print_error(
+                f"Checkpoint '{resume}' belongs to {checkpoint.get('flow')}, "
+                f"not {flow_name}"
+            )
+            raise typer.Exit(1)
+
     try:
         # Create and execute flow
-        flow_instance = flow_class(console=console)
+        flow_instance = flow_class(
+            console=console, max_workers=workers, interactive=not skip_confirmation
+        )
+        if checkpoint:
+            flow_instance.resume(checkpoint)
 
         # Add skip confirmation to context if specified
         if skip_confirmation:
@@ -159,6 +198,12 @@ def run(
             print_error(f"Flow '{flow_name}' failed: {result.error_message}")
             if result.failed_step:
                 print_error(f"Failed at step: {result.failed_step}")
+
+            flow_id = flow_instance.get_from_context("flow_id")
+            if flow_id and result.completed_steps:
+                print_info(
+                    f"Resume with: htcli flow run {flow_name} --resume {flow_id}"
+                )
             raise typer.Exit(1)
 
     except KeyboardInterrupt:
@@ -3,6 +3,7 @@ Node management commands for the Hypertensor CLI.
 All commands follow the format: htcli node <command> [switches]
 """
 
+from pathlib import Path
 from typing import Optional
 
 import typer
@@ -10,9 +11,12 @@ from rich.console import Console
 from rich.panel import Panel
 
 from ..dependencies import get_client
-from ..utils.formatting import (format_balance, format_node_list, print_error,
-                                print_info, print_success)
+from ..utils.formatting import (format_balance, format_dry_run,
+                                format_node_list, print_error, print_info,
+                                print_success)
 from ..utils.password import get_secure_password
+from ..utils.streaming import (StreamWriter, is_streaming_format, open_stream,
+                               stream_rows)
 from ..utils.validation import (validate_address, validate_amount,
                                 validate_delegate_reward_rate,
                                 validate_node_id, validate_peer_id,
@@ -21,6 +25,24 @@ from ..utils.validation import (validate_address, validate_amount,
 app = typer.Typer(name="node", help="Node management operations")
 console = Console()
 
+# Display color and rank of each node classification
+CLASSIFICATION_COLORS = {
+    "Registered": "yellow",
+    "Idle": "blue",
+    "Included": "green",
+    "Validator": "red",
+}
+CLASSIFICATION_RANK = {name: rank for rank, name in enumerate(CLASSIFICATION_COLORS)}
+
+STATUS_SORT_KEYS = (
+    "node_id",
+    "classification",
+    "stake",
+    "attestation_ratio",
+    "penalties",
+    "start_epoch",
+)
+
 
 def show_comprehensive_guidance(operation: str, details: dict):
     """Show comprehensive guidance for node operations."""
@@ -486,9 +508,23 @@ def activate(
 @app.command()
 def status(
     subnet_id: int = typer.Option(..., "--subnet-id", "-s", help="Subnet ID"),
-    node_id: int = typer.Option(..., "--node-id", "-n", help="Node ID to check"),
+    node_id: Optional[int] = typer.Option(
+        None, "--node-id", "-n", help="Node ID to check"
+    ),
+    all_nodes: bool = typer.Option(
+        False, "--all", "-a", help="Show a summary of every node in the subnet"
+    ),
+    sort_by: str = typer.Option(
+        "node_id",
+        "--sort-by",
+        help="Sort --all results by "
+        "node_id/classification/stake/attestation_ratio/penalties/start_epoch",
+    ),
+    descending: bool = typer.Option(
+        False, "--desc", help="Sort --all results in descending order"
+    ),
     format_type: str = typer.Option(
-        "table", "--format", "-f", help="Output format (table/json)"
+        "table", "--format", "-f", help="Output format (table/json/ndjson/csv)"
     ),
     show_guidance: bool = typer.Option(
         True, "--guidance/--no-guidance", help="Show comprehensive guidance"
@@ -497,6 +533,14 @@ def status(
     """Show detailed node status and classification information."""
     client = get_client()
 
+    if all_nodes == (node_id is not None):
+        print_error("❌ Specify either --node-id or --all.")
+        raise typer.Exit(1)
+
+    if all_nodes:
+        _show_all_node_status(client, subnet_id, sort_by, descending, format_type)
+        return
+
     # Show comprehensive guidance
     if show_guidance:
         from rich.panel import Panel
@@ -554,16 +598,7 @@ def status(
 
                 # Determine classification color
                 classification = node_data.get("classification", "Unknown")
-                if classification == "Registered":
-                    class_color = "yellow"
-                elif classification == "Idle":
-                    class_color = "blue"
-                elif classification == "Included":
-                    class_color = "green"
-                elif classification == "Validator":
-                    class_color = "red"
-                else:
-                    class_color = "white"
+                class_color = CLASSIFICATION_COLORS.get(classification, "white")
 
                 # Create status panel
                 status_panel = Panel(
@@ -701,6 +736,84 @@ def status(
         raise typer.Exit(1)
 
 
+def _show_all_node_status(
+    client, subnet_id: int, sort_by: str, descending: bool, format_type: str
+):
+    """Print the status of every node in a subnet as one summary."""
+    from rich.table import Table
+
+    if not validate_subnet_id(subnet_id):
+        print_error("❌ Invalid subnet ID. Must be a positive integer.")
+        raise typer.Exit(1)
+
+    if sort_by not in STATUS_SORT_KEYS:
+        print_error(f"❌ Invalid sort key. Choose from: {', '.join(STATUS_SORT_KEYS)}")
+        raise typer.Exit(1)
+
+    try:
+        response = client.get_subnet_nodes_status(subnet_id)
+    except Exception as e:
+        print_error(f"❌ Failed to get node status: {str(e)}")
+        raise typer.Exit(1)
+
+    if not response.success:
+        print_error(f"❌ Failed to get node status: {response.message}")
+        raise typer.Exit(1)
+
+    def sort_key(node):
+        if sort_by == "classification":
+            return CLASSIFICATION_RANK.get(node["classification"], -1)
+        return node[sort_by]
+
+    nodes = sorted(response.data["nodes"], key=sort_key, reverse=descending)
+
+    if is_streaming_format(format_type):
+        stream_rows(nodes, format_type)
+        return
+    if format_type == "json":
+        console.print_json(
+            data={"current_epoch": response.data["current_epoch"], "nodes": nodes}
+        )
+        return
+
+    table = Table(
+        title=f"[bold cyan]Subnet {subnet_id} Node Status[/bold cyan] "
+        f"(epoch {response.data['current_epoch']})"
+    )
+    table.add_column("Node ID", style="cyan", justify="right")
+    table.add_column("Classification")
+    table.add_column("Hotkey", style="white")
+    table.add_column("Stake", style="green", justify="right")
+    table.add_column("Attestation", justify="right")
+    table.add_column("Penalties", justify="right")
+    table.add_column("Start Epoch", style="yellow", justify="right")
+
+    for node in nodes:
+        color = CLASSIFICATION_COLORS.get(node["classification"], "white")
+        table.add_row(
+            str(node["node_id"]),
+            f"[{color}]{node['classification']}[/{color}]",
+            node["hotkey"],
+            format_balance(node["stake"]),
+            f"{node['attestation_ratio']}%",
+            str(node["penalties"]),
+            str(node["start_epoch"]),
+        )
+
+    console.print(table)
+
+    counts = {}
+    for node in nodes:
+        counts[node["classification"]] = counts.get(node["classification"], 0) + 1
+    summary = ", ".join(
+        f"{count} {name}"
+        for name, count in sorted(
+            counts.items(), key=lambda item: CLASSIFICATION_RANK.get(item[0], -1)
+        )
+    )
+    console.print(f"{len(nodes)} nodes" + (f": {summary}" if summary else ""))
+
+
 @app.command()
 def remove(
     subnet_id: int = typer.Option(..., "--subnet-id", "-s", help="Subnet ID"),
@@ -717,12 +830,17 @@ def remove(
     show_guidance: bool = typer.Option(
         True, "--guidance/--no-guidance", help="Show comprehensive guidance"
     ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Show the fee and whether the removal would succeed, without submitting",
+    ),
 ):
     """Remove a node from a subnet with comprehensive guidance and stake management."""
     client = get_client()
 
     # Show comprehensive guidance
-    if show_guidance:
+    if show_guidance and not dry_run:
         from rich.panel import Panel
 
         guidance_panel = Panel(
@@ -853,6 +971,10 @@ def remove(
         )
         raise typer.Exit(1)
 
+    if dry_run:
+        _dry_run_remove(client, subnet_id, node_id, remove_stake, key_name)
+        return
+
     try:
         print_info(f"🔄 Removing node {node_id} from subnet {subnet_id}...")
 
@@ -870,7 +992,7 @@ def remove(
 
         # Remove the node
         response = client.remove_subnet_node(
-            subnet_id=subnet_id, node_id=node_id, keypair=keypair
+            subnet_id=subnet_id, subnet_node_id=node_id, keypair=keypair
         )
 
         if response.success:
@@ -1063,6 +1185,43 @@ def remove(
         raise typer.Exit(1)
 
 
+def _dry_run_remove(
+    client, subnet_id: int, node_id: int, remove_stake: bool, key_name: str
+):
+    """Dry-run a node removal and its stake removal without submitting them."""
+    from ..utils.crypto import load_keypair
+
+    try:
+        password = get_secure_password(
+            key_name,
+            prompt_message="Enter password to unlock keypair for the dry run",
+            allow_default=True,
+        )
+        keypair = load_keypair(key_name, password)
+
+        response = client.remove_subnet_node(
+            subnet_id=subnet_id, subnet_node_id=node_id
+        )
+        calls = [response.data["call_data"]]
+        if remove_stake:
+            stake_response = client.remove_node_stake_automatically(
+                subnet_id=subnet_id, node_id=node_id, address=keypair.ss58_address
+            )
+            if "call_data" in stake_response.data:
+                calls.append(stake_response.data["call_data"])
+            else:
+                print_info(stake_response.message)
+
+        results = client.dry_run(calls, keypair)
+    except Exception as e:
+        print_error(f"❌ Failed to dry-run node removal: {str(e)}")
+        raise typer.Exit(1)
+
+    format_dry_run(results)
+    if any(result["success"] is False for result in results):
+        raise typer.Exit(1)
+
+
 @app.command()
 def deactivate(
     subnet_id: int = typer.Option(..., "--subnet-id", "-s", help="Subnet ID"),
@@ -2061,7 +2220,10 @@ def update_hotkey(
 def list(
     subnet_id: int = typer.Option(..., "--subnet-id", "-s", help="Subnet ID"),
     format_type: str = typer.Option(
-        "table", "--format", "-f", help="Output format (table/json)"
+        "table", "--format", "-f", help="Output format (table/json/ndjson/csv)"
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Write ndjson/csv output to a file"
     ),
     show_guidance: bool = typer.Option(
         False, "--guidance", help="Show comprehensive guidance"
@@ -2070,24 +2232,40 @@ def list(
     """List all nodes in a subnet with comprehensive guidance."""
     client = get_client()
 
+    # Validate inputs
+    if not validate_subnet_id(subnet_id):
+        print_error("❌ Invalid subnet ID. Must be a positive integer.")
+        raise typer.Exit(1)
+
+    # Streaming formats write rows as they are read, with no Rich output
+    if is_streaming_format(format_type):
+        try:
+            stream_rows(
+                (
+                    record.to_row()
+                    for record in client.iter_subnet_node_records(subnet_id)
+                ),
+                format_type,
+                output,
+            )
+        except Exception as e:
+            typer.echo(f"Failed to list subnet nodes: {str(e)}", err=True)
+            raise typer.Exit(1)
+        return
+
     # Show comprehensive guidance if requested
     if show_guidance:
         show_comprehensive_guidance(
             "list", {"Subnet ID": subnet_id, "Output Format": format_type}
         )
 
-    # Validate inputs
-    if not validate_subnet_id(subnet_id):
-        print_error("❌ Invalid subnet ID. Must be a positive integer.")
-        raise typer.Exit(1)
-
     try:
         print_info(f"🔄 Retrieving nodes for subnet {subnet_id}...")
 
         response = client.get_subnet_nodes(subnet_id)
 
         if response.success:
-            nodes = response.data
+            nodes = [record.to_row() for record in response.data["nodes"]]
 
             if not nodes:
                 console.print(
@@ -2104,7 +2282,7 @@ def list(
             if format_type == "json":
                 console.print_json(data=nodes)
             else:
-                format_node_list(nodes, subnet_id)
+                format_node_list(nodes)
 
             console.print(f"\n✅ Found {len(nodes)} node(s) in subnet {subnet_id}")
         else:
@@ -2114,3 +2292,79 @@ def list(
     except Exception as e:
         print_error(f"❌ Failed to list subnet nodes: {str(e)}")
         raise typer.Exit(1)
+
+
+@app.command()
+def monitor(
+    manifest: Path = typer.Option(
+        ..., "--manifest", "-m", help="YAML manifest of nodes to monitor"
+    ),
+    interval_blocks: int = typer.Option(
+        1, "--interval-blocks", "-i", help="Blocks between polls"
+    ),
+    min_attestation_drop: int = typer.Option(
+        1,
+        "--min-attestation-drop",
+        help="Attestation ratio drop (percentage points) that triggers an event",
+    ),
+    iterations: int = typer.Option(
+        0, "--iterations", help="Stop after this many polls (0 = run until stopped)"
+    ),
+    format_type: str = typer.Option(
+        "ndjson", "--format", "-f", help="Output format (ndjson/text)"
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Write ndjson events to a file"
+    ),
+):
+    """Watch a fleet of nodes and report status transitions as they happen."""
+    from ..utils.monitor import NodeMonitor, load_manifest, resolve_targets
+
+    if interval_blocks < 1:
+        print_error("❌ --interval-blocks must be at least 1.")
+        raise typer.Exit(1)
+
+    if format_type not in ("ndjson", "text"):
+        print_error("❌ Invalid format. Choose ndjson or text.")
+        raise typer.Exit(1)
+
+    client = get_client()
+
+    # Pinned reads never see a new head, so there would be nothing to watch
+    if client.config.network.at_block is not None:
+        print_error("❌ node monitor follows the chain head; drop --at-block.")
+        raise typer.Exit(1)
+
+    try:
+        entries = load_manifest(manifest)
+        targets = resolve_targets(client, entries)
+    except Exception as e:
+        print_error(f"❌ Failed to load manifest: {str(e)}")
+        raise typer.Exit(1)
+
+    if not targets:
+        print_error("❌ The manifest does not list any nodes.")
+        raise typer.Exit(1)
+
+    node_monitor = NodeMonitor(client, targets, min_attestation_drop, entries)
+    typer.echo(
+        f"Monitoring {len(targets)} nodes every {interval_blocks} blocks", err=True
+    )
+
+    try:
+        with open_stream(output) as stream:
+            writer = StreamWriter(stream)
+            for event in node_monitor.watch(interval_blocks, iterations):
+                if format_type == "ndjson":
+                    writer.write(event)
+                else:
+                    label = event["name"] or f"{event['subnet_id']}/{event['node_id']}"
+                    console.print(
+                        f"[dim]#{event['block_number']}[/dim] [cyan]{label}[/cyan] "
+                        f"{event['event']}: {event['from']} → {event['to']}"
+                    )
+    except KeyboardInterrupt:
+        typer.echo("Monitoring stopped", err=True)
+    except Exception as e:
+        print_error(f"❌ Monitoring failed: {str(e)}")
+        raise typer.Exit(1)
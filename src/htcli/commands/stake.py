@@ -3,18 +3,23 @@ Staking management commands for the Hypertensor CLI.
 All commands follow the format: htcli stake <command> [switches]
 """
 
+from dataclasses import asdict
 from typing import Optional
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
+from rich.table import Table
 
 from ..dependencies import get_client, get_config
 from ..models.requests import StakeAddRequest
-from ..utils.formatting import (format_balance, print_error, print_info,
-                                print_success)
+from ..utils.allocation import (AllocationConstraints, diversified_subnet_cap,
+                                plan_allocations)
+from ..utils.formatting import (format_balance, format_dry_run, print_error,
+                                print_info, print_success)
 from ..utils.ownership import get_user_addresses
 from ..utils.password import get_secure_password
+from ..utils.scoring import CANDIDATE_POOL_FACTOR, scan_opportunities
 from ..utils.validation import (validate_address, validate_amount,
                                 validate_node_id, validate_subnet_id)
 
@@ -308,12 +313,17 @@ def remove(
     show_guidance: bool = typer.Option(
         True, "--guidance/--no-guidance", help="Show comprehensive guidance"
     ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Show the fee and whether the removal would succeed, without submitting",
+    ),
 ):
     """Remove stake from a node with comprehensive guidance."""
     client = get_client()
 
     # Show comprehensive guidance
-    if show_guidance:
+    if show_guidance and not dry_run:
         guidance_panel = Panel(
             f"[bold cyan]📤 Remove Stake from Node Guide[/bold cyan]\n\n"
             f"This will remove stake from node {node_id} in subnet {subnet_id}:\n\n"
@@ -376,6 +386,10 @@ def remove(
         )
         raise typer.Exit(1)
 
+    if dry_run:
+        _dry_run_remove(client, subnet_id, node_id, key_name)
+        return
+
     try:
         print_info(f"🔄 Removing stake from node {node_id} in subnet {subnet_id}...")
 
@@ -495,6 +509,36 @@ def remove(
         raise typer.Exit(1)
 
 
+def _dry_run_remove(client, subnet_id: int, node_id: int, key_name: str):
+    """Dry-run removing all stake from a node without submitting it."""
+    from ..utils.crypto import load_keypair
+
+    try:
+        password = get_secure_password(
+            key_name,
+            prompt_message="Enter password to unlock keypair for the dry run",
+            allow_default=True,
+        )
+        keypair = load_keypair(key_name, password)
+
+        response = client.remove_node_stake_automatically(
+            subnet_id=subnet_id, node_id=node_id, address=keypair.ss58_address
+        )
+        if not response.success:
+            raise Exception(response.message)
+        if "call_data" not in response.data:
+            print_info(response.message)
+            return
+        results = client.dry_run([response.data["call_data"]], keypair)
+    except Exception as e:
+        print_error(f"❌ Failed to dry-run stake removal: {str(e)}")
+        raise typer.Exit(1)
+
+    format_dry_run(results)
+    if any(result["success"] is False for result in results):
+        raise typer.Exit(1)
+
+
 @app.command()
 def claim(
     hotkey: str = typer.Option(..., "--hotkey", "-h", help="Hotkey address"),
@@ -1870,6 +1914,7 @@ def info(
                         f"• [yellow]Total Node Stake[/yellow]: {data.get('node_delegate_stake', 0):,} TENSOR\n"
                         f"• [yellow]Reward Rate[/yellow]: {data.get('node_reward_rate', 0)}%\n"
                         f"• [yellow]Total Delegators[/yellow]: {data.get('total_delegators', 0)}\n"
+                        f"• [yellow]Largest Delegator[/yellow]: {data.get('delegators', {}).get('top_holder_percent', 0):.2f}% of shares\n"
                         f"• [yellow]Estimated Rewards[/yellow]: {data.get('estimated_rewards', 0):.2f} TENSOR\n\n"
                         f"[bold]Your Stake:[/bold]\n"
                         f"• [green]Your Shares[/green]: {data.get('user_node_shares', 0):,}\n"
@@ -1906,6 +1951,7 @@ def info(
                         f"• [yellow]Total Subnet Stake[/yellow]: {data.get('subnet_delegate_stake', 0):,} TENSOR\n"
                         f"• [yellow]Reward Rate[/yellow]: {data.get('subnet_reward_rate', 0)}%\n"
                         f"• [yellow]Total Delegators[/yellow]: {data.get('total_delegators', 0)}\n"
+                        f"• [yellow]Largest Delegator[/yellow]: {data.get('delegators', {}).get('top_holder_percent', 0):.2f}% of shares\n"
                         f"• [yellow]Estimated Rewards[/yellow]: {data.get('estimated_rewards', 0):.2f} TENSOR\n\n"
                         f"[bold]Your Stake:[/bold]\n"
                         f"• [green]Your Shares[/green]: {data.get('user_subnet_shares', 0):,}\n"
@@ -2073,3 +2119,168 @@ def list_addresses(
     except Exception as e:
         print_error(f"❌ Failed to list addresses: {str(e)}")
         raise typer.Exit(1)
+
+
+@app.command()
+def plan(
+    amount: int = typer.Option(
+        ..., "--amount", "-a", help="Total stake to allocate (in smallest units)"
+    ),
+    max_positions: int = typer.Option(
+        5, "--max-positions", "-m", help="Maximum number of staking positions"
+    ),
+    strategy: str = typer.Option(
+        "balanced",
+        "--strategy",
+        help="Portfolio strategy (conservative/balanced/aggressive)",
+    ),
+    min_stake: int = typer.Option(
+        0, "--min-stake", help="Minimum stake per position (in smallest units)"
+    ),
+    max_per_subnet: Optional[int] = typer.Option(
+        None,
+        "--max-per-subnet",
+        help="Maximum stake per subnet (in smallest units, default spreads evenly)",
+    ),
+    diversify: bool = typer.Option(
+        True, "--diversify/--no-diversify", help="Spread stake across subnets"
+    ),
+    include_new: bool = typer.Option(
+        False, "--include-new/--active-only", help="Include non-active subnets"
+    ),
+    format_type: str = typer.Option(
+        "table", "--format", "-f", help="Output format (table/json)"
+    ),
+):
+    """Plan a stake allocation across nodes without submitting anything."""
+    client = get_client()
+
+    if not validate_amount(amount):
+        print_error("❌ Invalid stake amount. Must be positive.")
+        raise typer.Exit(1)
+
+    if max_positions < 1:
+        print_error("❌ Maximum positions must be at least 1.")
+        raise typer.Exit(1)
+
+    if strategy not in ("conservative", "balanced", "aggressive"):
+        print_error("❌ Strategy must be conservative, balanced or aggressive.")
+        raise typer.Exit(1)
+
+    try:
+        print_info("🔄 Scoring staking opportunities...")
+
+        scorer = scan_opportunities(client)
+        mask = scorer.strategy_mask(strategy, include_new)
+        opportunities = scorer.to_opportunities(
+            scorer.top_k(max_positions * CANDIDATE_POOL_FACTOR, mask)
+        )
+
+        if max_per_subnet is None:
+            max_per_subnet = (
+                diversified_subnet_cap(amount, max_positions, opportunities)
+                if diversify
+                else 0
+            )
+
+        constraints = AllocationConstraints(
+            total_stake=amount,
+            max_positions=max_positions,
+            min_stake=max(min_stake, scorer.stake_limits.get("min_stake", 0)),
+            max_stake=scorer.stake_limits.get("max_stake", 0),
+            max_per_subnet=max_per_subnet,
+        )
+        allocation_plan = plan_allocations(opportunities, constraints)
+
+    except Exception as e:
+        print_error(f"❌ Failed to plan stake allocation: {str(e)}")
+        raise typer.Exit(1)
+
+    if format_type == "json":
+        console.print_json(data=asdict(allocation_plan))
+        return
+
+    if not allocation_plan.allocations:
+        print_error("❌ No allocation satisfies the given constraints.")
+        raise typer.Exit(1)
+
+    table = Table(title="Stake Allocation Plan")
+    table.add_column("Subnet ID", style="cyan")
+    table.add_column("Node ID", style="yellow")
+    table.add_column("Amount", style="green")
+    table.add_column("Percentage", style="blue")
+    table.add_column("Risk", style="red")
+    table.add_column("Reward Rate", style="magenta")
+
+    for allocation in allocation_plan.allocations:
+        table.add_row(
+            str(allocation["subnet_id"]),
+            str(allocation["node_id"]),
+            format_balance(allocation["amount"]),
+            f"{allocation['percentage']:.1f}%",
+            f"{allocation['risk_score']:.2f}",
+            f"{allocation['expected_reward'] * 100:.1f}%",
+        )
+
+    console.print(table)
+    console.print(
+        f"\nAllocated: {format_balance(allocation_plan.allocated)}"
+        f"\nUnallocated: {format_balance(allocation_plan.unallocated)}"
+        f"\nExpected reward: {format_balance(allocation_plan.expected_reward)}"
+    )
+
+
+@app.command()
+def delegators(
+    subnet_id: int = typer.Option(..., "--subnet-id", "-s", help="Subnet ID"),
+    node_id: Optional[int] = typer.Option(
+        None, "--node-id", "-n", help="Node ID (default: subnet delegators)"
+    ),
+    top: int = typer.Option(10, "--top", "-t", help="Number of largest holders"),
+    format_type: str = typer.Option(
+        "table", "--format", "-f", help="Output format (table/json)"
+    ),
+):
+    """Show delegator count, largest holders and share-size distribution."""
+    client = get_client()
+
+    if top < 0:
+        print_error("❌ --top cannot be negative.")
+        raise typer.Exit(1)
+
+    try:
+        stats = client.get_delegator_stats(subnet_id, node_id, top)
+    except Exception as e:
+        print_error(f"❌ Failed to get delegators: {str(e)}")
+        raise typer.Exit(1)
+
+    if format_type == "json":
+        console.print_json(data=stats)
+        return
+
+    target = f"subnet {subnet_id}"
+    if node_id is not None:
+        target = f"node {node_id} in {target}"
+    console.print(
+        f"Delegators of {target}: {stats['count']:,} holding "
+        f"{stats['total_shares']:,} shares"
+    )
+
+    holders = Table(title=f"Top {len(stats['top_holders'])} Holders")
+    holders.add_column("Account", style="cyan")
+    holders.add_column("Shares", style="green", justify="right")
+    holders.add_column("Share", style="yellow", justify="right")
+    for holder in stats["top_holders"]:
+        holders.add_row(
+            holder["account"],
+            f"{holder['shares']:,}",
+            f"{holder['share_percent']:.2f}%",
+        )
+    console.print(holders)
+
+    histogram = Table(title="Share Size Distribution")
+    histogram.add_column("Shares", style="cyan")
+    histogram.add_column("Delegators", style="green", justify="right")
+    for bucket in stats["histogram"]:
+        histogram.add_row(bucket["range"], str(bucket["count"]))
+    console.print(histogram)
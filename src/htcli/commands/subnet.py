@@ -2,18 +2,22 @@
 Flattened subnet commands - 3-level hierarchy.
 """
 
+from pathlib import Path
 from typing import Optional
 
 import typer
 from rich.console import Console
+from rich.table import Table
 
 from ..dependencies import get_client
 from ..models.requests import SubnetRegisterRequest
-from ..utils.formatting import (format_balance, format_subnet_info,
-                                format_subnet_list, print_error, print_info,
-                                print_success)
+from ..utils.diff import diff_subnet_snapshots
+from ..utils.formatting import (format_balance, format_dry_run,
+                                format_subnet_info, format_subnet_list,
+                                print_error, print_info, print_success)
 from ..utils.ownership import (require_user_keys, show_mine_filter_info,
                                user_owns_subnet)
+from ..utils.streaming import is_streaming_format, stream_rows
 from ..utils.validation import (validate_address, validate_churn_limit,
                                 validate_coldkey_addresses,
                                 validate_delegate_percentage,
@@ -447,8 +451,11 @@ def activate(
 @app.command()
 def list(
     format_type: str = typer.Option(
-        "table", "--format", "-f", help="Output format (table/json)"
-    )
+        "table", "--format", "-f", help="Output format (table/json/ndjson/csv)"
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Write ndjson/csv output to a file"
+    ),
 ):
     """List subnets. Use --mine flag globally to show only your subnets."""
     client = get_client()
@@ -457,42 +464,71 @@ def list(
     config = client.config
     filter_mine = getattr(config.filter, "mine", False)
 
+    # Unfiltered streaming output is written as each subnet is read
+    if is_streaming_format(format_type) and not filter_mine:
+        try:
+            stream_rows(
+                (record.to_row() for record in client.iter_subnets_data()),
+                format_type,
+                output,
+            )
+        except Exception as e:
+            typer.echo(f"Failed to list subnets: {str(e)}", err=True)
+            raise typer.Exit(1)
+        return
+
     try:
         response = client.get_subnets_data()
         if response.success:
             subnets = response.data.get("subnets", [])
             original_count = len(subnets)
+            owners = {}
 
             # Apply --mine filtering if enabled
             if filter_mine:
                 user_addresses = require_user_keys()
 
-                # Enhance subnets with ownership information
-                enhanced_subnets = []
+                # Keep the subnets the user owns, noting each owner
+                owned_subnets = []
                 for subnet in subnets:
-                    subnet_id = subnet.get("subnet_id")
-                    if subnet_id:
-                        # Get detailed subnet data to check ownership
-                        detail_response = client.get_subnet_data(subnet_id)
-                        if detail_response.success:
-                            subnet_detail = detail_response.data
-                            # Check if user owns this subnet
-                            if user_owns_subnet(subnet_detail, user_addresses):
-                                enhanced_subnets.append(
-                                    {
-                                        **subnet,
-                                        "owner": subnet_detail.get("owner", ""),
-                                        "is_mine": True,
-                                    }
-                                )
-
-                subnets = enhanced_subnets
-                show_mine_filter_info(user_addresses, len(subnets), original_count)
-
-            if format_type == "json":
-                console.print_json(data=subnets)
+                    # Get detailed subnet data to check ownership
+                    detail_response = client.get_subnet_data(subnet.subnet_id)
+                    if detail_response.success:
+                        subnet_detail = detail_response.data
+                        # Check if user owns this subnet
+                        if user_owns_subnet(subnet_detail, user_addresses):
+                            owners[subnet.subnet_id] = subnet_detail.get("owner", "")
+                            owned_subnets.append(subnet)
+
+                subnets = owned_subnets
+                if not is_streaming_format(format_type):
+                    show_mine_filter_info(
+                        user_addresses, len(subnets), original_count
+                    )
+
+            # Records become dictionaries only here, as each is written
+            if is_streaming_format(format_type):
+                stream_rows(
+                    (
+                        {
+                            "subnet_id": subnet.subnet_id,
+                            "owner": owners.get(subnet.subnet_id, ""),
+                            **subnet.to_storage(),
+                        }
+                        for subnet in subnets
+                    ),
+                    format_type,
+                    output,
+                )
+            elif format_type == "json":
+                listings = [subnet.to_listing() for subnet in subnets]
+                if filter_mine:
+                    for listing in listings:
+                        listing["owner"] = owners[listing["subnet_id"]]
+                        listing["is_mine"] = True
+                console.print_json(data=listings)
             else:
-                format_subnet_list(subnets)
+                format_subnet_list([subnet.to_row() for subnet in subnets])
 
         else:
             print_error(f"Failed to retrieve subnets: {response.message}")
@@ -526,6 +562,88 @@ def info(
         raise typer.Exit(1)
 
 
+@app.command()
+def diff(
+    subnet_id: int = typer.Option(..., "--subnet-id", "-s", help="Subnet ID"),
+    from_block: str = typer.Option(
+        ..., "--from-block", help="Earlier block number or hash"
+    ),
+    to_block: Optional[str] = typer.Option(
+        None, "--to-block", help="Later block number or hash (default: best block)"
+    ),
+    format_type: str = typer.Option(
+        "table", "--format", "-f", help="Output format (table/json/ndjson/csv)"
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Write ndjson/csv output to a file"
+    ),
+):
+    """Show subnet parameters, nodes and stakes that changed between two blocks."""
+    client = get_client()
+
+    try:
+        start = client.resolve_block(from_block)
+        end = client.resolve_block(to_block)
+        before = client.get_subnet_snapshot(subnet_id, start["block_hash"])
+        after = client.get_subnet_snapshot(subnet_id, end["block_hash"])
+        changes = diff_subnet_snapshots(before, after)
+        # Parameters the runtime does not define are not compared
+        unavailable = sorted(
+            set(before.get("unavailable", [])) | set(after.get("unavailable", []))
+        )
+    except Exception as e:
+        print_error(f"Failed to diff subnet: {str(e)}")
+        raise typer.Exit(1)
+
+    if is_streaming_format(format_type):
+        stream_rows(
+            ({"subnet_id": subnet_id, **change} for change in changes),
+            format_type,
+            output,
+        )
+        return
+    if format_type == "json":
+        console.print_json(
+            data={
+                "subnet_id": subnet_id,
+                "from_block": start,
+                "to_block": end,
+                "changes": changes,
+                "unavailable": unavailable,
+            }
+        )
+        return
+
+    if unavailable:
+        print_info(
+            f"Not in the runtime metadata, not compared: {', '.join(unavailable)}"
+        )
+
+    title = (
+        f"Subnet {subnet_id}: block {start['block_number']} "
+        f"→ {end['block_number']}"
+    )
+    if not changes:
+        console.print(f"{title}: no changes")
+        return
+
+    table = Table(title=title)
+    table.add_column("Node", style="cyan", justify="right")
+    table.add_column("Field", style="white")
+    table.add_column("Change", style="yellow")
+    table.add_column("From", style="red")
+    table.add_column("To", style="green")
+    for change in changes:
+        table.add_row(
+            "" if change["node_id"] is None else str(change["node_id"]),
+            change["field"],
+            change["change"],
+            "" if change["from"] is None else str(change["from"]),
+            "" if change["to"] is None else str(change["to"]),
+        )
+    console.print(table)
+
+
 @app.command()
 def pause(
     subnet_id: int = typer.Option(..., "--subnet-id", "-s", help="Subnet ID to pause"),
@@ -783,15 +901,82 @@ def unpause(
 @app.command()
 def remove(
     subnet_id: int = typer.Option(..., "--subnet-id", "-s", help="Subnet ID to remove"),
+    key_name: Optional[str] = typer.Option(
+        None, "--key-name", "-k", help="Key name for signing"
+    ),
     show_guidance: bool = typer.Option(
         True, "--guidance/--no-guidance", help="Show comprehensive guidance"
     ),
+    dry_run: bool = typer.Option(
+        False,
+        "--dry-run",
+        help="Show the fee and whether the removal would succeed, without submitting",
+    ),
 ):
     """Remove a subnet with comprehensive guidance."""
     client = get_client()
 
+    keypair = None
+    if key_name:
+        from ..utils.crypto import load_keypair
+        from ..utils.password import get_secure_password
+
+        try:
+            password = get_secure_password(
+                key_name,
+                prompt_message="Enter password to unlock keypair for subnet removal",
+                allow_default=True,
+            )
+            keypair = load_keypair(key_name, password)
+        except Exception as e:
+            print_error(f"❌ Failed to unlock key {key_name}: {str(e)}")
+            raise typer.Exit(1)
+
+    if dry_run:
+        if keypair is None:
+            print_error("❌ Key name is required for a dry run. Use --key-name.")
+            raise typer.Exit(1)
+        try:
+            call = client.remove_subnet(subnet_id).data["call_data"]
+            results = client.dry_run([call], keypair)
+        except Exception as e:
+            print_error(f"❌ Failed to dry-run subnet removal: {str(e)}")
+            raise typer.Exit(1)
+        format_dry_run(results)
+        if any(result["success"] is False for result in results):
+            raise typer.Exit(1)
+        return
+
+    # Show comprehensive guidance
+    if show_guidance:
+        from rich.panel import Panel
+
+        guidance_panel = Panel(
+            f"[bold cyan]🗑️ Subnet Removal Guide[/bold cyan]\n\n"
+            f"This will remove subnet {subnet_id} from the Hypertensor network:\n\n"
+            f"[bold]What Happens When Removed:[/bold]\n"
+            f"• The subnet and its nodes are deleted on-chain\n"
+            f"• Emissions to the subnet stop\n"
+            f"• Stakeholders must withdraw their stake\n\n"
+            f"[bold]Requirements:[/bold]\n"
+            f"• You must be the subnet owner\n"
+            f"• Valid signing key required\n\n"
+            f"[yellow]⚠️ Warning:[/yellow]\n"
+            f"• Removal is permanent and cannot be undone\n"
+            f"• Use --dry-run to check the fee and outcome first",
+            title="[bold red]🗑️ Remove Subnet[/bold red]",
+            border_style="red",
+        )
+        console.print(guidance_panel)
+        console.print()
+
+        # Ask for confirmation
+        if not typer.confirm(f"Remove subnet {subnet_id}? This cannot be undone."):
+            print_info("Subnet removal cancelled.")
+            return
+
     try:
-        response = client.remove_subnet(subnet_id)
+        response = client.remove_subnet(subnet_id, keypair)
         print_success(f"✅ Subnet {subnet_id} removed successfully!")
         console.print(f"Transaction: {response.transaction_hash}")
         if response.block_number:
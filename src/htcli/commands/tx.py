@@ -0,0 +1,278 @@
+"""
+Offline transaction commands.
+
+Build unsigned call payloads on a connected host, sign them on a host
+without network access, and submit the signed extrinsics in bulk.
+"""
+
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, TextIO
+
+import typer
+from substrateinterface.utils.ss58 import ss58_decode
+
+from ..client.tx import (
+    CALL,
+    CONTEXT,
+    DEFAULT_ERA_PERIOD,
+    DEFAULT_SUBMIT_WINDOW,
+    EXTRINSIC,
+    MAX_ERA_PERIOD,
+    call_payload,
+    offline_substrate,
+    read_records,
+    sign_payload,
+)
+from ..dependencies import get_client
+from ..utils.batch import compose_operation, load_operations
+from ..utils.password import get_secure_password
+from ..utils.streaming import StreamWriter, open_stream
+
+app = typer.Typer(name="tx", help="Build, sign offline and submit transactions")
+
+# Context fields carried over to signed extrinsic files
+SIGNED_CONTEXT_FIELDS = (
+    "type",
+    "chain",
+    "genesis_hash",
+    "spec_version",
+    "transaction_version",
+    "checkpoint",
+)
+
+
+@contextmanager
+def _open_input(path: Optional[Path]) -> Iterator[TextIO]:
+    """Open an input file, or yield stdin when no file is given or '-'."""
+    if path is None or str(path) == "-":
+        yield sys.stdin
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        yield f
+
+
+def _read_context(records: Iterator[Dict[str, Any]]) -> Dict[str, Any]:
+    """Take the context record that starts a payload or extrinsic file."""
+    context = next(records, None)
+    if not context or context.get("type") != CONTEXT:
+        raise ValueError("File does not start with a chain context record")
+    return context
+
+
+def _same_account(address: str, other: str) -> bool:
+    """Whether two SS58 addresses, in any format, are the same account."""
+    try:
+        return ss58_decode(address) == ss58_decode(other)
+    except Exception:
+        return address == other
+
+
+@app.command()
+def build(
+    ops_file: Optional[Path] = typer.Argument(
+        None,
+        help="Operations file (.yaml/.yml or NDJSON) in the batch run format; "
+        "NDJSON is read from stdin when omitted or '-'",
+    ),
+    signer: Optional[str] = typer.Option(
+        None,
+        "--signer",
+        help="Signing account; assigns nonces from its current on-chain nonce",
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Write NDJSON payloads to a file"
+    ),
+):
+    """Compose signed operations as unsigned payloads for offline signing."""
+    try:
+        if ops_file is None or str(ops_file) == "-":
+            ops = load_operations(stream=sys.stdin)
+        else:
+            ops = load_operations(ops_file)
+    except Exception as e:
+        typer.echo(f"Failed to load operations: {str(e)}", err=True)
+        raise typer.Exit(1)
+
+    client = get_client()
+    try:
+        context = client.read_chain_context()
+        nonce = client.substrate.get_account_nonce(signer) if signer else None
+        if signer:
+            # Lets tx sign refuse a key the nonces were not assigned for
+            context = {**context, "signer": signer}
+
+        with client.signing_context(), open_stream(output) as stream:
+            writer = StreamWriter(stream)
+            writer.write(context)
+            for index, op in enumerate(ops):
+                payload = {"index": index, "op": op["op"]}
+                if "id" in op:
+                    payload["id"] = op["id"]
+                try:
+                    payload.update(call_payload(compose_operation(client, op)))
+                except Exception as e:
+                    raise ValueError(f"Operation {index} ({op['op']}): {str(e)}")
+                if nonce is not None:
+                    payload["nonce"] = nonce + index
+                writer.write(payload)
+    except Exception as e:
+        typer.echo(f"Failed to build payloads: {str(e)}", err=True)
+        raise typer.Exit(1)
+
+    checkpoint = context["checkpoint"]["number"]
+    typer.echo(
+        f"{len(ops)} payloads built at checkpoint block {checkpoint}", err=True
+    )
+
+
+@app.command()
+def sign(
+    payloads_file: Optional[Path] = typer.Argument(
+        None, help="Payloads from tx build; read from stdin when omitted or '-'"
+    ),
+    key_name: str = typer.Option(..., "--key-name", "-k", help="Signing key name"),
+    nonce: Optional[int] = typer.Option(
+        None,
+        "--nonce",
+        help="Nonce of the first payload, incremented for each one "
+        "(default: nonces assigned by tx build --signer, which then must be "
+        "the signing key)",
+    ),
+    era_period: int = typer.Option(
+        DEFAULT_ERA_PERIOD,
+        "--era-period",
+        help=f"Blocks the extrinsics stay valid after the build checkpoint "
+        f"(4-{MAX_ERA_PERIOD})",
+    ),
+    immortal: bool = typer.Option(
+        False, "--immortal", help="Sign immortal extrinsics instead of mortal ones"
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Write NDJSON signed extrinsics to a file"
+    ),
+):
+    """Sign payloads without a network connection."""
+    if not immortal and not 4 <= era_period <= MAX_ERA_PERIOD:
+        typer.echo(f"--era-period must be between 4 and {MAX_ERA_PERIOD}", err=True)
+        raise typer.Exit(1)
+    if nonce is not None and nonce < 0:
+        typer.echo("--nonce must not be negative", err=True)
+        raise typer.Exit(1)
+
+    from ..utils.crypto import load_keypair
+
+    try:
+        password = get_secure_password(
+            key_name,
+            prompt_message="Enter password to unlock keypair for signing",
+            allow_default=True,
+        )
+        keypair = load_keypair(key_name, password)
+    except Exception as e:
+        typer.echo(f"Failed to unlock key {key_name}: {str(e)}", err=True)
+        raise typer.Exit(1)
+
+    signed = 0
+    try:
+        with _open_input(payloads_file) as source:
+            records = read_records(source, str(payloads_file or "<stdin>"))
+            context = _read_context(records)
+            builder_signer = context.get("signer")
+            if (
+                nonce is None
+                and builder_signer
+                and not _same_account(builder_signer, keypair.ss58_address)
+            ):
+                raise ValueError(
+                    f"Nonces were assigned for {builder_signer}, not "
+                    f"{keypair.ss58_address}; sign with that key or pass --nonce"
+                )
+            substrate = offline_substrate(context)
+
+            with open_stream(output) as stream:
+                writer = StreamWriter(stream)
+                writer.write({k: context[k] for k in SIGNED_CONTEXT_FIELDS})
+                for position, payload in enumerate(records):
+                    if payload.get("type") != CALL:
+                        raise ValueError(f"Record {position} is not a call payload")
+                    if nonce is not None:
+                        payload_nonce = nonce + position
+                    elif payload.get("nonce") is not None:
+                        payload_nonce = payload["nonce"]
+                    else:
+                        raise ValueError(
+                            "Payloads have no nonces; pass --nonce or build them "
+                            "with --signer"
+                        )
+                    record = sign_payload(
+                        substrate,
+                        context,
+                        payload,
+                        keypair,
+                        payload_nonce,
+                        None if immortal else era_period,
+                    )
+                    for key in ("index", "id", "op"):
+                        if key in payload:
+                            record[key] = payload[key]
+                    writer.write(record)
+                    signed += 1
+    except Exception as e:
+        typer.echo(f"Failed to sign payloads: {str(e)}", err=True)
+        raise typer.Exit(1)
+
+    typer.echo(f"{signed} extrinsics signed by {keypair.ss58_address}", err=True)
+
+
+@app.command()
+def submit(
+    extrinsics_file: Optional[Path] = typer.Argument(
+        None, help="Signed extrinsics from tx sign; read from stdin when omitted or '-'"
+    ),
+    window: int = typer.Option(
+        DEFAULT_SUBMIT_WINDOW,
+        "--window",
+        "-w",
+        help="Submissions awaiting a response from the node at once",
+    ),
+    output: Optional[Path] = typer.Option(
+        None, "--output", "-o", help="Write NDJSON results to a file"
+    ),
+):
+    """Stream signed extrinsics to the node and report one result per extrinsic."""
+    if window < 1:
+        typer.echo("--window must be at least 1", err=True)
+        raise typer.Exit(1)
+
+    client = get_client()
+    submitted = failed = 0
+    try:
+        with _open_input(extrinsics_file) as source:
+            records = read_records(source, str(extrinsics_file or "<stdin>"))
+            context = _read_context(records)
+            genesis_hash = client.substrate.get_block_hash(0)
+            if context.get("genesis_hash") != genesis_hash:
+                raise ValueError(
+                    f"Extrinsics were signed for genesis "
+                    f"{context.get('genesis_hash')}, but the node is on {genesis_hash}"
+                )
+
+            extrinsics = (r for r in records if r.get("type") == EXTRINSIC)
+            with open_stream(output) as stream:
+                writer = StreamWriter(stream)
+                for result in client.submit_extrinsics(extrinsics, window):
+                    submitted += 1
+                    failed += not result["success"]
+                    result.pop("extrinsic", None)
+                    writer.write(result)
+    except Exception as e:
+        typer.echo(
+            f"Submission failed after {submitted} extrinsics: {str(e)}", err=True
+        )
+        raise typer.Exit(1)
+
+    typer.echo(f"{submitted} extrinsics submitted, {failed} rejected", err=True)
+    if failed:
+        raise typer.Exit(1)
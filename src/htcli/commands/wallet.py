@@ -2,14 +2,20 @@
 Flattened wallet commands - 3-level hierarchy.
 """
 
+from dataclasses import asdict
+from pathlib import Path
 from typing import Optional
 
 import typer
 from rich.console import Console
 
-from ..utils.crypto import delete_keypair, generate_keypair, import_keypair
+from ..utils.crypto import (delete_keypair, generate_keypair,
+                            generate_keypairs, import_keypair)
 from ..utils.crypto import list_keys as list_keys_util
-from ..utils.formatting import format_table, print_error, print_success
+from ..utils.formatting import (format_table, print_error, print_info,
+                                print_success)
+from ..utils.keystore import KEYSTORE_FILE, migrate_json_keys, wallet_directory
+from ..utils.streaming import STREAMING_FORMATS, stream_rows
 from ..utils.ownership import get_ownership_summary, get_user_addresses
 from ..utils.validation import (validate_key_type, validate_password,
                                 validate_private_key, validate_wallet_name)
@@ -63,6 +69,67 @@ def generate_key(
         raise typer.Exit(1)
 
 
+@app.command()
+def generate_keys(
+    count: int = typer.Option(..., "--count", "-c", help="Number of keys to generate"),
+    prefix: str = typer.Option(
+        ..., "--prefix", help="Key name prefix, followed by a zero-padded number"
+    ),
+    start: int = typer.Option(1, "--start", help="Number of the first key"),
+    key_type: str = typer.Option(
+        "sr25519", "--type", "-t", help="Key type (sr25519/ed25519)"
+    ),
+    processes: int = typer.Option(
+        0, "--processes", help="Worker processes (0 = one per CPU core)"
+    ),
+    manifest: Optional[Path] = typer.Option(
+        None, "--manifest", "-o", help="Write the address manifest to a file"
+    ),
+    format_type: str = typer.Option(
+        "ndjson", "--format", "-f", help="Manifest format (ndjson/csv)"
+    ),
+    with_mnemonics: bool = typer.Option(
+        False,
+        "--with-mnemonics",
+        help="Add each key's mnemonic to the manifest, for backup",
+    ),
+):
+    """Generate many keys at once and write a manifest of their addresses."""
+    if count < 1 or start < 0 or processes < 0:
+        print_error("--count must be positive, --start and --processes not negative.")
+        raise typer.Exit(1)
+
+    if format_type not in STREAMING_FORMATS:
+        print_error(f"Invalid manifest format. Use {' or '.join(STREAMING_FORMATS)}.")
+        raise typer.Exit(1)
+
+    if not validate_key_type(key_type):
+        print_error("Invalid key type. Use 'sr25519' or 'ed25519'.")
+        raise typer.Exit(1)
+
+    width = len(str(start + count - 1))
+    names = [f"{prefix}{number:0{width}d}" for number in range(start, start + count)]
+    if not all(validate_wallet_name(name) for name in names):
+        print_error(
+            "Invalid key prefix. Use alphanumeric characters, hyphens, and underscores "
+            "only, with names of at most 50 characters."
+        )
+        raise typer.Exit(1)
+
+    try:
+        keys = generate_keypairs(names, key_type, processes or None, with_mnemonics)
+        rows = (asdict(key) for key in keys)
+        if not with_mnemonics:
+            rows = ({k: v for k, v in row.items() if k != "mnemonic"} for row in rows)
+        # A manifest with mnemonics holds secrets, so only its owner may read it
+        stream_rows(rows, format_type, manifest, private=with_mnemonics)
+    except Exception as e:
+        print_error(f"Failed to generate keys: {str(e)}")
+        raise typer.Exit(1)
+
+    typer.echo(f"{len(keys)} keys generated: {names[0]} to {names[-1]}", err=True)
+
+
 @app.command()
 def import_key(
     name: str = typer.Option(..., "--name", "-n", help="Key name"),
@@ -289,3 +356,23 @@ def delete_key(
     except Exception as e:
         print_error(f"Failed to delete key: {str(e)}")
         raise typer.Exit(1)
+
+
+@app.command()
+def migrate_keystore(
+    keep_json: bool = typer.Option(
+        False, "--keep-json", help="Keep the JSON key files after migrating"
+    ),
+):
+    """Move JSON key files into a single indexed keystore file."""
+    try:
+        migrated = migrate_json_keys(keep_json=keep_json)
+    except Exception as e:
+        print_error(f"Failed to migrate keys: {str(e)}")
+        raise typer.Exit(1)
+
+    print_success(
+        f"✅ {migrated} keys migrated to {wallet_directory() / KEYSTORE_FILE}"
+    )
+    if keep_json:
+        print_info("JSON key files were kept but are no longer read.")
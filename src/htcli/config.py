@@ -18,12 +18,20 @@ class NetworkConfig(BaseModel):
     )
     timeout: int = Field(30, description="Connection timeout in seconds")
     retry_attempts: int = Field(3, description="Number of retry attempts")
+    archive_path: str = Field(
+        "~/.htcli/archive", description="Cache of state read at finalized blocks"
+    )
+    at_block: Optional[str] = Field(
+        None, description="Block number or hash to read chain state at"
+    )
 
 
 class OutputConfig(BaseModel):
     """Output configuration."""
 
-    format: str = Field("table", description="Output format (table/json/csv)")
+    format: str = Field(
+        "table", description="Output format (table/json/csv/ndjson)"
+    )
     verbose: bool = Field(False, description="Verbose output")
     color: bool = Field(True, description="Enable colored output")
 
@@ -71,6 +79,7 @@ def load_config(config_file: Optional[Path] = None) -> Config:
             ),
             timeout=int(os.getenv("HTCLI_NETWORK_TIMEOUT", "30")),
             retry_attempts=int(os.getenv("HTCLI_NETWORK_RETRY_ATTEMPTS", "3")),
+            archive_path=os.getenv("HTCLI_NETWORK_ARCHIVE_PATH", "~/.htcli/archive"),
         )
 
         output_config = OutputConfig(
@@ -19,10 +19,24 @@ def set_client(client: HypertensorClient):
 
 
 def set_config(config: Config):
-    """Set the global config instance for lazy client initialization."""
-    global _config
+    """
+    Set the global config instance for lazy client initialization.
+
+    An existing client, kept between commands of a shell session, takes the
+    new config's output and filter options. When the network options differ,
+    such as the endpoint or --at-block, it is disconnected so the next
+    command connects again with them.
+    """
+    global _client, _config
     _config = config
 
+    if _client is not None:
+        if _client.config.network == config.network:
+            _client.config = config
+        else:
+            _client.disconnect()
+            _client = None
+
 
 def get_client() -> HypertensorClient:
     """Get the global client instance, initializing it lazily if needed."""
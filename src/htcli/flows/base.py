@@ -5,8 +5,10 @@ Provides the foundation for all automated flows with common functionality,
 error handling, and user interaction patterns.
 """
 
+import logging
 import time
 from abc import ABC
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional
@@ -19,6 +21,9 @@ from rich.table import Table
 
 from ..dependencies import get_client
 from ..utils.formatting import print_error, print_info
+from .checkpoint import delete_checkpoint, new_flow_id, save_checkpoint
+
+logger = logging.getLogger(__name__)
 
 
 class FlowStatus(Enum):
@@ -42,6 +47,8 @@ class FlowStep:
     timeout: int = 30
     retry_count: int = 3
     dependencies: List[str] = None
+    # Cheap read-only check that is re-run when resuming before dependent steps
+    precondition: bool = False
 
     def __post_init__(self):
         if self.dependencies is None:
@@ -75,12 +82,23 @@ class BaseFlow(ABC):
     - Progress tracking and reporting
     """
 
-    def __init__(self, console: Optional[Console] = None):
+    def __init__(
+        self,
+        console: Optional[Console] = None,
+        max_workers: int = 1,
+        interactive: bool = True,
+    ):
         self.console = console or Console()
         self.client = get_client()
         self.steps: List[FlowStep] = []
         self.context: Dict[str, Any] = {}
         self.start_time: float = 0.0
+        # Number of steps that may run at once once their dependencies are met
+        self.max_workers = max(1, max_workers)
+        # Non-interactive runs skip the proceed prompt and cosmetic pauses
+        self.interactive = interactive
+        # Steps completed by an earlier run when resuming from a checkpoint
+        self.resumed_steps: List[str] = []
 
     @property
     def name(self) -> str:
@@ -139,7 +157,7 @@ class BaseFlow(ABC):
             print_info("Initializing flow context...")
             # Add default context values
             context.setdefault("start_time", time.time())
-            context.setdefault("flow_id", f"flow_{int(time.time())}")
+            context.setdefault("flow_id", new_flow_id())
             return True
         except Exception as e:
             print_error(f"Initialization failed: {str(e)}")
@@ -188,9 +206,10 @@ class BaseFlow(ABC):
             self.console.print(f"\n{self.name}", style="bold blue")
             self.console.print(f"{self.description}\n")
 
-            # Collect user inputs
-            inputs = self.collect_inputs()
-            self.context.update(inputs)
+            # Collect user inputs, unless they were restored from a checkpoint
+            if not self.resumed_steps:
+                inputs = self.collect_inputs()
+                self.context.update(inputs)
 
             # Setup steps
             self.steps = self.setup_steps()
@@ -198,6 +217,9 @@ class BaseFlow(ABC):
             # Show flow summary
             self.show_flow_summary()
 
+            if not self.interactive:
+                return True
+
             return Confirm.ask("Do you want to proceed with this flow?")
 
         except KeyboardInterrupt:
@@ -217,6 +239,7 @@ class BaseFlow(ABC):
             )
 
         self.start_time = time.time()
+        self.context.setdefault("flow_id", new_flow_id())
         completed_steps = []
 
         with Progress(
@@ -224,51 +247,13 @@ class BaseFlow(ABC):
             TextColumn("[progress.description]{task.description}"),
             console=self.console,
         ) as progress:
+            failure = self.run_steps(progress, completed_steps)
 
-            for step in self.steps:
-                if not self.check_dependencies(step, completed_steps):
-                    return FlowResult(
-                        status=FlowStatus.FAILED,
-                        completed_steps=completed_steps,
-                        failed_step=step.name,
-                        error_message=f"Dependencies not met for step: {step.name}",
-                        execution_time=time.time() - self.start_time,
-                    )
-
-                task = progress.add_task(f"Executing: {step.description}", total=None)
-
-                try:
-                    # Execute step with retries
-                    success = self.execute_step_with_retry(step)
-
-                    if success:
-                        completed_steps.append(step.name)
-                        progress.update(
-                            task, description=f"Completed: {step.description}"
-                        )
-                        time.sleep(0.5)  # Brief pause for user feedback
-                    else:
-                        if step.required:
-                            return FlowResult(
-                                status=FlowStatus.FAILED,
-                                completed_steps=completed_steps,
-                                failed_step=step.name,
-                                error_message=f"Required step failed: {step.name}",
-                                execution_time=time.time() - self.start_time,
-                            )
-                        else:
-                            print_info(f"Optional step skipped: {step.name}")
-
-                except KeyboardInterrupt:
-                    return FlowResult(
-                        status=FlowStatus.CANCELLED,
-                        completed_steps=completed_steps,
-                        failed_step=step.name,
-                        error_message="Flow cancelled by user",
-                        execution_time=time.time() - self.start_time,
-                    )
+        if failure:
+            return failure
 
-                progress.remove_task(task)
+        # Nothing is left to resume once every step has run
+        delete_checkpoint(self.context["flow_id"])
 
         # Flow completed successfully
         execution_time = time.time() - self.start_time
@@ -282,6 +267,167 @@ class BaseFlow(ABC):
         self.show_completion_summary(result)
         return result
 
+    def run_steps(
+        self, progress: Progress, completed_steps: List[str]
+    ) -> Optional[FlowResult]:
+        """
+        Run steps as a dependency graph, starting each once its dependencies finish.
+
+        A step with no declared dependencies depends on the step before it, so
+        flows that do not declare dependencies still run in order. Ready steps
+        run on up to ``max_workers`` threads in declaration order.
+
+        Steps that are ready together share ``self.context`` and the progress
+        display, so they must not read or write the same context keys. Declare
+        a dependency between steps that do, or that prompt or submit extrinsics.
+
+        Returns:
+            A FlowResult when the flow fails or is cancelled, otherwise None
+        """
+        dependencies = self.resolve_dependencies()
+        pending = list(self.steps)
+        finished = set()
+        running = {}
+
+        # Steps completed by an earlier run are not repeated
+        skipped = self.resumable_steps(dependencies)
+        for step in [s for s in pending if s.name in skipped]:
+            pending.remove(step)
+            finished.add(step.name)
+            completed_steps.append(step.name)
+        if skipped:
+            print_info(f"Resuming after completed steps: {', '.join(skipped)}")
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        def stop(status: FlowStatus, step_name: str, message: str) -> FlowResult:
+            # Let running steps finish, but never start queued ones
+            executor.shutdown(wait=True, cancel_futures=True)
+            return FlowResult(
+                status=status,
+                completed_steps=completed_steps,
+                failed_step=step_name,
+                error_message=message,
+                execution_time=time.time() - self.start_time,
+            )
+
+        try:
+            while pending or running:
+                for step in [s for s in pending if dependencies[s.name] <= finished]:
+                    pending.remove(step)
+                    if not self.check_dependencies(step, completed_steps):
+                        return stop(
+                            FlowStatus.FAILED,
+                            step.name,
+                            f"Dependencies not met for step: {step.name}",
+                        )
+
+                    task = progress.add_task(
+                        f"Executing: {step.description}", total=None
+                    )
+                    future = executor.submit(self.execute_step_with_retry, step)
+                    running[future] = (step, task)
+
+                if not running:
+                    # Remaining steps wait on dependencies that can never finish
+                    step = pending[0]
+                    return stop(
+                        FlowStatus.FAILED,
+                        step.name,
+                        f"Dependencies not met for step: {step.name}",
+                    )
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    step, task = running.pop(future)
+                    finished.add(step.name)
+
+                    if future.result():
+                        completed_steps.append(step.name)
+                        self.save_progress(completed_steps)
+                        progress.update(
+                            task, description=f"Completed: {step.description}"
+                        )
+                        if self.interactive:
+                            time.sleep(0.5)  # Brief pause for user feedback
+                    elif step.required:
+                        return stop(
+                            FlowStatus.FAILED,
+                            step.name,
+                            f"Required step failed: {step.name}",
+                        )
+                    else:
+                        print_info(f"Optional step skipped: {step.name}")
+
+                    progress.remove_task(task)
+
+        except KeyboardInterrupt:
+            step_names = [step.name for step, _ in running.values()]
+            return stop(
+                FlowStatus.CANCELLED,
+                step_names[0] if step_names else None,
+                "Flow cancelled by user",
+            )
+
+        executor.shutdown(wait=True)
+        return None
+
+    def resume(self, checkpoint: Dict[str, Any]):
+        """Restore context and completed steps from a saved checkpoint."""
+        self.context.update(checkpoint.get("context", {}))
+        self.context["flow_id"] = checkpoint["flow_id"]
+        self.resumed_steps = list(checkpoint.get("completed_steps", []))
+
+        if checkpoint.get("redacted"):
+            print_info(
+                "Sensitive values are not stored in checkpoints and were not "
+                f"restored: {', '.join(checkpoint['redacted'])}"
+            )
+
+    def resumable_steps(self, dependencies: Dict[str, set]) -> List[str]:
+        """
+        Get the resumed steps that can be skipped.
+
+        Precondition steps are re-run while any step that depends on them is
+        still pending, so cheap checks are validated again before new work.
+        """
+        resumed = set(self.resumed_steps)
+        skipped = []
+        for step in self.steps:
+            if step.name not in resumed:
+                continue
+            has_pending_dependants = any(
+                step.name in deps and name not in resumed
+                for name, deps in dependencies.items()
+            )
+            if step.precondition and has_pending_dependants:
+                continue
+            skipped.append(step.name)
+        return skipped
+
+    def save_progress(self, completed_steps: List[str]):
+        """Checkpoint the flow context and completed steps."""
+        try:
+            save_checkpoint(
+                self.context["flow_id"],
+                type(self).__name__,
+                self.context,
+                completed_steps,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to save flow checkpoint: {e}")
+
+    def resolve_dependencies(self) -> Dict[str, set]:
+        """Map each step name to the set of step names it waits for."""
+        dependencies = {}
+        previous = None
+        for step in self.steps:
+            if step.dependencies:
+                dependencies[step.name] = set(step.dependencies)
+            else:
+                dependencies[step.name] = {previous} if previous else set()
+            previous = step.name
+        return dependencies
+
     def execute_step_with_retry(self, step: FlowStep) -> bool:
         """Execute a step with retry logic"""
         for attempt in range(step.retry_count):
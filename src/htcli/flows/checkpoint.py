@@ -0,0 +1,113 @@
+"""
+Flow Checkpoints
+
+Persists a flow's context and completed steps after each step so that a
+failed or interrupted flow can be resumed without repeating finished work.
+"""
+
+import json
+import logging
+import os
+import re
+import secrets
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_DIR = Path.home() / ".htcli" / "flows"
+
+# Context keys containing any of these names are never written to disk
+SENSITIVE_KEYS = ("private_key", "mnemonic", "password")
+
+_FLOW_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]+$")
+
+
+def new_flow_id() -> str:
+    """Create a flow ID, unique even for flows started in the same second."""
+    return f"flow_{int(time.time())}_{secrets.token_hex(4)}"
+
+
+def checkpoint_path(flow_id: str) -> Path:
+    """Get the checkpoint file path for a flow ID."""
+    if not _FLOW_ID_PATTERN.match(flow_id):
+        raise ValueError(f"Invalid flow ID: {flow_id}")
+    return CHECKPOINT_DIR / f"{flow_id}.json"
+
+
+def _is_sensitive(key: Any) -> bool:
+    """Whether a context key names a secret, such as ``wallet_password``."""
+    name = str(key).lower()
+    return any(sensitive in name for sensitive in SENSITIVE_KEYS)
+
+
+def _redact(value: Any, path: str, redacted: List[str]) -> Any:
+    """Drop sensitive values from nested context data, recording their paths."""
+    if isinstance(value, dict):
+        result = {}
+        for key, item in value.items():
+            item_path = f"{path}.{key}" if path else str(key)
+            if _is_sensitive(key):
+                redacted.append(item_path)
+                result[key] = None
+            else:
+                result[key] = _redact(item, item_path, redacted)
+        return result
+    if isinstance(value, (list, tuple)):
+        return [_redact(item, path, redacted) for item in value]
+    return value
+
+
+def save_checkpoint(
+    flow_id: str, flow_type: str, context: Dict[str, Any], completed_steps: List[str]
+) -> Path:
+    """
+    Write a flow checkpoint atomically.
+
+    Values that are not JSON serializable are stored as strings, and
+    sensitive values such as private keys are left out.
+    """
+    redacted: List[str] = []
+    checkpoint = {
+        "flow_id": flow_id,
+        "flow": flow_type,
+        "updated_at": time.time(),
+        "completed_steps": list(completed_steps),
+        "context": _redact(dict(context), "", redacted),
+        "redacted": redacted,
+    }
+
+    path = checkpoint_path(flow_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # A new file that only the owner can read, never one left by another writer
+    temp_path = path.with_name(f"{path.stem}.{secrets.token_hex(4)}.tmp")
+    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(checkpoint, f, indent=2, default=str)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return path
+
+
+def load_checkpoint(flow_id: str) -> Optional[Dict[str, Any]]:
+    """Load a flow checkpoint, returning None if it does not exist."""
+    path = checkpoint_path(flow_id)
+    if not path.exists():
+        return None
+
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def delete_checkpoint(flow_id: str) -> None:
+    """Remove a flow checkpoint if it exists."""
+    try:
+        checkpoint_path(flow_id).unlink()
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Failed to delete flow checkpoint {flow_id}: {e}")
@@ -272,37 +272,19 @@ Perfect for users migrating from other tools or recovering from issues.
         """Discover existing assets"""
         try:
             recovered_addresses = context["recovered_addresses"]
-            discovered_assets = {"subnets": [], "stakes": [], "nodes": []}
 
-            for method, address in recovered_addresses:
-                if context.get("discover_subnets"):
-                    subnets = self.discover_owned_subnets(address)
-                    discovered_assets["subnets"].extend(subnets)
-
-                if context.get("discover_stakes"):
-                    stakes = self.discover_stake_positions(address)
-                    discovered_assets["stakes"].extend(stakes)
-
-                if context.get("discover_nodes"):
-                    nodes = self.discover_registered_nodes(address)
-                    discovered_assets["nodes"].extend(nodes)
-
-            # Remove duplicates
-            discovered_assets["subnets"] = list(
-                {s["subnet_id"]: s for s in discovered_assets["subnets"]}.values()
-            )
-            discovered_assets["stakes"] = list(
-                {
-                    (s["subnet_id"], s["node_id"]): s
-                    for s in discovered_assets["stakes"]
-                }.values()
-            )
-            discovered_assets["nodes"] = list(
-                {
-                    (n["subnet_id"], n["node_id"]): n
-                    for n in discovered_assets["nodes"]
-                }.values()
+            # One pass over the network matches every recovered address
+            response = self.client.subnet.discover_assets(
+                [address for _, address in recovered_addresses],
+                subnets=bool(context.get("discover_subnets")),
+                stakes=bool(context.get("discover_stakes")),
+                nodes=bool(context.get("discover_nodes")),
             )
+            if not response.success:
+                print_error(f"Asset discovery failed: {response.message}")
+                return False
+
+            discovered_assets = response.data
 
             context["discovered_assets"] = discovered_assets
 
@@ -325,80 +307,6 @@ Perfect for users migrating from other tools or recovering from issues.
             print_error(f"Asset discovery failed: {str(e)}")
             return False
 
-    def discover_owned_subnets(self, address: str) -> List[Dict[str, Any]]:
-        """Discover subnets owned by address"""
-        try:
-            response = self.client.subnet.get_subnets_data()
-            if not response.success:
-                return []
-
-            owned_subnets = []
-            subnets = response.data.get("subnets", [])
-
-            for subnet in subnets:
-                subnet_id = subnet.get("subnet_id")
-                if subnet_id:
-                    detail_response = self.client.subnet.get_subnet_data(subnet_id)
-                    if detail_response.success:
-                        subnet_detail = detail_response.data
-                        if subnet_detail.get("owner") == address:
-                            owned_subnets.append(
-                                {
-                                    "subnet_id": subnet_id,
-                                    "path": subnet_detail.get(
-                                        "name", f"subnet-{subnet_id}"
-                                    ),
-                                    "state": subnet_detail.get("state", "Unknown"),
-                                    "owner": address,
-                                }
-                            )
-
-            return owned_subnets
-
-        except Exception:
-            return []
-
-    def discover_stake_positions(self, address: str) -> List[Dict[str, Any]]:
-        """Discover stake positions for address"""
-        try:
-            response = self.client.staking.get_stake_info(address)
-            if not response.success:
-                return []
-
-            stakes = response.data.get("stakes", [])
-            stake_positions = []
-
-            for stake in stakes:
-                stake_positions.append(
-                    {
-                        "subnet_id": stake.get("subnet_id"),
-                        "node_id": stake.get("node_id"),
-                        "amount": stake.get("amount", 0),
-                        "status": stake.get("status", "active"),
-                        "address": address,
-                    }
-                )
-
-            return stake_positions
-
-        except Exception:
-            return []
-
-    def discover_registered_nodes(self, address: str) -> List[Dict[str, Any]]:
-        """Discover nodes registered by address"""
-        try:
-            # This would require querying all subnets and checking node ownership
-            # Simplified implementation for demo
-            registered_nodes = []
-
-            # In real implementation, would iterate through subnets
-            # and check node ownership by hotkey address
-
-            return registered_nodes
-
-        except Exception:
-            return []
-
     def display_discovery_results(self, assets: Dict[str, List]):
         """Display asset discovery results"""
         # Subnets table
@@ -426,7 +334,7 @@ Perfect for users migrating from other tools or recovering from issues.
             for stake in assets["stakes"]:
                 stakes_table.add_row(
                     str(stake["subnet_id"]),
-                    str(stake["node_id"]),
+                    str(stake["node_id"]) if stake["node_id"] is not None else "-",
                     format_balance(stake["amount"]),
                     stake["status"],
                 )
@@ -520,7 +428,14 @@ Portfolio Reconstruction Summary:
             # Verify stakes
             for stake in discovered_assets["stakes"]:
                 try:
-                    response = self.client.staking.get_stake_info(stake["address"])
+                    if stake["node_id"] is None:
+                        response = self.client.subnet.get_subnet_staking_info(
+                            stake["subnet_id"], stake["address"]
+                        )
+                    else:
+                        response = self.client.subnet.get_node_staking_info(
+                            stake["subnet_id"], stake["node_id"], stake["address"]
+                        )
                     if response.success:
                         verification_results["stakes_verified"] += 1
                     else:
@@ -130,6 +130,7 @@ Perfect for node operators who want to start earning rewards quickly.
                 function=self.step_balance_check,
                 required=True,
                 dependencies=["wallet_setup"],
+                precondition=True,
             ),
             FlowStep(
                 name="node_register",
@@ -225,7 +226,7 @@ Perfect for node operators who want to start earning rewards quickly.
                 # Score subnets based on various factors
                 scored_subnets = []
                 for subnet in subnets:
-                    subnet_id = subnet.get("subnet_id")
+                    subnet_id = subnet.subnet_id
                     if subnet_id:
                         detail_response = self.client.subnet.get_subnet_data(subnet_id)
                         if detail_response.success:
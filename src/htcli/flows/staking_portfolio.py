@@ -21,6 +21,9 @@ from rich.table import Table
 from ..models.requests import StakeAddRequest
 from ..utils.formatting import (format_balance, print_error, print_info,
                                 print_success)
+from ..utils.allocation import (AllocationConstraints, diversified_subnet_cap,
+                                plan_allocations)
+from ..utils.scoring import CANDIDATE_POOL_FACTOR, scan_opportunities
 from .base import BaseFlow, FlowStep
 
 
@@ -120,20 +123,21 @@ Perfect for investors who want to maximize returns through diversification.
                 function=self.step_balance_check,
                 required=True,
                 dependencies=["wallet_setup"],
+                precondition=True,
             ),
             FlowStep(
                 name="market_analysis",
                 description="Analyze staking opportunities",
                 function=self.step_market_analysis,
                 required=True,
-                dependencies=["balance_check"],
+                dependencies=["config_init"],
             ),
             FlowStep(
                 name="portfolio_allocation",
                 description="Calculate optimal stake allocation",
                 function=self.step_portfolio_allocation,
                 required=True,
-                dependencies=["market_analysis"],
+                dependencies=["balance_check", "market_analysis"],
             ),
             FlowStep(
                 name="execute_stakes",
@@ -219,161 +223,29 @@ Perfect for investors who want to maximize returns through diversification.
     def step_market_analysis(self, context: Dict[str, Any]) -> bool:
         """Analyze staking opportunities"""
         try:
-            # Get all subnets
-            response = self.client.subnet.get_subnets_data()
-            if not response.success:
-                print_error("Failed to retrieve subnet data")
-                return False
-
-            subnets = response.data.get("subnets", [])
-            staking_opportunities = []
-
-            for subnet in subnets:
-                subnet_id = subnet.get("subnet_id")
-                if not subnet_id:
-                    continue
-
-                # Get detailed subnet info
-                detail_response = self.client.subnet.get_subnet_data(subnet_id)
-                if not detail_response.success:
-                    continue
-
-                subnet_detail = detail_response.data
-
-                # Get nodes in subnet
-                nodes_response = self.client.node.get_subnet_nodes(subnet_id)
-                if not nodes_response.success:
-                    continue
-
-                nodes = nodes_response.data.get("nodes", [])
+            # Score every node of every subnet as a potential staking target
+            scorer = scan_opportunities(self.client.subnet)
 
-                # Analyze each node as potential staking target
-                for node in nodes:
-                    opportunity = self.analyze_staking_opportunity(subnet_detail, node)
-                    if opportunity:
-                        staking_opportunities.append(opportunity)
-
-            if not staking_opportunities:
+            if not len(scorer):
                 print_error("No suitable staking opportunities found")
                 return False
 
-            # Filter and rank opportunities based on strategy
-            filtered_opportunities = self.filter_opportunities_by_strategy(
-                staking_opportunities, context
+            # Filter by strategy and keep a pool of the most attractive
+            mask = scorer.strategy_mask(
+                context["strategy"], context["include_new_subnets"]
             )
+            pool_size = context["max_positions"] * CANDIDATE_POOL_FACTOR
+            top = scorer.top_k(pool_size, mask)
 
-            context["staking_opportunities"] = filtered_opportunities
-            print_success(f"Found {len(filtered_opportunities)} staking opportunities")
+            context["staking_opportunities"] = scorer.to_opportunities(top)
+            context["stake_limits"] = scorer.stake_limits
+            print_success(f"Found {int(mask.sum())} staking opportunities")
             return True
 
         except Exception as e:
             print_error(f"Market analysis failed: {str(e)}")
             return False
 
-    def analyze_staking_opportunity(
-        self, subnet_info: Dict[str, Any], node_info: Dict[str, Any]
-    ) -> Dict[str, Any]:
-        """Analyze individual staking opportunity"""
-        opportunity = {
-            "subnet_id": subnet_info.get("subnet_id"),
-            "node_id": node_info.get("node_id"),
-            "subnet_state": subnet_info.get("state"),
-            "node_status": node_info.get("status"),
-            "current_stake": node_info.get("total_stake", 0),
-            "performance_score": node_info.get("performance_score", 0.5),
-            "reward_rate": node_info.get("reward_rate", 0.1),
-            "risk_score": 0.5,  # Default risk score
-        }
-
-        # Calculate risk score based on various factors
-        risk_score = 0.5
-
-        # Subnet maturity factor
-        if subnet_info.get("state") == "Active":
-            risk_score -= 0.1
-        elif subnet_info.get("state") == "Registered":
-            risk_score += 0.1
-
-        # Node performance factor
-        performance = opportunity["performance_score"]
-        if performance > 0.8:
-            risk_score -= 0.2
-        elif performance < 0.3:
-            risk_score += 0.2
-
-        # Stake concentration factor
-        total_nodes = subnet_info.get("total_nodes", 1)
-        if total_nodes > 10:  # More distributed = lower risk
-            risk_score -= 0.1
-
-        opportunity["risk_score"] = max(0.0, min(1.0, risk_score))
-        opportunity["attractiveness_score"] = self.calculate_attractiveness(opportunity)
-
-        return opportunity
-
-    def calculate_attractiveness(self, opportunity: Dict[str, Any]) -> float:
-        """Calculate overall attractiveness score"""
-        # Weighted scoring based on multiple factors
-        performance_weight = 0.3
-        reward_weight = 0.3
-        risk_weight = 0.2
-        stake_weight = 0.2
-
-        performance_score = opportunity["performance_score"]
-        reward_score = min(opportunity["reward_rate"] * 10, 1.0)  # Normalize to 0-1
-        risk_score = 1.0 - opportunity["risk_score"]  # Lower risk = higher score
-
-        # Stake size factor (prefer moderate stakes)
-        stake = opportunity["current_stake"]
-        if stake < 10 * (10**18):  # Less than 10 TENSOR
-            stake_score = 0.8  # Slightly lower for very low stakes
-        elif stake > 1000 * (10**18):  # More than 1000 TENSOR
-            stake_score = 0.6  # Lower for very high stakes
-        else:
-            stake_score = 1.0
-
-        total_score = (
-            performance_score * performance_weight
-            + reward_score * reward_weight
-            + risk_score * risk_weight
-            + stake_score * stake_weight
-        )
-
-        return total_score
-
-    def filter_opportunities_by_strategy(
-        self, opportunities: List[Dict[str, Any]], context: Dict[str, Any]
-    ) -> List[Dict[str, Any]]:
-        """Filter opportunities based on user strategy"""
-        strategy = context["strategy"]
-        include_new = context["include_new_subnets"]
-
-        filtered = []
-
-        for opp in opportunities:
-            # Filter by subnet maturity
-            if not include_new and opp["subnet_state"] != "Active":
-                continue
-
-            # Strategy-based filtering
-            if strategy == "conservative":
-                if opp["risk_score"] > 0.6:  # Skip high-risk
-                    continue
-            elif strategy == "aggressive":
-                if opp["risk_score"] < 0.3:  # Skip low-risk (potentially low-reward)
-                    continue
-
-            # Only include opportunities with reasonable performance
-            if opp["performance_score"] < 0.2:
-                continue
-
-            filtered.append(opp)
-
-        # Sort by attractiveness
-        filtered.sort(key=lambda x: x["attractiveness_score"], reverse=True)
-
-        return filtered
-
     def step_portfolio_allocation(self, context: Dict[str, Any]) -> bool:
         """Calculate optimal stake allocation"""
         try:
@@ -383,19 +255,21 @@ Perfect for investors who want to maximize returns through diversification.
             min_stake = context["min_stake_per_position"]
             diversify_subnets = context["diversify_subnets"]
 
-            # Select top opportunities
-            selected_opportunities = opportunities[:max_positions]
-
-            if diversify_subnets:
-                # Ensure subnet diversity
-                selected_opportunities = self.ensure_subnet_diversity(
-                    selected_opportunities
-                )
-
-            # Calculate allocation
-            allocations = self.calculate_allocations(
-                selected_opportunities, total_stake, min_stake
+            limits = context.get("stake_limits", {})
+
+            constraints = AllocationConstraints(
+                total_stake=total_stake,
+                max_positions=max_positions,
+                min_stake=max(min_stake, limits.get("min_stake", 0)),
+                max_stake=limits.get("max_stake", 0),
+                max_per_subnet=(
+                    diversified_subnet_cap(total_stake, max_positions, opportunities)
+                    if diversify_subnets
+                    else 0
+                ),
             )
+            plan = plan_allocations(opportunities, constraints)
+            allocations = plan.allocations
 
             if not allocations:
                 print_error("Could not create viable allocation")
@@ -403,6 +277,11 @@ Perfect for investors who want to maximize returns through diversification.
 
             # Display allocation plan
             self.display_allocation_plan(allocations)
+            if plan.unallocated:
+                print_info(
+                    f"{format_balance(plan.unallocated)} left unallocated by "
+                    "stake and diversity limits"
+                )
 
             if not Confirm.ask("Proceed with this allocation?"):
                 print_info("Portfolio allocation cancelled")
@@ -415,74 +294,6 @@ Perfect for investors who want to maximize returns through diversification.
             print_error(f"Portfolio allocation failed: {str(e)}")
             return False
 
-    def ensure_subnet_diversity(
-        self, opportunities: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
-        """Ensure diversity across subnets"""
-        seen_subnets = set()
-        diverse_opportunities = []
-
-        # First pass: one opportunity per subnet
-        for opp in opportunities:
-            subnet_id = opp["subnet_id"]
-            if subnet_id not in seen_subnets:
-                diverse_opportunities.append(opp)
-                seen_subnets.add(subnet_id)
-
-        # Second pass: fill remaining slots with best remaining
-        remaining_slots = len(opportunities) - len(diverse_opportunities)
-        for opp in opportunities:
-            if len(diverse_opportunities) >= len(opportunities):
-                break
-            if opp not in diverse_opportunities and remaining_slots > 0:
-                diverse_opportunities.append(opp)
-                remaining_slots -= 1
-
-        return diverse_opportunities
-
-    def calculate_allocations(
-        self, opportunities: List[Dict[str, Any]], total_stake: int, min_stake: int
-    ) -> List[Dict[str, Any]]:
-        """Calculate stake allocations"""
-        if not opportunities:
-            return []
-
-        # Calculate total attractiveness score
-        total_attractiveness = sum(opp["attractiveness_score"] for opp in opportunities)
-
-        allocations = []
-        remaining_stake = total_stake
-
-        for opp in opportunities:
-            # Proportional allocation based on attractiveness
-            proportion = opp["attractiveness_score"] / total_attractiveness
-            allocated_amount = int(total_stake * proportion)
-
-            # Ensure minimum stake
-            if allocated_amount < min_stake:
-                allocated_amount = min_stake
-
-            # Ensure we don't exceed remaining stake
-            if allocated_amount > remaining_stake:
-                allocated_amount = remaining_stake
-
-            if allocated_amount > 0:
-                allocation = {
-                    "subnet_id": opp["subnet_id"],
-                    "node_id": opp["node_id"],
-                    "amount": allocated_amount,
-                    "percentage": (allocated_amount / total_stake) * 100,
-                    "risk_score": opp["risk_score"],
-                    "expected_reward": opp["reward_rate"],
-                }
-                allocations.append(allocation)
-                remaining_stake -= allocated_amount
-
-            if remaining_stake <= 0:
-                break
-
-        return allocations
-
     def display_allocation_plan(self, allocations: List[Dict[str, Any]]):
         """Display allocation plan to user"""
         table = Table(title="Stake Allocation Plan")
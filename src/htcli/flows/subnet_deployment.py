@@ -131,6 +131,7 @@ Perfect for subnet creators who want to go from zero to operational subnet quick
                 function=self.step_balance_check,
                 required=True,
                 dependencies=["wallet_setup"],
+                precondition=True,
             ),
             FlowStep(
                 name="subnet_register",
@@ -165,7 +166,7 @@ Perfect for subnet creators who want to go from zero to operational subnet quick
                 description="Verify deployment success",
                 function=self.step_verify_deployment,
                 required=True,
-                dependencies=["node_add"],
+                dependencies=["node_add", "stake_add"],
             ),
         ]
 
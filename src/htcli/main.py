@@ -8,15 +8,20 @@ from typing import Optional
 import typer
 from rich.console import Console
 
+from .client.archive import parse_block_id
+from .commands.agent import app as agent_app
+from .commands.batch import app as batch_app
 from .commands.chain import app as chain_app
 from .commands.config import app as config_app
 from .commands.flow import app as flow_app
 from .commands.node import app as node_app
 from .commands.stake import app as stake_app
 from .commands.subnet import app as subnet_app
+from .commands.tx import app as tx_app
 from .commands.wallet import app as wallet_app
 from .config import load_config
 from .dependencies import set_config
+from .utils.formatting import print_error
 
 
 def get_ascii_art():
@@ -55,11 +60,14 @@ def main(
     ),
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
     output_format: str = typer.Option(
-        "table", "--format", "-f", help="Output format (table/json/csv)"
+        "table", "--format", "-f", help="Output format (table/json/csv/ndjson)"
     ),
     mine: bool = typer.Option(
         False, "--mine", "-m", help="Filter results to show only your assets"
     ),
+    at_block: Optional[str] = typer.Option(
+        None, "--at-block", help="Read chain state at a block number or hash"
+    ),
 ):
     """Hypertensor Blockchain CLI - Manage subnets, wallets, and chain operations."""
     global config
@@ -113,6 +121,16 @@ def main(
         table.add_row("wallet", "Wallet management", "htcli wallet generate-key")
         table.add_row("chain", "Chain operations", "htcli chain network")
         table.add_row("flow", "Automated workflows", "htcli flow list")
+        table.add_row(
+            "batch", "Run many operations at once", "htcli batch run ops.yaml"
+        )
+        table.add_row(
+            "tx", "Offline signing and bulk submission", "htcli tx build ops.yaml"
+        )
+        table.add_row(
+            "agent", "Keep unlocked keys for signing", "htcli agent add -k my-key"
+        )
+        table.add_row("shell", "Interactive shell session", "htcli shell")
 
         console.print(table)
         console.print()
@@ -139,6 +157,14 @@ def main(
     if endpoint:
         config.network.endpoint = endpoint
 
+    if at_block is not None:
+        try:
+            parse_block_id(at_block)
+        except ValueError as e:
+            print_error(str(e))
+            raise typer.Exit(1)
+        config.network.at_block = at_block
+
     # Set global options
     config.output.verbose = verbose
     config.output.format = output_format
@@ -157,6 +183,17 @@ app.add_typer(stake_app, name="stake", help="Staking operations and management")
 app.add_typer(wallet_app, name="wallet", help="Wallet and key management")
 app.add_typer(chain_app, name="chain", help="Chain operations")
 app.add_typer(flow_app, name="flow", help="Automated workflows for common tasks")
+app.add_typer(batch_app, name="batch", help="Run many operations in one process")
+app.add_typer(tx_app, name="tx", help="Build, sign offline and submit transactions")
+app.add_typer(agent_app, name="agent", help="Keep unlocked keys in a key agent")
+
+
+@app.command()
+def shell():
+    """Start an interactive shell that keeps one connection across commands."""
+    from .shell import HtcliShell
+
+    HtcliShell(app).run()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,194 @@
+"""
+Compact record types for node and subnet storage data.
+
+Listing and status paths read one storage entry per node or subnet. These
+records keep the fields the CLI uses in ``__slots__`` attributes instead of
+nested dictionaries, and only build dictionaries at the output boundary.
+"""
+
+from typing import Any, Dict, Optional
+
+# SubnetNodesData / RegisteredSubnetNodesData fields kept as attributes
+NODE_FIELDS = (
+    "hotkey",
+    "peer_id",
+    "bootstrap_peer_id",
+    "client_peer_id",
+    "stake",
+    "delegate_reward_rate",
+    "registration_epoch",
+    "start_epoch",
+    "attestation_ratio",
+    "penalties",
+    "grace_epochs",
+    "idle_epochs",
+)
+
+# SubnetsData fields kept as attributes
+SUBNET_FIELDS = (
+    "id",
+    "name",
+    "repo",
+    "description",
+    "misc",
+    "state",
+    "start_epoch",
+)
+
+# Attestation ratio (percent) at which an active node is classed as Included
+INCLUDED_ATTESTATION_RATIO = 66
+
+
+def _split_storage(raw: Any, fields: tuple) -> tuple:
+    """Split a decoded storage value into known field values and the rest."""
+    if not isinstance(raw, dict):
+        return (None,) * len(fields), None
+
+    values = tuple(raw.get(field) for field in fields)
+    extra = {k: v for k, v in raw.items() if k not in fields or v is None}
+    return values, extra or None
+
+
+def _value_or(value: Any, default: Any) -> Any:
+    """Return the value, or the default when it was missing from storage."""
+    return default if value is None else value
+
+
+class NodeRecord:
+    """A single subnet node read from storage."""
+
+    __slots__ = ("subnet_id", "node_id", "status", "extra") + NODE_FIELDS
+
+    def __init__(
+        self,
+        subnet_id: int,
+        node_id: int,
+        status: str = "Active",
+        extra: Optional[Dict[str, Any]] = None,
+        **fields: Any,
+    ):
+        self.subnet_id = subnet_id
+        self.node_id = node_id
+        self.status = status
+        self.extra = extra
+        for field in NODE_FIELDS:
+            setattr(self, field, fields.get(field))
+
+    @classmethod
+    def from_storage(
+        cls, subnet_id: int, node_id: int, raw: Any, status: str = "Active"
+    ) -> "NodeRecord":
+        """Build a record from a decoded SubnetNodesData value."""
+        values, extra = _split_storage(raw, NODE_FIELDS)
+        fields = dict(zip(NODE_FIELDS, values))
+        return cls(subnet_id, node_id, status, extra, **fields)
+
+    @property
+    def classification(self) -> str:
+        """Node classification derived from its status and attestation ratio."""
+        if self.status == "Registered":
+            return "Registered"
+        if _value_or(self.attestation_ratio, 0) >= INCLUDED_ATTESTATION_RATIO:
+            return "Included"
+        return "Idle"
+
+    def to_storage(self) -> Dict[str, Any]:
+        """Rebuild the storage value as a dictionary."""
+        data = {}
+        for field in NODE_FIELDS:
+            value = getattr(self, field)
+            if value is not None:
+                data[field] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def to_listing(self) -> Dict[str, Any]:
+        """Convert to the ``{"node_id", "data"}`` shape used by node listings."""
+        return {"node_id": self.node_id, "data": self.to_storage()}
+
+    def to_row(self) -> Dict[str, Any]:
+        """Convert to a flat row with the subnet and node IDs first."""
+        row = {"subnet_id": self.subnet_id, "node_id": self.node_id}
+        row.update(self.to_storage())
+        return row
+
+    def to_status(self, current_epoch: int = 0) -> Dict[str, Any]:
+        """Convert to the node status dictionary shown by ``node status``."""
+        registered = self.status == "Registered"
+        return {
+            "node_id": self.node_id,
+            "subnet_id": self.subnet_id,
+            "classification": self.classification,
+            "hotkey": _value_or(self.hotkey, ""),
+            "peer_id": _value_or(self.peer_id, ""),
+            "stake": _value_or(self.stake, 0),
+            "delegate_reward_rate": _value_or(self.delegate_reward_rate, 0),
+            "registration_epoch": _value_or(self.registration_epoch, 0),
+            "start_epoch": _value_or(self.start_epoch, 0),
+            "current_epoch": current_epoch,
+            "attestation_ratio": (
+                0 if registered else _value_or(self.attestation_ratio, 0)
+            ),
+            "penalties": 0 if registered else _value_or(self.penalties, 0),
+            "grace_epochs": _value_or(self.grace_epochs, 0),
+            "idle_epochs": _value_or(self.idle_epochs, 0),
+            "status": self.status,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"NodeRecord(subnet_id={self.subnet_id}, node_id={self.node_id}, "
+            f"status={self.status!r}, hotkey={self.hotkey!r})"
+        )
+
+
+class SubnetRecord:
+    """A single subnet read from storage."""
+
+    __slots__ = ("subnet_id", "extra") + SUBNET_FIELDS
+
+    def __init__(
+        self, subnet_id: int, extra: Optional[Dict[str, Any]] = None, **fields: Any
+    ):
+        self.subnet_id = subnet_id
+        self.extra = extra
+        for field in SUBNET_FIELDS:
+            setattr(self, field, fields.get(field))
+
+    @classmethod
+    def from_storage(cls, subnet_id: int, raw: Any) -> "SubnetRecord":
+        """Build a record from a decoded SubnetsData value."""
+        values, extra = _split_storage(raw, SUBNET_FIELDS)
+        return cls(subnet_id, extra, **dict(zip(SUBNET_FIELDS, values)))
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether storage held no subnet data."""
+        return self.extra is None and all(
+            getattr(self, field) is None for field in SUBNET_FIELDS
+        )
+
+    def to_storage(self) -> Dict[str, Any]:
+        """Rebuild the storage value as a dictionary."""
+        data = {}
+        for field in SUBNET_FIELDS:
+            value = getattr(self, field)
+            if value is not None:
+                data[field] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def to_listing(self) -> Dict[str, Any]:
+        """Convert to the ``{"subnet_id", "data"}`` shape used by subnet listings."""
+        return {"subnet_id": self.subnet_id, "data": self.to_storage()}
+
+    def to_row(self) -> Dict[str, Any]:
+        """Convert to a flat row with the subnet ID first."""
+        row = {"subnet_id": self.subnet_id}
+        row.update(self.to_storage())
+        return row
+
+    def __repr__(self) -> str:
+        return f"SubnetRecord(subnet_id={self.subnet_id}, name={self.name!r})"
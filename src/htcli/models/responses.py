@@ -194,6 +194,12 @@ class StakeInfoResponse(BaseResponse):
     )
 
 
+class AssetDiscoveryResponse(BaseResponse):
+    """Response for asset discovery across addresses."""
+
+    address_count: Optional[int] = Field(None, description="Addresses searched")
+
+
 class UnbondingClaimResponse(BaseResponse):
     """Response for unbonding claim."""
 
@@ -308,6 +314,12 @@ class BalanceResponse(BaseResponse):
     reserved_balance: Optional[int] = Field(None, description="Reserved balance")
 
 
+class BalancesResponse(BaseResponse):
+    """Response for balances of many accounts."""
+
+    address_count: Optional[int] = Field(None, description="Number of addresses")
+
+
 class PeersResponse(BaseResponse):
     """Response for peers information."""
 
@@ -0,0 +1,230 @@
+"""
+Interactive shell for the Hypertensor CLI.
+
+Dispatches htcli commands in-process so that the client connection, chain
+metadata, password cache and completion data persist between commands.
+"""
+
+import logging
+import shlex
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import click
+import typer
+from rich.console import Console
+
+from .dependencies import get_client
+
+try:
+    import readline
+except ImportError:  # pragma: no cover - readline is unavailable on Windows
+    readline = None
+
+logger = logging.getLogger(__name__)
+
+HISTORY_FILE = Path.home() / ".htcli" / "shell_history"
+HISTORY_LENGTH = 1000
+
+EXIT_COMMANDS = ("exit", "quit")
+
+# Options whose values are completed from chain data
+SUBNET_ID_OPTIONS = ("--subnet-id", "-s")
+NODE_ID_OPTIONS = ("--node-id", "-n")
+
+
+class HtcliShell:
+    """Read-eval-print loop over the htcli command tree."""
+
+    def __init__(self, app: typer.Typer, console: Optional[Console] = None):
+        self.command = typer.main.get_command(app)
+        self.console = console or Console()
+        self._subnet_ids: Optional[List[str]] = None
+        self._node_ids: Dict[str, List[str]] = {}
+        self._matches: List[str] = []
+
+    def execute(self, line: str) -> int:
+        """
+        Run one command line in-process.
+
+        Returns:
+            The command's exit code
+        """
+        try:
+            args = shlex.split(line)
+        except ValueError as e:
+            self.console.print(f"[red]{e}[/red]")
+            return 2
+
+        if not args:
+            return 0
+        if args[0] == "help":
+            args = args[1:] + ["--help"]
+        elif args[0] == "refresh":
+            self.refresh()
+            return 0
+        elif args[0] == "shell":
+            self.console.print("Already in the htcli shell.")
+            return 0
+
+        try:
+            result = self.command.main(
+                args=args, prog_name="htcli", standalone_mode=False
+            )
+            return result if isinstance(result, int) else 0
+        except click.ClickException as e:
+            e.show()
+            return e.exit_code
+        except click.exceptions.Abort:
+            self.console.print("Aborted.")
+            return 1
+        except Exception as e:
+            self.console.print(f"[red]Error: {str(e)}[/red]")
+            return 1
+
+    def refresh(self):
+        """Forget cached subnet and node IDs used for completion."""
+        self._subnet_ids = None
+        self._node_ids.clear()
+
+    def subnet_ids(self) -> List[str]:
+        """Subnet IDs for completion, read from the chain once."""
+        if self._subnet_ids is None:
+            try:
+                self._subnet_ids = [
+                    str(subnet.subnet_id)
+                    for subnet in get_client().iter_subnets_data()
+                ]
+            except Exception as e:
+                logger.debug(f"Failed to load subnet IDs for completion: {e}")
+                return []
+        return self._subnet_ids
+
+    def node_ids(self, subnet_id: str) -> List[str]:
+        """Node IDs of a subnet for completion, read from the chain once."""
+        if subnet_id not in self._node_ids:
+            try:
+                self._node_ids[subnet_id] = [
+                    str(record.node_id)
+                    for record in get_client().iter_subnet_node_records(
+                        int(subnet_id)
+                    )
+                ]
+            except Exception as e:
+                logger.debug(f"Failed to load node IDs for completion: {e}")
+                return []
+        return self._node_ids[subnet_id]
+
+    def completions(self, tokens: List[str], text: str) -> List[str]:
+        """
+        Get completion candidates for the word being typed.
+
+        Args:
+            tokens: Complete words before the one being typed
+            text: The partial word being typed
+        """
+        if tokens and tokens[-1] in SUBNET_ID_OPTIONS:
+            candidates = self.subnet_ids()
+        elif tokens and tokens[-1] in NODE_ID_OPTIONS:
+            subnet_id = _option_value(tokens, SUBNET_ID_OPTIONS)
+            candidates = self.node_ids(subnet_id) if subnet_id else []
+        else:
+            command = self.command
+            for token in tokens:
+                if isinstance(command, click.MultiCommand) and token in (
+                    command.list_commands(None)
+                ):
+                    command = command.get_command(None, token)
+            if isinstance(command, click.MultiCommand):
+                candidates = command.list_commands(None)
+                if not tokens:
+                    candidates = candidates + ["help", "refresh", *EXIT_COMMANDS]
+            else:
+                candidates = [
+                    opt
+                    for param in command.params
+                    if isinstance(param, click.Option)
+                    for opt in param.opts + param.secondary_opts
+                    if opt.startswith("--")
+                ]
+
+        return sorted(c for c in candidates if c.startswith(text))
+
+    def _complete(self, text: str, state: int) -> Optional[str]:
+        """readline completer entry point."""
+        if state == 0:
+            buffer = readline.get_line_buffer()[: readline.get_endidx()]
+            try:
+                tokens = shlex.split(buffer)
+            except ValueError:
+                tokens = buffer.split()
+            if text and tokens:
+                tokens = tokens[:-1]
+            self._matches = self.completions(tokens, text)
+        return self._matches[state] if state < len(self._matches) else None
+
+    def _setup_readline(self):
+        if readline is None:
+            return
+        try:
+            HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
+            if HISTORY_FILE.exists():
+                readline.read_history_file(str(HISTORY_FILE))
+        except OSError as e:
+            logger.debug(f"Failed to read shell history: {e}")
+        readline.set_history_length(HISTORY_LENGTH)
+        readline.set_completer(self._complete)
+        readline.set_completer_delims(" \t\n")
+        readline.parse_and_bind("tab: complete")
+
+    def _save_history(self):
+        if readline is None:
+            return
+        try:
+            readline.write_history_file(str(HISTORY_FILE))
+        except OSError as e:
+            logger.debug(f"Failed to save shell history: {e}")
+
+    def run(self):
+        """Read and run commands until exit, quit or end of input."""
+        self._setup_readline()
+        self.console.print(
+            "[bold cyan]Hypertensor CLI shell[/bold cyan] - "
+            "type [bold]help[/bold] for commands, [bold]exit[/bold] to leave"
+        )
+
+        try:
+            while True:
+                try:
+                    line = input("htcli> ").strip()
+                except KeyboardInterrupt:
+                    self.console.print()
+                    continue
+                except EOFError:
+                    self.console.print()
+                    break
+
+                if line in EXIT_COMMANDS:
+                    break
+                if line.startswith("htcli "):
+                    line = line[len("htcli ") :]
+
+                try:
+                    self.execute(line)
+                except KeyboardInterrupt:
+                    self.console.print("\nInterrupted.")
+        finally:
+            self._save_history()
+
+
+def _option_value(tokens: List[str], names) -> Optional[str]:
+    """Get the last value given for an option in a token list."""
+    value = None
+    for index, token in enumerate(tokens[:-1]):
+        if token in names:
+            value = tokens[index + 1]
+    for token in tokens:
+        for name in names:
+            if name.startswith("--") and token.startswith(f"{name}="):
+                value = token.split("=", 1)[1]
+    return value
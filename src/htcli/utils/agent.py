@@ -0,0 +1,394 @@
+"""
+Key agent for the Hypertensor CLI.
+
+Like ssh-agent, the agent keeps unlocked keypairs in memory and signs with
+them on request, so commands sign without asking for a password and
+decrypting the key again. It listens on a unix socket only its owner can
+connect to, and forgets each key once its time to live runs out.
+
+Requests and responses are JSON objects, one per line.
+"""
+
+import json
+import os
+import socket
+import socketserver
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from scalecodec.base import ScaleBytes
+from substrateinterface import Keypair
+
+# Environment variable overriding the agent's socket path
+AGENT_SOCKET_ENV = "HTCLI_AGENT_SOCK"
+
+# Seconds a key is held when it is added without a time to live
+DEFAULT_KEY_TTL = 3600
+
+# Seconds between sweeps for expired keys
+PURGE_INTERVAL = 1.0
+
+# Longest request line the agent reads
+_MAX_REQUEST = 1 << 20
+
+
+def agent_socket_path() -> Path:
+    """Socket of the key agent, by default ~/.htcli/agent.sock."""
+    path = os.environ.get(AGENT_SOCKET_ENV)
+    if path:
+        return Path(path)
+    return Path.home() / ".htcli" / "agent.sock"
+
+
+class AgentError(Exception):
+    """Raised when the key agent refuses or fails a request."""
+
+
+class KeyAgent:
+    """
+    Unlocked keypairs held in memory, served on a unix socket.
+
+    The socket is created readable and writable by its owner only, and on
+    systems that report peer credentials, connections from other users are
+    refused as well. Private keys never leave the agent: clients get public
+    fields and signatures.
+    """
+
+    def __init__(
+        self, path: Optional[Path] = None, default_ttl: float = DEFAULT_KEY_TTL
+    ):
+        self.path = Path(path) if path else agent_socket_path()
+        self.default_ttl = default_ttl
+        self._keys: Dict[str, Tuple[Keypair, Optional[float]]] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._server: Optional[socketserver.ThreadingUnixStreamServer] = None
+
+    def add(self, name: str, keypair: Keypair, ttl: Optional[float] = None):
+        """Hold a keypair for ``ttl`` seconds, or until removed when 0."""
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl > 0 else None
+        with self._lock:
+            self._keys[name] = (keypair, expires_at)
+
+    def get(self, name: str) -> Keypair:
+        """Get a held keypair that has not expired."""
+        with self._lock:
+            entry = self._keys.get(name)
+            if entry and entry[1] is not None and entry[1] <= time.monotonic():
+                del self._keys[name]
+                entry = None
+        if entry is None:
+            raise AgentError(f"Key '{name}' is not held by the agent")
+        return entry[0]
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Get the public fields and remaining time of every held key."""
+        self.purge()
+        now = time.monotonic()
+        with self._lock:
+            entries = sorted(self._keys.items())
+        return [
+            {
+                "name": name,
+                "key_type": "sr25519" if keypair.crypto_type == 1 else "ed25519",
+                "ss58_address": keypair.ss58_address,
+                "expires_in": None if expires_at is None else round(expires_at - now),
+            }
+            for name, (keypair, expires_at) in entries
+        ]
+
+    def remove(self, name: str) -> bool:
+        """Forget a key, returning whether it was held."""
+        with self._lock:
+            return self._keys.pop(name, None) is not None
+
+    def remove_all(self) -> int:
+        """Forget every key, returning how many were held."""
+        with self._lock:
+            count = len(self._keys)
+            self._keys.clear()
+        return count
+
+    def purge(self) -> int:
+        """Forget expired keys, returning how many there were."""
+        now = time.monotonic()
+        with self._lock:
+            expired = [
+                name
+                for name, (_, expires_at) in self._keys.items()
+                if expires_at is not None and expires_at <= now
+            ]
+            for name in expired:
+                del self._keys[name]
+        return len(expired)
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer one request."""
+        op = request.get("op")
+        try:
+            if op == "add":
+                # 1 for sr25519, 0 for ed25519
+                crypto_type = 1 if request.get("key_type") == "sr25519" else 0
+                keypair = Keypair(
+                    ss58_address=request["ss58_address"],
+                    public_key=request["public_key"],
+                    private_key=request["private_key"],
+                    crypto_type=crypto_type,
+                )
+                self.add(request["name"], keypair, request.get("ttl"))
+                return {"ok": True}
+            if op == "public":
+                keypair = self.get(request["name"])
+                return {
+                    "ok": True,
+                    "ss58_address": keypair.ss58_address,
+                    "public_key": keypair.public_key.hex(),
+                    "crypto_type": keypair.crypto_type,
+                }
+            if op == "sign":
+                keypair = self.get(request["name"])
+                signature = keypair.sign(bytes.fromhex(request["data"]))
+                return {"ok": True, "signature": signature.hex()}
+            if op == "list":
+                return {"ok": True, "keys": self.list()}
+            if op == "remove":
+                return {"ok": True, "removed": self.remove(request["name"])}
+            if op == "remove_all":
+                return {"ok": True, "removed": self.remove_all()}
+            raise AgentError(f"Unknown request: {op}")
+        except KeyError as e:
+            return {"ok": False, "error": f"Missing field: {e.args[0]}"}
+        except Exception as e:
+            return {"ok": False, "error": str(e)}
+
+    def bind(self):
+        """
+        Create the socket, replacing a stale one left by an agent that exited.
+
+        Raises:
+            AgentError: If another agent is listening on the socket
+        """
+        if self.path.exists():
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                    probe.connect(str(self.path))
+                raise AgentError(f"An agent is already listening on {self.path}")
+            except OSError:
+                self.path.unlink()
+
+        self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # The socket is created with the umask's permissions, so no other user
+        # can connect between binding and the chmod
+        umask = os.umask(0o177)
+        try:
+            self._server = _AgentServer(str(self.path), _AgentHandler, agent=self)
+        finally:
+            os.umask(umask)
+        os.chmod(self.path, 0o600)
+
+    def serve_forever(self):
+        """Serve requests and sweep expired keys until shut down."""
+        if self._server is None:
+            self.bind()
+        sweeper = threading.Thread(target=self._sweep, daemon=True)
+        sweeper.start()
+        try:
+            self._server.serve_forever(poll_interval=0.2)
+        finally:
+            self._stopped.set()
+            self._server.server_close()
+            self.remove_all()
+            self.path.unlink(missing_ok=True)
+
+    def shutdown(self):
+        """Stop serving, from another thread or a signal handler."""
+        self._stopped.set()
+        if self._server is not None:
+            self._server.shutdown()
+
+    def _sweep(self):
+        while not self._stopped.wait(PURGE_INTERVAL):
+            self.purge()
+
+
+class _AgentServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path, handler, agent: KeyAgent):
+        self.agent = agent
+        super().__init__(path, handler)
+
+
+class _AgentHandler(socketserver.StreamRequestHandler):
+    """Answer requests from one connection until it closes."""
+
+    def handle(self):
+        if not _same_user(self.connection):
+            return
+        for line in iter(lambda: self.rfile.readline(_MAX_REQUEST), b""):
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("Request is not an object")
+                response = self.server.agent.handle(request)
+            except ValueError as e:
+                response = {"ok": False, "error": f"Invalid request: {str(e)}"}
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+            self.wfile.flush()
+
+
+def _same_user(connection: socket.socket) -> bool:
+    """Whether the peer runs as this user, where the system reports it."""
+    if not hasattr(socket, "SO_PEERCRED"):
+        return True
+    credentials = connection.getsockopt(
+        socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i")
+    )
+    _, uid, _ = struct.unpack("3i", credentials)
+    return uid == os.getuid()
+
+
+class AgentClient:
+    """Connection to a running key agent, reused across requests."""
+
+    def __init__(self, path: Optional[Path] = None, timeout: float = 10.0):
+        self.path = Path(path) if path else agent_socket_path()
+        self.timeout = timeout
+        self._sock: Optional[socket.socket] = None
+        self._file = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(str(self.path))
+        except OSError:
+            sock.close()
+            raise
+        self._sock = sock
+        self._file = sock.makefile("rwb")
+
+    def request(self, op: str, **params) -> Dict[str, Any]:
+        """
+        Send one request and wait for its response.
+
+        Raises:
+            OSError: If the agent cannot be reached
+            AgentError: If the agent refuses the request
+        """
+        with self._lock:
+            if self._sock is None:
+                self._connect()
+            try:
+                self._file.write(json.dumps({"op": op, **params}).encode() + b"\n")
+                self._file.flush()
+                line = self._file.readline()
+            except OSError:
+                self.close()
+                raise
+            if not line:
+                self.close()
+                raise ConnectionError("The agent closed the connection")
+        response = json.loads(line)
+        if not response.get("ok"):
+            raise AgentError(response.get("error", "Request failed"))
+        return response
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+        if self._sock is not None:
+            self._sock.close()
+        self._sock = None
+        self._file = None
+
+    def add(self, name: str, keypair: Keypair, ttl: Optional[float] = None):
+        self.request(
+            "add",
+            name=name,
+            key_type="sr25519" if keypair.crypto_type == 1 else "ed25519",
+            ss58_address=keypair.ss58_address,
+            public_key=keypair.public_key.hex(),
+            private_key=keypair.private_key.hex(),
+            ttl=ttl,
+        )
+
+    def public(self, name: str) -> Dict[str, Any]:
+        return self.request("public", name=name)
+
+    def sign(self, name: str, data: bytes) -> bytes:
+        response = self.request("sign", name=name, data=data.hex())
+        return bytes.fromhex(response["signature"])
+
+    def list(self) -> List[Dict[str, Any]]:
+        return self.request("list")["keys"]
+
+    def remove(self, name: str) -> bool:
+        return self.request("remove", name=name)["removed"]
+
+    def remove_all(self) -> int:
+        return self.request("remove_all")["removed"]
+
+
+class AgentKeypair(Keypair):
+    """
+    Keypair whose private key stays in the key agent.
+
+    It has the public fields of the held key and no private key; signing
+    sends the payload to the agent, so it can be passed anywhere a keypair
+    only signs.
+    """
+
+    def __init__(self, name: str, client: AgentClient, public: Dict[str, Any]):
+        super().__init__(
+            ss58_address=public["ss58_address"],
+            public_key=public["public_key"],
+            crypto_type=public["crypto_type"],
+        )
+        self.name = name
+        self.agent = client
+
+    def sign(self, data) -> bytes:
+        # Same payload forms as Keypair.sign
+        if isinstance(data, ScaleBytes):
+            data = bytes(data.data)
+        elif isinstance(data, str) and data[0:2] == "0x":
+            data = bytes.fromhex(data[2:])
+        elif isinstance(data, str):
+            data = data.encode()
+        return self.agent.sign(self.name, bytes(data))
+
+
+# One connection per process, opened when a key is first looked up
+_client: Optional[AgentClient] = None
+
+
+def _agent_client() -> Optional[AgentClient]:
+    global _client
+    path = agent_socket_path()
+    if not path.exists():
+        return None
+    if _client is None or _client.path != path:
+        _client = AgentClient(path)
+    return _client
+
+
+def agent_keypair(name: str) -> Optional[AgentKeypair]:
+    """Get a key held by a running agent, or None if there is none holding it."""
+    client = _agent_client()
+    if client is None:
+        return None
+    try:
+        return AgentKeypair(name, client, client.public(name))
+    except (OSError, ValueError, AgentError):
+        return None
+
+
+def agent_holds_key(name: str) -> bool:
+    """Whether a running agent holds a key."""
+    return agent_keypair(name) is not None
@@ -0,0 +1,127 @@
+"""
+Constrained stake allocation.
+
+Splits a stake budget across staking opportunities to maximize expected reward
+in a single pass, subject to per-position stake bounds, per-subnet caps and a
+maximum number of positions.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List
+
+import numpy as np
+
+
+@dataclass
+class AllocationConstraints:
+    """Limits a stake allocation must respect (amounts in smallest units)."""
+
+    total_stake: int
+    max_positions: int
+    # Per-position bounds, e.g. MinStakeBalance and MaxStakeBalance (0 = no
+    # cap); max_stake bounds a node's total stake, including its current stake
+    min_stake: int = 0
+    max_stake: int = 0
+    # Maximum total stake in any one subnet (0 = no cap)
+    max_per_subnet: int = 0
+
+
+@dataclass
+class AllocationPlan:
+    """Result of a stake allocation."""
+
+    allocations: List[Dict[str, Any]] = field(default_factory=list)
+    allocated: int = 0
+    unallocated: int = 0
+    expected_reward: int = 0
+
+
+def expected_value(opportunity: Dict[str, Any]) -> float:
+    """Risk-adjusted reward per unit of stake."""
+    return opportunity["reward_rate"] * (1.0 - opportunity["risk_score"])
+
+
+def diversified_subnet_cap(
+    total_stake: int, max_positions: int, opportunities: List[Dict[str, Any]]
+) -> int:
+    """
+    Per-subnet cap that spreads stake across as many subnets as possible.
+
+    The budget is divided evenly between the distinct subnets available, up to
+    one subnet per position, rounding up so the full budget can be placed.
+    """
+    subnet_count = len({opp["subnet_id"] for opp in opportunities})
+    slots = max(1, min(max_positions, subnet_count))
+    return -(-total_stake // slots)
+
+
+def plan_allocations(
+    opportunities: List[Dict[str, Any]], constraints: AllocationConstraints
+) -> AllocationPlan:
+    """
+    Allocate stake to maximize expected reward under the constraints.
+
+    Opportunities are ranked once by reward rate times (1 - risk) and each
+    receives as much stake as its position, subnet and budget limits allow.
+    With a linear reward this greedy fill is optimal. The stake cap applies
+    to a node's total stake, so an opportunity's ``current_stake`` counts
+    against it. Positions that cannot reach the minimum stake, including
+    nodes already at the cap, are skipped.
+    """
+    total_stake = constraints.total_stake
+    plan = AllocationPlan(unallocated=total_stake)
+    if not opportunities or total_stake <= 0 or constraints.max_positions <= 0:
+        return plan
+
+    values = np.fromiter(
+        (expected_value(opp) for opp in opportunities),
+        dtype=np.float64,
+        count=len(opportunities),
+    )
+    # Best value first, ties in input order
+    order = np.argsort(-values, kind="stable")
+
+    remaining = total_stake
+    subnet_totals: Dict[Any, int] = {}
+    min_stake = max(constraints.min_stake, 1)
+
+    for index in order:
+        if len(plan.allocations) >= constraints.max_positions or remaining < min_stake:
+            break
+
+        opp = opportunities[index]
+        if values[index] <= 0:
+            break
+
+        amount = remaining
+        if constraints.max_stake > 0:
+            stake_room = constraints.max_stake - opp.get("current_stake", 0)
+            amount = min(amount, stake_room)
+        if constraints.max_per_subnet > 0:
+            subnet_room = constraints.max_per_subnet - subnet_totals.get(
+                opp["subnet_id"], 0
+            )
+            amount = min(amount, subnet_room)
+
+        if amount < min_stake:
+            continue
+
+        subnet_totals[opp["subnet_id"]] = (
+            subnet_totals.get(opp["subnet_id"], 0) + amount
+        )
+        remaining -= amount
+        plan.allocations.append(
+            {
+                "subnet_id": opp["subnet_id"],
+                "node_id": opp["node_id"],
+                "amount": amount,
+                "percentage": (amount / total_stake) * 100,
+                "risk_score": opp["risk_score"],
+                "expected_reward": opp["reward_rate"],
+            }
+        )
+        plan.expected_reward += int(amount * float(values[index]))
+
+    plan.allocated = total_stake - remaining
+    plan.unallocated = remaining
+    return plan
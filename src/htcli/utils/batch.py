@@ -0,0 +1,388 @@
+"""
+Batch execution of Hypertensor operations.
+
+Runs a list of subnet, node, stake and chain operations inside one process,
+sharing a single client connection, chain metadata and unlocked keypairs,
+and reports one result row per operation.
+"""
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from ..models.requests import StakeAddRequest, StakeRemoveRequest
+from .password import get_secure_password
+
+# Operation keys that are not passed to the handler
+RESERVED_KEYS = ("op", "id", "key_name")
+
+
+@dataclass
+class BatchOperation:
+    """A batch operation handler and whether it submits a transaction."""
+
+    handler: Callable[..., Any]
+    signed: bool = False
+
+
+def _client_method(name: str) -> Callable[..., Any]:
+    """Handler calling a client method with the operation parameters."""
+
+    def handler(client, **params):
+        return getattr(client, name)(**params)
+
+    return handler
+
+
+def _subnet_list(client):
+    response = client.get_subnets_data()
+    response.data = {
+        "subnets": [record.to_listing() for record in response.data["subnets"]]
+    }
+    return response
+
+
+def _subnet_nodes(client, subnet_id):
+    response = client.get_subnet_nodes(subnet_id)
+    response.data = {
+        "nodes": [record.to_listing() for record in response.data["nodes"]]
+    }
+    return response
+
+
+def _stake_add(client, subnet_id, node_id, hotkey, amount, keypair=None):
+    request = StakeAddRequest(
+        subnet_id=subnet_id, node_id=node_id, hotkey=hotkey, stake_to_be_added=amount
+    )
+    return client.add_to_stake(request, keypair)
+
+
+def _stake_remove(client, subnet_id, hotkey, amount, keypair=None):
+    request = StakeRemoveRequest(
+        subnet_id=subnet_id, hotkey=hotkey, stake_to_be_removed=amount
+    )
+    return client.remove_stake(request, keypair)
+
+
+def _delegate_add(client, subnet_id, amount, keypair=None):
+    return client.add_to_delegate_stake(subnet_id, amount, keypair)
+
+
+def _delegate_remove(client, subnet_id, shares, keypair=None):
+    return client.remove_delegate_stake(subnet_id, shares, keypair)
+
+
+# Operation names follow the CLI command they correspond to
+OPERATIONS: Dict[str, BatchOperation] = {
+    "subnet list": BatchOperation(_subnet_list),
+    "subnet info": BatchOperation(_client_method("get_subnet_data")),
+    "subnet nodes": BatchOperation(_subnet_nodes),
+    "subnet activate": BatchOperation(_client_method("activate_subnet"), True),
+    "subnet pause": BatchOperation(_client_method("pause_subnet"), True),
+    "subnet unpause": BatchOperation(_client_method("unpause_subnet"), True),
+    "node status": BatchOperation(_client_method("get_subnet_node_status")),
+    "node activate": BatchOperation(_client_method("activate_subnet_node"), True),
+    "node deactivate": BatchOperation(_client_method("deactivate_subnet_node"), True),
+    "node reactivate": BatchOperation(_client_method("reactivate_subnet_node"), True),
+    "stake info": BatchOperation(_client_method("get_node_staking_info")),
+    "stake subnet-info": BatchOperation(_client_method("get_subnet_staking_info")),
+    "stake add": BatchOperation(_stake_add, True),
+    "stake remove": BatchOperation(_stake_remove, True),
+    "stake delegate-add": BatchOperation(_delegate_add, True),
+    "stake delegate-remove": BatchOperation(_delegate_remove, True),
+    "stake node-add": BatchOperation(
+        _client_method("add_to_node_delegate_stake"), True
+    ),
+    "stake node-remove": BatchOperation(
+        _client_method("remove_node_delegate_stake"), True
+    ),
+    "stake claim": BatchOperation(_client_method("claim_unbondings"), True),
+    "chain network": BatchOperation(_client_method("get_network_stats")),
+    "chain epoch": BatchOperation(_client_method("get_current_epoch")),
+    "chain head": BatchOperation(_client_method("get_chain_head")),
+    "chain block": BatchOperation(_client_method("get_block_info")),
+    "chain account": BatchOperation(_client_method("get_account_info")),
+    "chain balance": BatchOperation(_client_method("get_balance")),
+    "chain balances": BatchOperation(_client_method("get_balances")),
+    "chain peers": BatchOperation(_client_method("get_peers")),
+}
+
+
+def compose_operation(client, op: Dict[str, Any]):
+    """
+    Compose the call of a signed operation without submitting it.
+
+    Write methods return their composed call when no keypair is given.
+
+    Raises:
+        ValueError: If the operation does not submit a transaction
+    """
+    operation = OPERATIONS[op["op"]]
+    if not operation.signed:
+        raise ValueError(f"{op['op']} does not submit a transaction")
+    params = {k: v for k, v in op.items() if k not in RESERVED_KEYS}
+    response = operation.handler(client, **params)
+    call = (getattr(response, "data", None) or {}).get("call_data")
+    if call is None:
+        raise ValueError(getattr(response, "message", f"{op['op']} composed no call"))
+    return call
+
+
+def _parse_ndjson(lines: Iterable[str], source: str) -> List[Dict[str, Any]]:
+    ops = []
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        try:
+            ops.append(json.loads(line))
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{source}:{line_number}: invalid JSON: {e.msg}")
+    return ops
+
+
+def load_operations(
+    path: Optional[Path] = None, stream: Optional[TextIO] = None
+) -> List[Dict[str, Any]]:
+    """
+    Load and validate batch operations.
+
+    YAML files (.yaml/.yml) hold a list of operations, optionally under an
+    ``operations`` key. Anything else, including stdin, is read as NDJSON
+    with one operation per line.
+
+    Raises:
+        ValueError: If the file cannot be parsed or an operation is invalid
+    """
+    if path is not None and path.suffix.lower() in (".yaml", ".yml"):
+        import yaml
+
+        with open(path, "r") as f:
+            data = yaml.safe_load(f) or []
+        ops = data.get("operations", []) if isinstance(data, dict) else data
+        if not isinstance(ops, list):
+            raise ValueError(f"{path}: expected a list of operations")
+    elif path is not None:
+        with open(path, "r") as f:
+            ops = _parse_ndjson(f, str(path))
+    else:
+        ops = _parse_ndjson(stream, "<stdin>")
+
+    for index, op in enumerate(ops):
+        if not isinstance(op, dict):
+            raise ValueError(f"Operation {index}: expected a mapping")
+        if op.get("op") not in OPERATIONS:
+            raise ValueError(f"Operation {index}: unknown operation {op.get('op')!r}")
+        if op.get("key_name") and not OPERATIONS[op["op"]].signed:
+            raise ValueError(f"Operation {index}: {op['op']} does not take a key")
+
+    return ops
+
+
+class BatchRunner:
+    """
+    Execute batch operations against a shared client.
+
+    Signed operations run one at a time, in order, on the shared client.
+    With ``signing_context``, runs with several of them compose and sign
+    through one client SigningContext. With ``parallel_reads`` above one,
+    each run of consecutive read-only operations is spread across worker
+    threads, each with its own connection, and results are still reported
+    in input order.
+    """
+
+    def __init__(
+        self,
+        client,
+        parallel_reads: int = 1,
+        client_factory: Optional[Callable[[], Any]] = None,
+        signing_context: bool = False,
+    ):
+        self.client = client
+        self.parallel_reads = max(1, parallel_reads)
+        self.client_factory = client_factory
+        self.signing_context = signing_context
+        self.keypairs: Dict[str, Any] = {}
+        self._keypair_lock = threading.Lock()
+        self._local = threading.local()
+        self._worker_clients: List[Any] = []
+        self._worker_lock = threading.Lock()
+
+    def get_keypair(self, key_name: str):
+        """Unlock a keypair once and reuse it for every operation."""
+        with self._keypair_lock:
+            if key_name not in self.keypairs:
+                from .crypto import load_keypair
+
+                password = get_secure_password(
+                    key_name,
+                    prompt_message="Enter password to unlock keypair",
+                    allow_default=True,
+                )
+                self.keypairs[key_name] = load_keypair(key_name, password)
+            return self.keypairs[key_name]
+
+    def unlock_keys(self, ops: List[Dict[str, Any]]):
+        """Unlock every key the operations use before any of them run."""
+        key_names = [op["key_name"] for op in ops if op.get("key_name")]
+        for key_name in dict.fromkeys(key_names):
+            self.get_keypair(key_name)
+
+    def _read_client(self):
+        """Get the calling worker's own client, connecting it on first use."""
+        if self.client_factory is None:
+            return self.client
+
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self.client_factory()
+            self._local.client = client
+            with self._worker_lock:
+                self._worker_clients.append(client)
+        return client
+
+    def execute(self, index: int, op: Dict[str, Any], client=None) -> Dict[str, Any]:
+        """Execute a single operation and build its result row."""
+        operation = OPERATIONS[op["op"]]
+        params = {k: v for k, v in op.items() if k not in RESERVED_KEYS}
+        result = {"index": index, "op": op["op"]}
+        if "id" in op:
+            result["id"] = op["id"]
+
+        started = time.perf_counter()
+        try:
+            if op.get("key_name"):
+                params["keypair"] = self.get_keypair(op["key_name"])
+            response = operation.handler(client or self.client, **params)
+
+            if hasattr(response, "model_dump"):
+                result.update(response.model_dump())
+            else:
+                result.update({"success": True, "data": response})
+        except Exception as e:
+            result.update({"success": False, "message": str(e)})
+
+        result["elapsed"] = round(time.perf_counter() - started, 6)
+        return result
+
+    def _segments(self, ops: List[Dict[str, Any]]) -> Iterator[List[Any]]:
+        """Group consecutive read-only operations, keeping signed ones alone."""
+        reads: List[Any] = []
+        for index, op in enumerate(ops):
+            if self.parallel_reads == 1 or OPERATIONS[op["op"]].signed:
+                if reads:
+                    yield reads
+                    reads = []
+                yield [(index, op)]
+            else:
+                reads.append((index, op))
+        if reads:
+            yield reads
+
+    def run(
+        self, ops: List[Dict[str, Any]], fail_fast: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Execute operations, yielding result rows in input order.
+
+        Args:
+            ops: Operations from load_operations
+            fail_fast: Stop after the first failed operation, or in parallel
+                mode after the group of reads containing it
+        """
+        executor = None
+        if self.parallel_reads > 1:
+            executor = ThreadPoolExecutor(
+                max_workers=self.parallel_reads, thread_name_prefix="htcli-batch"
+            )
+        signed = sum(OPERATIONS[op["op"]].signed for op in ops)
+        signing = nullcontext()
+        if self.signing_context and signed > 1:
+            signing = self.client.signing_context()
+
+        try:
+            with signing:
+                yield from self._run_segments(ops, executor, fail_fast)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True)
+            self.close()
+
+    def _run_segments(
+        self, ops: List[Dict[str, Any]], executor, fail_fast: bool
+    ) -> Iterator[Dict[str, Any]]:
+        """Execute each segment, on the executor when it groups several reads."""
+        for segment in self._segments(ops):
+            if len(segment) > 1:
+                results = executor.map(
+                    lambda item: self.execute(*item, self._read_client()),
+                    segment,
+                )
+            else:
+                results = [self.execute(*segment[0])]
+
+            failed = False
+            for result in results:
+                failed = failed or not result["success"]
+                yield result
+            if failed and fail_fast:
+                return
+
+    def dry_run(self, ops: List[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Dry-run the signed operations instead of executing them.
+
+        Every call is composed first and then evaluated with one
+        client.dry_run per key, so the fee and dry run requests of the whole
+        plan are pipelined together. Read-only operations are skipped.
+
+        Yields:
+            Result rows in input order with each call's ``fee`` and expected
+            ``success``, None when it could not be dry-run
+        """
+        rows: Dict[int, Dict[str, Any]] = {}
+        calls: Dict[str, List[Any]] = {}
+        signing = nullcontext()
+        if self.signing_context:
+            signing = self.client.signing_context()
+
+        with signing:
+            for index, op in enumerate(ops):
+                if not OPERATIONS[op["op"]].signed:
+                    continue
+                row = rows[index] = {"index": index, "op": op["op"]}
+                if "id" in op:
+                    row["id"] = op["id"]
+                if not op.get("key_name"):
+                    row.update({"success": None, "message": "No key to dry-run with"})
+                    continue
+                try:
+                    call = compose_operation(self.client, op)
+                except Exception as e:
+                    row.update({"success": False, "message": str(e)})
+                    continue
+                calls.setdefault(op["key_name"], []).append((index, call))
+
+        for key_name, items in calls.items():
+            keypair = self.get_keypair(key_name)
+            results = self.client.dry_run([call for _, call in items], keypair)
+            for (index, _), result in zip(items, results):
+                rows[index].update(result)
+
+        for index in sorted(rows):
+            yield rows[index]
+
+    def close(self):
+        """Disconnect the per-worker read clients."""
+        with self._worker_lock:
+            clients, self._worker_clients = self._worker_clients, []
+        for client in clients:
+            try:
+                client.disconnect()
+            except Exception:
+                pass
@@ -3,14 +3,16 @@ Cryptographic utility functions for the Hypertensor CLI.
 """
 
 import base64
-import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from cryptography.fernet import Fernet
 from substrateinterface import Keypair
 
+from .agent import agent_keypair
+from .keystore import open_keystore
 from .password import get_secure_password
 
 
@@ -22,6 +24,7 @@ class KeypairInfo:
     key_type: str
     public_key: str
     ss58_address: str
+    mnemonic: Optional[str] = None
 
 
 def generate_keypair(
@@ -54,6 +57,7 @@ def generate_keypair(
             name,
             prompt_message="Enter password to secure this keypair",
             allow_default=True,
+            use_agent=False,
         )
         save_keypair(name, keypair, save_password)
 
@@ -94,6 +98,7 @@ def import_keypair(
             name,
             prompt_message="Enter password to secure this imported keypair",
             allow_default=True,
+            use_agent=False,
         )
         save_keypair(name, keypair, save_password)
 
@@ -103,58 +108,144 @@ def import_keypair(
         raise Exception(f"Failed to import keypair: {str(e)}")
 
 
+def _keypair_record(name: str, keypair: Keypair) -> Dict[str, Any]:
+    """Build the stored record of a keypair, with its private key encrypted."""
+    # Generate encryption key from password
+    key = Fernet.generate_key()
+    cipher = Fernet(key)
+
+    # Encrypt private key
+    private_key_bytes = keypair.private_key
+    encrypted_private_key = cipher.encrypt(private_key_bytes)
+
+    return {
+        "name": name,
+        "key_type": (
+            "sr25519" if keypair.crypto_type == 1 else "ed25519"
+        ),  # 1 for sr25519, 0 for ed25519
+        "public_key": keypair.public_key.hex(),
+        "ss58_address": keypair.ss58_address,
+        "encrypted_private_key": base64.b64encode(encrypted_private_key).decode(),
+        "salt": base64.b64encode(key).decode(),
+    }
+
+
 def save_keypair(name: str, keypair: Keypair, password: str):
     """Save a keypair to disk with encryption."""
     try:
-        # Create wallet directory
-        wallet_dir = Path.home() / ".htcli" / "wallets"
-        wallet_dir.mkdir(parents=True, exist_ok=True)
+        # Save encrypted keypair
+        keypair_data = _keypair_record(name, keypair)
+        open_keystore().add([keypair_data], replace=True)
+
+    except Exception as e:
+        raise Exception(f"Failed to save keypair: {str(e)}")
 
-        # Generate encryption key from password
-        key = Fernet.generate_key()
-        cipher = Fernet(key)
 
-        # Encrypt private key
-        private_key_bytes = keypair.private_key
-        encrypted_private_key = cipher.encrypt(private_key_bytes)
+def _generate_record(task) -> Tuple[Dict[str, Any], Optional[str]]:
+    """
+    Generate one keypair in a worker process.
 
-        # Save encrypted keypair
-        keypair_data = {
-            "name": name,
-            "key_type": (
-                "sr25519" if keypair.crypto_type == 1 else "ed25519"
-            ),  # 1 for sr25519, 0 for ed25519
-            "public_key": keypair.public_key.hex(),
-            "ss58_address": keypair.ss58_address,
-            "encrypted_private_key": base64.b64encode(encrypted_private_key).decode(),
-            "salt": base64.b64encode(key).decode(),
-        }
-
-        keypair_file = wallet_dir / f"{name}.json"
-        with open(keypair_file, "w") as f:
-            json.dump(keypair_data, f, indent=2)
+    Returns its stored record, and its mnemonic if the task asks for it.
+    """
+    name, key_type, with_mnemonic = task
+    mnemonic = Keypair.generate_mnemonic()
+    # 0 for ed25519, 1 for sr25519
+    crypto_type = 1 if key_type == "sr25519" else 0
+    keypair = Keypair.create_from_uri(mnemonic, crypto_type=crypto_type)
+    return _keypair_record(name, keypair), mnemonic if with_mnemonic else None
+
+
+def save_keypair_records(records: Sequence[Dict[str, Any]]):
+    """
+    Save many keypair records to disk, all of them or none.
+
+    Raises:
+        FileExistsError: If any of the names is taken
+    """
+    open_keystore().add(records)
+
+
+def generate_keypairs(
+    names: Sequence[str],
+    key_type: str = "sr25519",
+    processes: Optional[int] = None,
+    with_mnemonics: bool = False,
+) -> List[KeypairInfo]:
+    """
+    Generate many keypairs across a process pool and save them together.
+
+    Key derivation and encryption run in worker processes, one per core by
+    default, and the keys are only saved once all of them were generated.
+    Like every stored key, each private key is encrypted with a random key
+    kept in its own record, so no password is asked for. Mnemonics are
+    discarded unless ``with_mnemonics`` is set.
+
+    Args:
+        names: Key names, which must all be new
+        key_type: Key type (sr25519/ed25519)
+        processes: Worker processes; None for one per core, 1 for none
+        with_mnemonics: Return each key's mnemonic for backup
+    """
+    try:
+        if key_type not in ("sr25519", "ed25519"):
+            raise ValueError(f"Unsupported key type: {key_type}")
+        if len(set(names)) != len(names):
+            raise ValueError("Key names must be unique")
+
+        tasks = [(name, key_type, with_mnemonics) for name in names]
+        workers = processes or os.cpu_count() or 1
+        if workers == 1 or len(tasks) == 1:
+            results = [_generate_record(task) for task in tasks]
+        else:
+            chunksize = max(1, len(tasks) // (workers * 4))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(
+                    executor.map(_generate_record, tasks, chunksize=chunksize)
+                )
+
+        save_keypair_records([record for record, _ in results])
+
+        return [
+            KeypairInfo(
+                name=record["name"],
+                key_type=record["key_type"],
+                public_key=record["public_key"],
+                ss58_address=record["ss58_address"],
+                mnemonic=mnemonic,
+            )
+            for record, mnemonic in results
+        ]
 
     except Exception as e:
-        raise Exception(f"Failed to save keypair: {str(e)}")
+        raise Exception(f"Failed to generate keypairs: {str(e)}")
+
 
+def load_keypair(
+    name: str, password: Optional[str] = None, use_agent: bool = True
+) -> Keypair:
+    """
+    Load a keypair from disk.
 
-def load_keypair(name: str, password: Optional[str] = None) -> Keypair:
-    """Load a keypair from disk."""
+    When the key agent holds the key, a keypair that signs through the agent
+    is returned instead, without decrypting the key or asking for its
+    password. Pass ``use_agent=False`` to always decrypt the stored key.
+    """
     try:
-        wallet_dir = Path.home() / ".htcli" / "wallets"
-        keypair_file = wallet_dir / f"{name}.json"
+        if use_agent:
+            keypair = agent_keypair(name)
+            if keypair is not None:
+                return keypair
 
-        if not keypair_file.exists():
+        keypair_data = open_keystore().get(name)
+        if keypair_data is None:
             raise FileNotFoundError(f"Keypair '{name}' not found")
 
-        with open(keypair_file, "r") as f:
-            keypair_data = json.load(f)
-
         # Get secure password for decryption
         decrypt_password = password or get_secure_password(
             name,
             prompt_message="Enter password to unlock this keypair",
             allow_default=True,
+            use_agent=False,
         )
 
         # Decrypt private key
@@ -179,34 +270,14 @@ def load_keypair(name: str, password: Optional[str] = None) -> Keypair:
 
 
 def list_keys() -> list[dict]:
-    """List all available keys."""
+    """List all available keys, reading their public fields only."""
     try:
-        wallet_dir = Path.home() / ".htcli" / "wallets"
-        if not wallet_dir.exists():
-            return []
-
-        keys = []
-        for keypair_file in wallet_dir.glob("*.json"):
-            try:
-                with open(keypair_file, "r") as f:
-                    keypair_data = json.load(f)
-
-                # Return as dictionary for compatibility with wallet commands
-                key_info = {
-                    "name": keypair_data["name"],
-                    "key_type": keypair_data["key_type"],
-                    "public_key": keypair_data["public_key"],
-                    "ss58_address": keypair_data["ss58_address"],
-                    "address": keypair_data[
-                        "ss58_address"
-                    ],  # Alias for ownership utils
-                }
-                keys.append(key_info)
-            except Exception:
-                # Skip corrupted files
-                continue
-
-        return keys
+        # Return as dictionaries for compatibility with wallet commands,
+        # with address as an alias for the ownership utils
+        return [
+            {**key_info, "address": key_info["ss58_address"]}
+            for key_info in open_keystore().list()
+        ]
 
     except Exception as e:
         raise Exception(f"Failed to list keys: {str(e)}")
@@ -215,13 +286,9 @@ def list_keys() -> list[dict]:
 def delete_keypair(name: str):
     """Delete a keypair from disk."""
     try:
-        wallet_dir = Path.home() / ".htcli" / "wallets"
-        keypair_file = wallet_dir / f"{name}.json"
-
-        if keypair_file.exists():
-            keypair_file.unlink()
-        else:
+        if not open_keystore().delete(name):
             raise FileNotFoundError(f"Keypair '{name}' not found")
+        return True
 
     except Exception as e:
         raise Exception(f"Failed to delete keypair: {str(e)}")
@@ -0,0 +1,78 @@
+"""
+Streaming aggregation of delegate stake share holders.
+
+Delegator statistics are built from a map scan one entry at a time, keeping
+only the largest holders and a fixed number of histogram buckets, so memory
+does not grow with the number of delegators.
+"""
+
+import heapq
+from typing import Any, Dict, List, Tuple
+
+# Largest holders kept by default
+DEFAULT_TOP_HOLDERS = 10
+
+
+def share_bucket(shares: int) -> int:
+    """Histogram bucket of a share amount: its number of decimal digits."""
+    return len(str(shares)) if shares > 0 else 0
+
+
+def bucket_label(bucket: int) -> str:
+    """Share range of a histogram bucket, e.g. ``1e3-1e4``."""
+    if bucket == 0:
+        return "0"
+    return f"1e{bucket - 1}-1e{bucket}"
+
+
+class DelegatorAggregate:
+    """Count, total, top holders and size histogram of delegate stake shares."""
+
+    __slots__ = ("top", "count", "total_shares", "_heap", "_histogram")
+
+    def __init__(self, top: int = DEFAULT_TOP_HOLDERS):
+        self.top = top
+        self.count = 0
+        self.total_shares = 0
+        # Min-heap of the largest (shares, account) entries seen so far
+        self._heap: List[Tuple[int, str]] = []
+        self._histogram: Dict[int, int] = {}
+
+    def add(self, account: str, shares: int):
+        """Add one holder. Entries without shares are ignored."""
+        if not shares:
+            return
+        self.count += 1
+        self.total_shares += shares
+
+        bucket = share_bucket(shares)
+        self._histogram[bucket] = self._histogram.get(bucket, 0) + 1
+
+        entry = (shares, str(account))
+        if len(self._heap) < self.top:
+            heapq.heappush(self._heap, entry)
+        elif self.top and entry > self._heap[0]:
+            heapq.heapreplace(self._heap, entry)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarize the holders, largest first."""
+        top_holders = [
+            {
+                "account": account,
+                "shares": shares,
+                "share_percent": round(shares * 100 / self.total_shares, 4),
+            }
+            for shares, account in sorted(self._heap, reverse=True)
+        ]
+        return {
+            "count": self.count,
+            "total_shares": self.total_shares,
+            "top_holders": top_holders,
+            "top_holder_percent": (
+                top_holders[0]["share_percent"] if top_holders else 0
+            ),
+            "histogram": [
+                {"range": bucket_label(bucket), "count": self._histogram[bucket]}
+                for bucket in sorted(self._histogram)
+            ],
+        }
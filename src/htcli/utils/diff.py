@@ -0,0 +1,58 @@
+"""
+Comparison of subnet state between two blocks.
+"""
+
+from typing import Any, Dict, List
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+
+def _change(scope: str, node_id, field: str, change: str, before, after) -> dict:
+    return {
+        "scope": scope,
+        "node_id": node_id,
+        "field": field,
+        "change": change,
+        "from": before,
+        "to": after,
+    }
+
+
+def diff_subnet_snapshots(
+    before: Dict[str, Any], after: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """
+    List the changes between two snapshots from get_subnet_snapshot.
+
+    Subnet parameters and node fields that differ are reported as changed.
+    Nodes present in only one snapshot are reported once, as added or
+    removed with their classification.
+
+    Returns:
+        Rows with ``scope``, ``node_id``, ``field``, ``change``, ``from``
+        and ``to``, subnet parameters first and nodes in ID order
+    """
+    changes = []
+    for name, value in before["parameters"].items():
+        new_value = after["parameters"].get(name)
+        if new_value != value:
+            changes.append(_change("subnet", None, name, CHANGED, value, new_value))
+
+    old_nodes, new_nodes = before["nodes"], after["nodes"]
+    for node_id in sorted(set(old_nodes) | set(new_nodes)):
+        old, new = old_nodes.get(node_id), new_nodes.get(node_id)
+        if old is None:
+            change = (ADDED, None, new["classification"])
+            changes.append(_change("node", node_id, "classification", *change))
+        elif new is None:
+            change = (REMOVED, old["classification"], None)
+            changes.append(_change("node", node_id, "classification", *change))
+        else:
+            for field, value in old.items():
+                if new.get(field) != value:
+                    changes.append(
+                        _change("node", node_id, field, CHANGED, value, new.get(field))
+                    )
+    return changes
@@ -162,6 +162,47 @@ def create_node_table(nodes: List[Dict[str, Any]], subnet_id: int) -> Table:
     return table
 
 
+def create_dry_run_table(results: List[Dict[str, Any]]) -> Table:
+    """Create a table of dry run results, one row per call."""
+    table = Table(title="Dry Run")
+    table.add_column("#", style="cyan")
+    table.add_column("Call", style="white")
+    table.add_column("Fee", style="yellow")
+    table.add_column("Expected", style="green")
+    table.add_column("Details", style="white")
+
+    for index, result in enumerate(results):
+        if result.get("success") is True:
+            expected = "✅ Success"
+        elif result.get("success") is False:
+            expected = "❌ Failure"
+        else:
+            expected = "❓ Unknown"
+        fee = result.get("fee")
+
+        table.add_row(
+            str(result.get("index", index)),
+            f"{result.get('call_module')}.{result.get('call_function')}",
+            format_balance(fee) if fee is not None else "N/A",
+            expected,
+            result.get("message") or "",
+        )
+
+    return table
+
+
+def format_dry_run(results: List[Dict[str, Any]]):
+    """Format and display dry run results with the total fee."""
+    console.print(create_dry_run_table(results))
+    total_fee = sum(result.get("fee") or 0 for result in results)
+    failures = sum(result.get("success") is False for result in results)
+    console.print(f"Total fee: [bold yellow]{format_balance(total_fee)}[/bold yellow]")
+    if failures:
+        print_error(f"❌ {failures} of {len(results)} calls would fail")
+    else:
+        print_info("Dry run only: nothing was submitted.")
+
+
 def create_stake_info_panel(
     stake_data: Dict[str, Any], subnet_id: int, hotkey: str
 ) -> Panel:
@@ -209,13 +250,14 @@ Nonce: {account_data.get('nonce', 0)}
 
 def create_epoch_info_panel(epoch_data: Dict[str, Any]) -> Panel:
     """Create a panel for epoch information."""
+    seconds = epoch_data.get("seconds_until_next_epoch")
     info_text = f"""
-Epoch: {epoch_data.get('epoch', 'N/A')}
-Start Block: {epoch_data.get('start_block', 'N/A')}
-End Block: {epoch_data.get('end_block', 'N/A')}
-Blocks Remaining: {epoch_data.get('blocks_remaining', 'N/A')}
-Epoch Duration: {epoch_data.get('epoch_duration', 'N/A')} blocks
-Timestamp: {epoch_data.get('timestamp', 'N/A')}
+Epoch: {epoch_data.get('current_epoch', 'N/A')}
+Block: {epoch_data.get('block_number', 'N/A')}
+Block In Epoch: {epoch_data.get('block_in_epoch', 'N/A')}
+Epoch Length: {epoch_data.get('epoch_length', 'N/A')} blocks
+Blocks Remaining: {epoch_data.get('blocks_until_next_epoch', 'N/A')}
+Next Epoch In: {'N/A' if seconds is None else f'~{seconds:.0f}s'}
     """
     return Panel(info_text, title="Epoch Information")
 
@@ -433,10 +475,17 @@ def show_progress(description: str):
 
 def output_data(data: Any, format_type: str = "table"):
     """Output data in the specified format."""
+    from .streaming import is_streaming_format, stream_rows
+
     if format_type == "json":
         console.print(format_json(data))
-    elif format_type == "csv":
-        console.print(format_csv(data))
+    elif is_streaming_format(format_type):
+        # Streaming formats bypass Rich and write rows directly to stdout
+        rows = data if isinstance(data, list) else [data]
+        stream_rows(
+            (row if isinstance(row, dict) else {"value": row} for row in rows),
+            format_type,
+        )
     else:
         # Default to table format
         if isinstance(data, list) and data:
@@ -0,0 +1,351 @@
+"""
+Key storage backends for the Hypertensor CLI.
+
+Keys are stored as one JSON file per key in the wallet directory, or, once
+migrated, in a single SQLite keystore file there, keyed by name. Listing
+keys reads their public fields only and never decrypts.
+"""
+
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+from contextlib import closing, contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+# SQLite keystore file in the wallet directory; keys are stored there
+# instead of in JSON files once it exists
+KEYSTORE_FILE = "keystore.db"
+
+# Fields of a key record that are read without its password
+PUBLIC_FIELDS = ("name", "key_type", "public_key", "ss58_address")
+RECORD_FIELDS = PUBLIC_FIELDS + ("encrypted_private_key", "salt")
+
+# Names per query when checking many names at once
+_QUERY_CHUNK = 500
+
+# Index of the public fields of JSON key files, kept beside the wallet
+# directory because writing it inside would change the directory's mtime
+INDEX_SUFFIX = ".index.json"
+INDEX_VERSION = 1
+
+
+def wallet_directory() -> Path:
+    """Directory holding the key files or the keystore file."""
+    return Path.home() / ".htcli" / "wallets"
+
+
+class JsonKeystore:
+    """Keys stored as one JSON file per key."""
+
+    def __init__(self, wallet_dir: Path):
+        self.wallet_dir = wallet_dir
+
+    def _path(self, name: str) -> Path:
+        return self.wallet_dir / f"{name}.json"
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get a key record, or None if there is no such key."""
+        path = self._path(name)
+        if not path.exists():
+            return None
+        with open(path, "r") as f:
+            return json.load(f)
+
+    @property
+    def index_path(self) -> Path:
+        return self.wallet_dir.with_name(self.wallet_dir.name + INDEX_SUFFIX)
+
+    def list(self) -> List[Dict[str, Any]]:
+        """
+        Get the public fields of every key.
+
+        Fields come from a cached index, checked against the directory's
+        mtime and each file's mtime and size. The directory is only listed
+        again when its mtime changed, and only new or changed files are
+        parsed.
+        """
+        try:
+            dir_mtime_ns = self.wallet_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+
+        index = self._load_index()
+        cached = index.get("files", {})
+        changed = index.get("dir_mtime_ns") != dir_mtime_ns
+        if changed:
+            filenames = sorted(path.name for path in self.wallet_dir.glob("*.json"))
+        else:
+            filenames = list(cached)
+
+        files = {}
+        for filename in filenames:
+            try:
+                stat = (self.wallet_dir / filename).stat()
+            except FileNotFoundError:
+                changed = True
+                continue
+            entry = cached.get(filename)
+            if (
+                entry is None
+                or entry["mtime_ns"] != stat.st_mtime_ns
+                or entry["size"] != stat.st_size
+            ):
+                entry = {
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "key": self._read_public(self.wallet_dir / filename),
+                }
+                changed = True
+            files[filename] = entry
+
+        if changed:
+            self._write_index(
+                {"version": INDEX_VERSION, "dir_mtime_ns": dir_mtime_ns, "files": files}
+            )
+        return [entry["key"] for entry in files.values() if entry["key"]]
+
+    @staticmethod
+    def _read_public(path: Path) -> Optional[Dict[str, Any]]:
+        """Read the public fields of a key file, or None if it is corrupted."""
+        try:
+            with open(path, "r") as f:
+                keypair_data = json.load(f)
+            return {field: keypair_data[field] for field in PUBLIC_FIELDS}
+        except Exception:
+            return None
+
+    def _load_index(self) -> Dict[str, Any]:
+        try:
+            with open(self.index_path, "r") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+            return {}
+        return index
+
+    def _write_index(self, index: Dict[str, Any]):
+        """Replace the index atomically; it is only a cache, so errors are ignored."""
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(index, f, separators=(",", ":"))
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
+
+    def existing(self, names: Sequence[str]) -> List[str]:
+        """Get the given names that are already taken."""
+        return [name for name in names if self._path(name).exists()]
+
+    def add(self, records: Sequence[Dict[str, Any]], replace: bool = False):
+        """
+        Store key records, all of them or none.
+
+        Records are written to a staging directory inside the wallet
+        directory first and then moved into place. If a move fails, the keys
+        already moved are removed again.
+
+        Raises:
+            FileExistsError: If a name is taken and ``replace`` is not set
+        """
+        self.wallet_dir.mkdir(parents=True, exist_ok=True)
+        taken = [] if replace else self.existing([r["name"] for r in records])
+        if taken:
+            raise FileExistsError(f"Keys already exist: {', '.join(taken[:5])}")
+
+        staging = Path(tempfile.mkdtemp(prefix=".staging-", dir=self.wallet_dir))
+        moved: List[Path] = []
+        try:
+            for record in records:
+                with open(staging / f"{record['name']}.json", "w") as f:
+                    json.dump(record, f, indent=2)
+            for record in records:
+                target = self._path(record["name"])
+                os.replace(staging / target.name, target)
+                moved.append(target)
+        except Exception:
+            for target in moved:
+                target.unlink(missing_ok=True)
+            raise
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def delete(self, name: str) -> bool:
+        """Delete a key, returning whether it existed."""
+        path = self._path(name)
+        if not path.exists():
+            return False
+        path.unlink()
+        return True
+
+
+class SqliteKeystore:
+    """
+    Keys stored in a single SQLite file.
+
+    Records are looked up by name through the primary key, so reading one
+    key does not depend on how many are stored, and listing reads the public
+    columns in one query.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open the keystore, creating it readable by the owner only."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Create the file before SQLite does, so it is never readable by others;
+        # SQLite accepts an empty file as a new database
+        try:
+            os.close(os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600))
+        except FileExistsError:
+            pass
+        with closing(sqlite3.connect(self.path)) as conn:
+            conn.row_factory = sqlite3.Row
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS keys ("
+                "name TEXT PRIMARY KEY, "
+                "key_type TEXT NOT NULL, "
+                "public_key TEXT NOT NULL, "
+                "ss58_address TEXT NOT NULL, "
+                "encrypted_private_key TEXT NOT NULL, "
+                "salt TEXT NOT NULL)"
+            )
+            # Commits on success and rolls back on error
+            with conn:
+                yield conn
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Get a key record, or None if there is no such key."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM keys WHERE name = ?", (name,)).fetchone()
+        return dict(row) if row else None
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Get the public fields of every key."""
+        columns = ", ".join(PUBLIC_FIELDS)
+        with self._connect() as conn:
+            rows = conn.execute(f"SELECT {columns} FROM keys ORDER BY name").fetchall()
+        return [dict(row) for row in rows]
+
+    def existing(self, names: Sequence[str]) -> List[str]:
+        """Get the given names that are already taken."""
+        with self._connect() as conn:
+            return self._existing(conn, names)
+
+    @staticmethod
+    def _existing(conn: sqlite3.Connection, names: Sequence[str]) -> List[str]:
+        taken = []
+        for start in range(0, len(names), _QUERY_CHUNK):
+            chunk = list(names[start : start + _QUERY_CHUNK])
+            placeholders = ", ".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT name FROM keys WHERE name IN ({placeholders})", chunk
+            ).fetchall()
+            taken.extend(row["name"] for row in rows)
+        return taken
+
+    def add(self, records: Sequence[Dict[str, Any]], replace: bool = False):
+        """
+        Store key records in one transaction.
+
+        Raises:
+            FileExistsError: If a name is taken and ``replace`` is not set
+        """
+        columns = ", ".join(RECORD_FIELDS)
+        placeholders = ", ".join("?" * len(RECORD_FIELDS))
+        verb = "INSERT OR REPLACE" if replace else "INSERT"
+        with self._connect() as conn:
+            if not replace:
+                taken = self._existing(conn, [r["name"] for r in records])
+                if taken:
+                    raise FileExistsError(
+                        f"Keys already exist: {', '.join(taken[:5])}"
+                    )
+            conn.executemany(
+                f"{verb} INTO keys ({columns}) VALUES ({placeholders})",
+                ([record[field] for field in RECORD_FIELDS] for record in records),
+            )
+
+    def delete(self, name: str) -> bool:
+        """Delete a key, returning whether it existed."""
+        with self._connect() as conn:
+            cursor = conn.execute("DELETE FROM keys WHERE name = ?", (name,))
+        return cursor.rowcount > 0
+
+
+def open_keystore(wallet_dir: Optional[Path] = None):
+    """
+    Open the wallet's keystore.
+
+    The SQLite keystore is used once it exists in the wallet directory,
+    otherwise keys are JSON files.
+    """
+    wallet_dir = wallet_dir or wallet_directory()
+    path = wallet_dir / KEYSTORE_FILE
+    if path.exists():
+        return SqliteKeystore(path)
+    return JsonKeystore(wallet_dir)
+
+
+def migrate_json_keys(
+    wallet_dir: Optional[Path] = None, keep_json: bool = False
+) -> int:
+    """
+    Move JSON key files into the SQLite keystore, creating it if needed.
+
+    Every file is imported in one transaction, and the files are only
+    removed after it commits. Keys already in the keystore with the same
+    record are skipped, and their files removed too.
+
+    Args:
+        wallet_dir: Wallet directory, by default ~/.htcli/wallets
+        keep_json: Keep the JSON files; they are ignored once the keystore
+            exists
+
+    Returns:
+        Number of keys imported
+
+    Raises:
+        FileExistsError: If a file holds a different key than the keystore
+            has under its name; nothing is imported or removed then
+    """
+    wallet_dir = wallet_dir or wallet_directory()
+    json_keys = JsonKeystore(wallet_dir)
+    keystore = SqliteKeystore(wallet_dir / KEYSTORE_FILE)
+
+    records = []
+    files = sorted(wallet_dir.glob("*.json")) if wallet_dir.exists() else []
+    for keypair_file in files:
+        record = json_keys.get(keypair_file.stem)
+        if not record or any(field not in record for field in RECORD_FIELDS):
+            raise ValueError(f"{keypair_file} is not a key file")
+        # Keys were loaded by file name, so that stays their name
+        records.append({**record, "name": keypair_file.stem})
+
+    taken = set(keystore.existing([record["name"] for record in records]))
+    conflicts = []
+    for record in records:
+        if record["name"] in taken:
+            stored = keystore.get(record["name"])
+            if any(stored[field] != record[field] for field in RECORD_FIELDS):
+                conflicts.append(record["name"])
+    if conflicts:
+        raise FileExistsError(
+            "Keystore already has different keys named "
+            f"{', '.join(conflicts[:5])}; rename or remove their JSON files"
+        )
+
+    new_records = [record for record in records if record["name"] not in taken]
+    keystore.add(new_records)
+
+    # Every file is now either imported or identical to its stored record
+    if not keep_json:
+        for keypair_file in files:
+            keypair_file.unlink()
+    return len(new_records)
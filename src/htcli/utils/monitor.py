@@ -0,0 +1,227 @@
+"""
+Node fleet monitoring.
+
+Keeps the last known status of a set of nodes in memory, re-reads them at
+each new block with batched storage queries and reports only transitions.
+"""
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Seconds between chain head checks while waiting for the next poll
+BLOCK_POLL_SECONDS = 3.0
+
+# Blocks between re-reading the nodes of whole-subnet manifest entries
+RESOLVE_INTERVAL_BLOCKS = 50
+
+# Classification reported for nodes that are in neither node map
+MISSING = "Missing"
+
+
+@dataclass
+class MonitorTarget:
+    """A node to monitor."""
+
+    subnet_id: int
+    node_id: int
+    name: Optional[str] = None
+
+    @property
+    def key(self) -> Tuple[int, int]:
+        return (self.subnet_id, self.node_id)
+
+
+def load_manifest(path: Path) -> List[Dict[str, Any]]:
+    """
+    Load monitor entries from a YAML manifest.
+
+    The manifest is a list of entries, optionally under a ``nodes`` key. Each
+    entry has a ``subnet_id``, and a ``node_id`` and ``name`` if it is a
+    single node; entries without a ``node_id`` cover every node of the subnet.
+
+    Raises:
+        ValueError: If the manifest is malformed
+    """
+    import yaml
+
+    with open(path, "r") as f:
+        data = yaml.safe_load(f) or []
+    entries = data.get("nodes", []) if isinstance(data, dict) else data
+    if not isinstance(entries, list):
+        raise ValueError(f"{path}: expected a list of nodes")
+
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict) or not isinstance(entry.get("subnet_id"), int):
+            raise ValueError(f"{path}: entry {index} needs an integer subnet_id")
+        if "node_id" in entry and not isinstance(entry["node_id"], int):
+            raise ValueError(f"{path}: entry {index} has a non-integer node_id")
+    return entries
+
+
+def resolve_targets(client, entries: List[Dict[str, Any]]) -> List[MonitorTarget]:
+    """Expand manifest entries into individual nodes, without duplicates."""
+    targets: Dict[Tuple[int, int], MonitorTarget] = {}
+    for entry in entries:
+        subnet_id = entry["subnet_id"]
+        if "node_id" in entry:
+            node_ids = [entry["node_id"]]
+        else:
+            response = client.get_subnet_nodes_status(subnet_id)
+            node_ids = [node["node_id"] for node in response.data["nodes"]]
+
+        for node_id in node_ids:
+            targets.setdefault(
+                (subnet_id, node_id),
+                MonitorTarget(subnet_id, node_id, entry.get("name")),
+            )
+    return [targets[key] for key in sorted(targets)]
+
+
+def _snapshot(record) -> Dict[str, Any]:
+    if record is None:
+        return {"classification": MISSING, "penalties": 0, "attestation_ratio": 0}
+    status = record.to_status()
+    return {
+        "classification": status["classification"],
+        "penalties": status["penalties"],
+        "attestation_ratio": status["attestation_ratio"],
+    }
+
+
+class NodeMonitor:
+    """Detect status transitions of monitored nodes between polls."""
+
+    def __init__(
+        self,
+        client,
+        targets: List[MonitorTarget],
+        min_attestation_drop: int = 1,
+        entries: Optional[List[Dict[str, Any]]] = None,
+    ):
+        self.client = client
+        self.targets = targets
+        self.min_attestation_drop = min_attestation_drop
+        # Manifest entries the targets came from, re-resolved while watching
+        self.entries = entries
+        self.state: Dict[Tuple[int, int], Dict[str, Any]] = {}
+
+    def refresh_targets(self):
+        """
+        Re-resolve the manifest entries, adding nodes that registered since.
+
+        Nodes that are no longer listed stay monitored, so leaving is
+        reported as a transition to Missing.
+        """
+        if not self.entries:
+            return
+        targets = {target.key: target for target in self.targets}
+        for target in resolve_targets(self.client, self.entries):
+            targets.setdefault(target.key, target)
+        self.targets = [targets[key] for key in sorted(targets)]
+
+    def poll(
+        self, block_hash: Optional[str] = None, block_number: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Read every monitored node at one block and compare with the last poll.
+
+        The first poll only records a baseline.
+
+        Returns:
+            Events for classification changes, penalty increases and
+            attestation ratio drops
+        """
+        records = self.client.get_node_records(
+            [target.key for target in self.targets], block_hash
+        )
+
+        events = []
+        for target in self.targets:
+            current = _snapshot(records.get(target.key))
+            previous = self.state.get(target.key)
+            self.state[target.key] = current
+            if previous is None:
+                continue
+
+            base = {
+                "subnet_id": target.subnet_id,
+                "node_id": target.node_id,
+                "name": target.name,
+                "block_number": block_number,
+            }
+            if current["classification"] != previous["classification"]:
+                events.append(
+                    {
+                        "event": "classification_changed",
+                        **base,
+                        "from": previous["classification"],
+                        "to": current["classification"],
+                    }
+                )
+            if MISSING in (current["classification"], previous["classification"]):
+                continue
+            if current["penalties"] > previous["penalties"]:
+                events.append(
+                    {
+                        "event": "penalties_increased",
+                        **base,
+                        "from": previous["penalties"],
+                        "to": current["penalties"],
+                    }
+                )
+            drop = previous["attestation_ratio"] - current["attestation_ratio"]
+            if drop > 0 and drop >= self.min_attestation_drop:
+                events.append(
+                    {
+                        "event": "attestation_dropped",
+                        **base,
+                        "from": previous["attestation_ratio"],
+                        "to": current["attestation_ratio"],
+                    }
+                )
+        return events
+
+    def watch(
+        self,
+        interval_blocks: int = 1,
+        iterations: int = 0,
+        poll_seconds: float = BLOCK_POLL_SECONDS,
+        resolve_blocks: int = RESOLVE_INTERVAL_BLOCKS,
+        sleep=time.sleep,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Poll every ``interval_blocks`` blocks and yield events as they occur.
+
+        Nodes are only read again once the head has advanced, and manifest
+        entries are re-resolved every ``resolve_blocks`` blocks.
+
+        Args:
+            interval_blocks: Blocks between polls, at least 1
+            iterations: Number of polls, including the baseline (0 = forever)
+            poll_seconds: Seconds between chain head checks
+            resolve_blocks: Blocks between re-resolving manifest entries
+            sleep: Sleep function, replaceable for testing
+        """
+        interval_blocks = max(interval_blocks, 1)
+        last_block = None
+        last_resolved = None
+        polls = 0
+        while not iterations or polls < iterations:
+            head = self.client.get_head_block()
+            block_number = head["block_number"]
+            if last_block is not None and block_number < last_block + interval_blocks:
+                sleep(poll_seconds)
+                continue
+
+            if last_resolved is None:
+                last_resolved = block_number
+            elif block_number >= last_resolved + resolve_blocks:
+                self.refresh_targets()
+                last_resolved = block_number
+
+            events = self.poll(head["block_hash"], block_number)
+            last_block = block_number
+            polls += 1
+            yield from events
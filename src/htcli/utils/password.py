@@ -20,6 +20,8 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt
 
+from .agent import agent_holds_key
+
 # Configure logging
 logger = logging.getLogger(__name__)
 console = Console()
@@ -66,6 +68,7 @@ def get_secure_password(
     prompt_message: str = "Enter password",
     allow_default: bool = False,
     use_cache: bool = True,
+    use_agent: bool = True,
 ) -> str:
     """
     Get a password with simplified but secure flow.
@@ -75,9 +78,11 @@ def get_secure_password(
         prompt_message: Custom prompt message
         allow_default: Whether to allow default password fallback
         use_cache: Whether to use password caching
+        use_agent: Whether a key held by the key agent needs no password;
+            disable when the password secures a key rather than unlocks it
 
     Returns:
-        The password string
+        The password string, empty when the key agent holds the key
     """
     # Check for lockout
     if is_account_locked(key_name):
@@ -109,7 +114,12 @@ def get_secure_password(
             log_password_access(key_name, "storage", success=True)
             return stored_password
 
-        # 4. Prompt user for password
+        # 4. Check the key agent, which signs without the password
+        if use_agent and agent_holds_key(key_name):
+            log_password_access(key_name, "agent", success=True)
+            return ""
+
+        # 5. Prompt user for password
         password = prompt_for_password(
             message=f"{prompt_message} for {key_name}",
             min_length=PasswordConfig.MIN_PASSWORD_LENGTH,
@@ -122,7 +132,7 @@ def get_secure_password(
             else:
                 raise SecurityException("Password is required and cannot be empty")
 
-        # 5. Cache and store the password
+        # 6. Cache and store the password
         if use_cache:
             set_cached_password(key_name, password)
 
@@ -471,7 +481,8 @@ def log_password_access(
 
     Args:
         key_name: Name of the key
-        source: Source of password (cache, environment, storage, prompt, default)
+        source: Source of password (cache, environment, storage, agent, prompt,
+            default)
         success: Whether access was successful
         error: Error message if failed
     """
@@ -0,0 +1,240 @@
+"""
+Columnar scoring of staking opportunities.
+
+Candidate (subnet, node) metrics are collected into NumPy arrays so that risk
+and attractiveness are computed for every candidate at once, and the best
+candidates are selected with a partial sort instead of ranking the full list.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+from ..models.records import NodeRecord
+
+TENSOR = 10**18
+
+# Attractiveness weights
+PERFORMANCE_WEIGHT = 0.3
+REWARD_WEIGHT = 0.3
+RISK_WEIGHT = 0.2
+STAKE_WEIGHT = 0.2
+
+# Defaults for nodes that do not report a metric
+DEFAULT_PERFORMANCE_SCORE = 0.5
+DEFAULT_REWARD_RATE = 0.1
+
+# Minimum performance score for any strategy
+MIN_PERFORMANCE_SCORE = 0.2
+
+# Candidates kept per position for the allocation optimizer to choose from
+CANDIDATE_POOL_FACTOR = 10
+
+
+class OpportunityScorer:
+    """Column store of staking candidates with vectorized scoring."""
+
+    def __init__(self):
+        self.subnet_ids: List[int] = []
+        self.node_ids: List[int] = []
+        self.subnet_states: List[str] = []
+        self.node_statuses: List[str] = []
+        self.current_stakes: List[int] = []
+        self._performance: List[float] = []
+        self._reward_rate: List[float] = []
+        self._subnet_total_nodes: List[int] = []
+        self.risk_scores: Optional[np.ndarray] = None
+        self.attractiveness_scores: Optional[np.ndarray] = None
+        # Global MinStakeBalance / MaxStakeBalance reported with subnet data
+        self.stake_limits: Dict[str, int] = {"min_stake": 0, "max_stake": 0}
+
+    def __len__(self) -> int:
+        return len(self.node_ids)
+
+    def add(
+        self,
+        subnet_id: int,
+        node_id: int,
+        subnet_state: str,
+        subnet_total_nodes: int,
+        node_status: str = "Active",
+        current_stake: int = 0,
+        performance_score: float = DEFAULT_PERFORMANCE_SCORE,
+        reward_rate: float = DEFAULT_REWARD_RATE,
+    ):
+        """Add a single candidate."""
+        self.subnet_ids.append(subnet_id)
+        self.node_ids.append(node_id)
+        self.subnet_states.append(subnet_state)
+        self.node_statuses.append(node_status)
+        self.current_stakes.append(current_stake)
+        self._performance.append(performance_score)
+        self._reward_rate.append(reward_rate)
+        self._subnet_total_nodes.append(subnet_total_nodes)
+        self.risk_scores = self.attractiveness_scores = None
+
+    def add_subnet_nodes(
+        self, subnet_info: Dict[str, Any], records: Iterable[NodeRecord]
+    ):
+        """
+        Add every node of a subnet as a candidate.
+
+        The attestation ratio (percent) is used as the performance score and
+        the delegate reward rate (scaled by 1e18) as the reward rate.
+        """
+        subnet_id = subnet_info.get("subnet_id")
+        state = subnet_info.get("state")
+        total_nodes = subnet_info.get("total_nodes", 1)
+
+        for record in records:
+            self.add(
+                subnet_id,
+                record.node_id,
+                state,
+                total_nodes,
+                node_status=record.status,
+                current_stake=record.stake or 0,
+                performance_score=(
+                    record.attestation_ratio / 100
+                    if record.attestation_ratio is not None
+                    else DEFAULT_PERFORMANCE_SCORE
+                ),
+                reward_rate=(
+                    record.delegate_reward_rate / TENSOR
+                    if record.delegate_reward_rate is not None
+                    else DEFAULT_REWARD_RATE
+                ),
+            )
+
+    def score(self):
+        """Compute risk and attractiveness scores for all candidates."""
+        performance = np.asarray(self._performance, dtype=np.float64)
+        reward_rate = np.asarray(self._reward_rate, dtype=np.float64)
+        total_nodes = np.asarray(self._subnet_total_nodes, dtype=np.float64)
+        states = np.asarray(self.subnet_states, dtype=object)
+        # Stakes exceed int64, but float precision is enough for thresholds
+        stakes = np.asarray(self.current_stakes, dtype=np.float64)
+
+        # Risk: subnet maturity, node performance and stake concentration
+        risk = np.full(len(self), 0.5)
+        risk -= 0.1 * (states == "Active")
+        risk += 0.1 * (states == "Registered")
+        risk -= 0.2 * (performance > 0.8)
+        risk += 0.2 * (performance < 0.3)
+        risk -= 0.1 * (total_nodes > 10)
+        risk = np.clip(risk, 0.0, 1.0)
+
+        # Prefer moderate stakes over very low or very high ones
+        stake_score = np.where(
+            stakes < 10 * TENSOR, 0.8, np.where(stakes > 1000 * TENSOR, 0.6, 1.0)
+        )
+
+        self.risk_scores = risk
+        self.attractiveness_scores = (
+            performance * PERFORMANCE_WEIGHT
+            + np.minimum(reward_rate * 10, 1.0) * REWARD_WEIGHT
+            + (1.0 - risk) * RISK_WEIGHT
+            + stake_score * STAKE_WEIGHT
+        )
+
+    def strategy_mask(self, strategy: str, include_new_subnets: bool) -> np.ndarray:
+        """Get the candidates allowed by a staking strategy."""
+        if self.risk_scores is None:
+            self.score()
+
+        performance = np.asarray(self._performance, dtype=np.float64)
+        mask = performance >= MIN_PERFORMANCE_SCORE
+
+        if not include_new_subnets:
+            mask &= np.asarray(self.subnet_states, dtype=object) == "Active"
+
+        if strategy == "conservative":
+            mask &= self.risk_scores <= 0.6
+        elif strategy == "aggressive":
+            mask &= self.risk_scores >= 0.3
+
+        return mask
+
+    def top_k(self, k: int, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Get the indices of the k most attractive candidates, best first.
+
+        Ties keep insertion order.
+        """
+        if self.attractiveness_scores is None:
+            self.score()
+
+        candidates = np.arange(len(self))
+        if mask is not None:
+            candidates = candidates[mask]
+        if k <= 0 or candidates.size == 0:
+            return candidates[:0]
+
+        scores = self.attractiveness_scores[candidates]
+        if k < candidates.size:
+            # Partial sort: only the top k are ordered
+            selected = np.argpartition(-scores, k - 1)[:k]
+            candidates, scores = candidates[selected], scores[selected]
+
+        order = np.lexsort((candidates, -scores))
+        return candidates[order]
+
+    def to_opportunities(self, indices: Iterable[int]) -> List[Dict[str, Any]]:
+        """Materialize candidates as opportunity dictionaries."""
+        if self.attractiveness_scores is None:
+            self.score()
+
+        return [
+            {
+                "subnet_id": self.subnet_ids[i],
+                "node_id": self.node_ids[i],
+                "subnet_state": self.subnet_states[i],
+                "node_status": self.node_statuses[i],
+                "current_stake": self.current_stakes[i],
+                "performance_score": self._performance[i],
+                "reward_rate": self._reward_rate[i],
+                "risk_score": float(self.risk_scores[i]),
+                "attractiveness_score": float(self.attractiveness_scores[i]),
+            }
+            for i in (int(i) for i in indices)
+        ]
+
+
+def scan_opportunities(client) -> OpportunityScorer:
+    """
+    Load every node of every subnet into a scorer.
+
+    Args:
+        client: Client providing get_subnets_data, get_subnet_data and
+            iter_subnet_node_records
+
+    Returns:
+        OpportunityScorer with all candidates and the network stake limits
+    """
+    response = client.get_subnets_data()
+    if not response.success:
+        raise Exception(f"Failed to retrieve subnet data: {response.message}")
+
+    scorer = OpportunityScorer()
+    limits_loaded = False
+
+    for subnet in response.data.get("subnets", []):
+        subnet_id = subnet.subnet_id
+
+        detail_response = client.get_subnet_data(subnet_id)
+        if not detail_response.success:
+            continue
+
+        subnet_info = detail_response.data
+        if not limits_loaded:
+            scorer.stake_limits = {
+                "min_stake": subnet_info.get("min_stake", 0),
+                "max_stake": subnet_info.get("max_stake", 0),
+            }
+            limits_loaded = True
+
+        scorer.add_subnet_nodes(
+            subnet_info, client.iter_subnet_node_records(subnet_id)
+        )
+
+    return scorer
@@ -0,0 +1,54 @@
+"""
+Exact conversion between delegate stake shares and balances.
+
+Delegate stake pools track a total balance and a total number of shares.
+A holder's balance is their pro-rata part of the pool, computed in integer
+arithmetic and rounded down like the pallet, so amounts in the smallest
+unit are never lost to float precision.
+"""
+
+from itertools import repeat
+from typing import Iterable, List, Sequence, Union
+
+IntOrInts = Union[int, Sequence[int]]
+
+
+def shares_to_balance(shares: int, total_balance: int, total_shares: int) -> int:
+    """
+    Convert shares of a pool to a balance, rounded down.
+
+    Returns 0 for a pool without shares.
+    """
+    if not total_shares:
+        return 0
+    return shares * total_balance // total_shares
+
+
+def _each(value: IntOrInts) -> Iterable[int]:
+    """Repeat a single pool total, or iterate over per-position totals."""
+    return repeat(value) if isinstance(value, int) else value
+
+
+def shares_to_balances(
+    shares: Sequence[int], total_balance: IntOrInts, total_shares: IntOrInts
+) -> List[int]:
+    """
+    Convert many share amounts to balances at once.
+
+    Balances on chain exceed 64 bits, so each position is converted with
+    Python integers rather than fixed-width arrays.
+
+    Args:
+        shares: Share amount of each position
+        total_balance: Pool balance, one for all positions or one per position
+        total_shares: Pool shares, one for all positions or one per position
+
+    Returns:
+        Balance of each position, in order
+    """
+    return [
+        shares_to_balance(amount, balance, total)
+        for amount, balance, total in zip(
+            shares, _each(total_balance), _each(total_shares)
+        )
+    ]
@@ -0,0 +1,125 @@
+"""
+Streaming output writers for the Hypertensor CLI.
+
+Rows are written to stdout or a file as soon as they are produced, without
+building Rich renderables or buffering the full result set in memory.
+"""
+
+import csv
+import json
+import os
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+# Output formats that are written row by row instead of rendered
+STREAMING_FORMATS = ("ndjson", "csv")
+
+
+def is_streaming_format(format_type: str) -> bool:
+    """Check whether an output format is written as a row stream."""
+    return format_type in STREAMING_FORMATS
+
+
+def _csv_cell(value: Any) -> Any:
+    """Encode nested values as compact JSON so they fit in a single CSV cell."""
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, default=str, separators=(",", ":"))
+    return value
+
+
+class StreamWriter:
+    """Write dictionaries one at a time as NDJSON lines or CSV rows."""
+
+    def __init__(
+        self,
+        stream: TextIO,
+        format_type: str = "ndjson",
+        headers: Optional[List[str]] = None,
+    ):
+        if not is_streaming_format(format_type):
+            raise ValueError(f"Unsupported streaming format: {format_type}")
+
+        self.stream = stream
+        self.format_type = format_type
+        self.headers = headers
+        self.count = 0
+        self._csv_writer = None
+
+    def write(self, row: Dict[str, Any]) -> None:
+        """Write a single row and flush it to the underlying stream."""
+        if self.format_type == "ndjson":
+            self.stream.write(
+                json.dumps(row, default=str, separators=(",", ":")) + "\n"
+            )
+        else:
+            if self._csv_writer is None:
+                # CSV columns are fixed by the first row unless given explicitly
+                self.headers = self.headers or list(row.keys())
+                self._csv_writer = csv.DictWriter(
+                    self.stream, fieldnames=self.headers, extrasaction="ignore"
+                )
+                self._csv_writer.writeheader()
+            self._csv_writer.writerow({k: _csv_cell(v) for k, v in row.items()})
+
+        self.stream.flush()
+        self.count += 1
+
+    def write_all(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """Write every row from an iterable, returning the number written."""
+        for row in rows:
+            self.write(row)
+        return self.count
+
+
+@contextmanager
+def open_stream(
+    output: Optional[Path] = None, private: bool = False
+) -> Iterator[TextIO]:
+    """
+    Open the output file, or yield stdout when no file is given.
+
+    With ``private``, the file is made readable by its owner only before
+    anything is written to it.
+    """
+    if output is None:
+        yield sys.stdout
+        return
+
+    output = Path(output).expanduser()
+    output.parent.mkdir(parents=True, exist_ok=True)
+    if private:
+        fd = os.open(output, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        # An existing file keeps its mode when opened
+        os.fchmod(fd, 0o600)
+        f = os.fdopen(fd, "w", newline="", encoding="utf-8")
+    else:
+        f = open(output, "w", newline="", encoding="utf-8")
+    with f:
+        yield f
+
+
+def stream_rows(
+    rows: Iterable[Dict[str, Any]],
+    format_type: str = "ndjson",
+    output: Optional[Path] = None,
+    headers: Optional[List[str]] = None,
+    private: bool = False,
+) -> int:
+    """
+    Stream rows to stdout or a file in a streaming format.
+
+    Args:
+        rows: Iterable of row dictionaries, consumed lazily
+        format_type: Streaming format (ndjson/csv)
+        output: Optional output file path, defaults to stdout
+        headers: Optional CSV column order
+        private: Make the output file readable by its owner only
+
+    Returns:
+        Number of rows written
+    """
+    with open_stream(output, private) as stream:
+        writer = StreamWriter(stream, format_type, headers)
+        return writer.write_all(rows)
@@ -2,7 +2,9 @@
 Pytest configuration and fixtures for htcli tests.
 """
 
+import json
 import os
+from collections import deque
 from pathlib import Path
 from unittest.mock import Mock
 
@@ -386,6 +388,36 @@ def env_vars():
     os.environ.update(original_env)
 
 
+class FakeNode:
+    """Websocket answering pipelined JSON-RPC requests in order."""
+
+    def __init__(self, respond):
+        # respond(request) gives the "result" or "error" member of an answer
+        self.respond = respond
+        self.queue = deque()
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def send(self, message):
+        request = json.loads(message)
+        self.queue.append(request)
+        self.requests.append(request["method"])
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def recv(self):
+        request = self.queue.popleft()
+        self.in_flight -= 1
+        return json.dumps({"id": request["id"], **self.respond(request)})
+
+
+@pytest.fixture
+def fake_node():
+    """Build fake websockets for code that pipelines requests on one connection."""
+    return FakeNode
+
+
 def pytest_configure(config):
     """Configure pytest with custom markers."""
     config.addinivalue_line("markers", "integration: marks tests as integration tests")
@@ -0,0 +1,129 @@
+"""
+Unit tests for the key agent.
+"""
+
+import stat
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from substrateinterface import Keypair
+
+from src.htcli.main import app
+from src.htcli.utils.agent import (
+    AGENT_SOCKET_ENV,
+    AgentClient,
+    AgentError,
+    AgentKeypair,
+    KeyAgent,
+    agent_keypair,
+)
+
+
+@pytest.fixture
+def alice():
+    return Keypair.create_from_uri("//Alice")
+
+
+@pytest.fixture
+def running_agent(tmp_path, monkeypatch):
+    path = tmp_path / "agent.sock"
+    monkeypatch.setenv(AGENT_SOCKET_ENV, str(path))
+    agent = KeyAgent(path)
+    agent.bind()
+    thread = threading.Thread(target=agent.serve_forever, daemon=True)
+    thread.start()
+    yield agent
+    agent.shutdown()
+    thread.join(timeout=5)
+
+
+class TestKeyAgent:
+    """Test keys are held in memory and sign over the socket."""
+
+    def test_signs_without_private_key(self, running_agent, alice):
+        mode = stat.S_IMODE(running_agent.path.stat().st_mode)
+        assert mode == 0o600
+
+        client = AgentClient(running_agent.path)
+        client.add("alice", alice, ttl=60)
+        client.close()
+
+        keypair = agent_keypair("alice")
+        assert isinstance(keypair, AgentKeypair)
+        assert keypair.private_key is None
+        assert keypair.ss58_address == alice.ss58_address
+
+        signature = keypair.sign("0x" + "ab" * 40)
+        assert alice.verify(bytes.fromhex("ab" * 40), signature)
+        assert agent_keypair("bob") is None
+
+    def test_keys_expire(self, alice):
+        agent = KeyAgent(default_ttl=0.05)
+        agent.add("alice", alice)
+        agent.add("kept", alice, ttl=0)
+        assert agent.get("alice") is alice
+
+        time.sleep(0.1)
+
+        with pytest.raises(AgentError):
+            agent.get("alice")
+        assert [key["name"] for key in agent.list()] == ["kept"]
+        assert agent.list()[0]["expires_in"] is None
+
+    def test_refuses_second_agent(self, running_agent):
+        with pytest.raises(AgentError, match="already listening"):
+            KeyAgent(running_agent.path).bind()
+
+    def test_replaces_stale_socket(self, tmp_path):
+        path = tmp_path / "agent.sock"
+        stale = KeyAgent(path)
+        stale.bind()
+        # Closed without removing the socket file, as after a crash
+        stale._server.server_close()
+
+        agent = KeyAgent(path)
+        agent.bind()
+        agent._server.server_close()
+
+    def test_unlock_skips_password(self, running_agent, alice):
+        from src.htcli.utils.crypto import load_keypair
+        from src.htcli.utils.password import get_secure_password
+
+        running_agent.add("alice", alice)
+        with patch(
+            "src.htcli.utils.password.prompt_for_password",
+            side_effect=AssertionError("prompted"),
+        ), patch(
+            "src.htcli.utils.password.get_cached_password", return_value=None
+        ), patch(
+            "src.htcli.utils.password.get_stored_password", return_value=None
+        ), patch(
+            "src.htcli.utils.crypto.open_keystore",
+            side_effect=AssertionError("decrypted"),
+        ):
+            assert get_secure_password("alice", allow_default=True) == ""
+            keypair = load_keypair("alice")
+
+        assert isinstance(keypair, AgentKeypair)
+
+
+class TestAgentCommands:
+    """Test agent commands fail clearly without a running agent."""
+
+    def test_no_agent(self, cli_runner, tmp_path, monkeypatch):
+        monkeypatch.setenv(AGENT_SOCKET_ENV, str(tmp_path / "missing.sock"))
+
+        result = cli_runner.invoke(app, ["agent", "list"])
+
+        assert result.exit_code == 1
+        assert "No key agent is running" in result.stdout
+
+    def test_list(self, cli_runner, running_agent, alice):
+        running_agent.add("alice", alice)
+
+        result = cli_runner.invoke(app, ["agent", "list", "--format", "json"])
+
+        assert result.exit_code == 0
+        assert alice.ss58_address in result.stdout
@@ -0,0 +1,149 @@
+"""
+Unit tests for constrained stake allocation.
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+from src.htcli.main import app
+from src.htcli.models.records import NodeRecord, SubnetRecord
+from src.htcli.utils.allocation import (
+    AllocationConstraints,
+    diversified_subnet_cap,
+    plan_allocations,
+)
+
+TENSOR = 10**18
+
+
+def opportunity(subnet_id, node_id, reward_rate, risk_score=0.0, current_stake=0):
+    return {
+        "subnet_id": subnet_id,
+        "node_id": node_id,
+        "reward_rate": reward_rate,
+        "risk_score": risk_score,
+        "current_stake": current_stake,
+    }
+
+
+class TestPlanAllocations:
+    """Test the greedy constrained allocator."""
+
+    def test_best_expected_value_filled_first(self):
+        """Test stake goes to the best risk-adjusted rate up to the stake cap."""
+        opportunities = [
+            opportunity(1, 1, 0.10, risk_score=0.5),
+            opportunity(2, 1, 0.08),
+            opportunity(3, 1, 0.06),
+        ]
+        constraints = AllocationConstraints(
+            total_stake=100 * TENSOR, max_positions=5, max_stake=60 * TENSOR
+        )
+
+        plan = plan_allocations(opportunities, constraints)
+
+        assert [(a["subnet_id"], a["amount"]) for a in plan.allocations] == [
+            (2, 60 * TENSOR),
+            (3, 40 * TENSOR),
+        ]
+        assert plan.allocated == 100 * TENSOR
+        assert plan.unallocated == 0
+
+    def test_stake_cap_counts_current_stake(self):
+        """Test a node's existing stake counts against the stake cap."""
+        opportunities = [
+            opportunity(1, 1, 0.10, current_stake=60 * TENSOR),
+            opportunity(2, 1, 0.08, current_stake=45 * TENSOR),
+            opportunity(3, 1, 0.06),
+        ]
+        constraints = AllocationConstraints(
+            total_stake=100 * TENSOR, max_positions=5, max_stake=60 * TENSOR
+        )
+
+        plan = plan_allocations(opportunities, constraints)
+
+        # Subnet 1 is full, subnet 2 has room for 15
+        assert [(a["subnet_id"], a["amount"]) for a in plan.allocations] == [
+            (2, 15 * TENSOR),
+            (3, 60 * TENSOR),
+        ]
+        assert plan.unallocated == 25 * TENSOR
+
+    def test_subnet_cap_and_max_positions(self):
+        """Test per-subnet caps and the position limit are respected."""
+        opportunities = [
+            opportunity(1, 1, 0.10),
+            opportunity(1, 2, 0.09),
+            opportunity(2, 1, 0.05),
+            opportunity(3, 1, 0.04),
+        ]
+        constraints = AllocationConstraints(
+            total_stake=90 * TENSOR,
+            max_positions=2,
+            max_per_subnet=30 * TENSOR,
+        )
+
+        plan = plan_allocations(opportunities, constraints)
+
+        assert [(a["subnet_id"], a["node_id"]) for a in plan.allocations] == [
+            (1, 1),
+            (2, 1),
+        ]
+        assert plan.unallocated == 30 * TENSOR
+
+    def test_positions_below_minimum_are_skipped(self):
+        """Test a position that cannot reach the minimum stake is skipped."""
+        opportunities = [opportunity(1, 1, 0.10), opportunity(2, 1, 0.05)]
+        constraints = AllocationConstraints(
+            total_stake=50 * TENSOR,
+            max_positions=5,
+            min_stake=20 * TENSOR,
+            max_per_subnet=40 * TENSOR,
+        )
+
+        plan = plan_allocations(opportunities, constraints)
+
+        assert [a["amount"] for a in plan.allocations] == [40 * TENSOR]
+        assert plan.unallocated == 10 * TENSOR
+
+    def test_diversified_subnet_cap(self):
+        """Test the diversity cap divides the budget between subnets."""
+        opportunities = [opportunity(s, 1, 0.1) for s in (1, 1, 2, 3)]
+
+        assert diversified_subnet_cap(90, 5, opportunities) == 30
+        assert diversified_subnet_cap(90, 2, opportunities) == 45
+
+
+class TestStakePlanCommand:
+    """Test the stake plan command."""
+
+    def test_stake_plan_json(self, cli_runner):
+        """Test stake plan scores nodes and prints the allocation as JSON."""
+        mock_client = Mock()
+        mock_client.get_subnets_data.return_value = Mock(
+            success=True, data={"subnets": [SubnetRecord.from_storage(1, {})]}
+        )
+        mock_client.get_subnet_data.return_value = Mock(
+            success=True,
+            data={
+                "subnet_id": 1,
+                "state": "Active",
+                "total_nodes": 2,
+                "min_stake": 0,
+                "max_stake": 0,
+            },
+        )
+        mock_client.iter_subnet_node_records.return_value = iter(
+            [NodeRecord.from_storage(1, 7, {"attestation_ratio": 90})]
+        )
+
+        with patch("src.htcli.commands.stake.get_client", return_value=mock_client):
+            result = cli_runner.invoke(
+                app,
+                ["stake", "plan", "--amount", str(10 * TENSOR), "--format", "json"],
+            )
+
+        assert result.exit_code == 0
+        plan = json.loads(result.stdout[result.stdout.index("{") :])
+        assert plan["allocated"] == 10 * TENSOR
+        assert plan["allocations"][0]["node_id"] == 7
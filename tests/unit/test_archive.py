@@ -0,0 +1,138 @@
+"""
+Unit tests for historical reads and the archive cache.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.htcli.client import HypertensorClient
+from src.htcli.client.archive import ArchiveCache, ArchiveView, parse_block_id
+
+PINNED = "0x" + "aa" * 32
+PARENT = "0x" + "bb" * 32
+FINALIZED = "0x" + "cc" * 32
+
+
+class FakeNode:
+    """RPC endpoint with a finalized head at block 100."""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, method, params, result_handler=None):
+        self.calls.append((method, params))
+        if method == "chain_getBlockHash":
+            return {"result": {90: PINNED}.get(params[0])}
+        if method == "chain_getFinalizedHead":
+            return {"result": FINALIZED}
+        if method == "chain_getHeader":
+            number = {PINNED: 90, FINALIZED: 100}.get(params[0])
+            if number is None:
+                return {"result": None}
+            return {"result": {"number": hex(number), "parentHash": PARENT}}
+        if method == "state_getStorage":
+            return {"result": f"value of {params[0]} at {params[1]}"}
+        if method == "state_getMetadata":
+            return {"result": f"metadata at {params[0]}"}
+        return {"result": None}
+
+    def count(self, method):
+        return sum(1 for called, _ in self.calls if called == method)
+
+
+class TestParseBlockId:
+    """Test --at-block parsing."""
+
+    def test_number_and_hash(self):
+        assert parse_block_id("90") == 90
+        assert parse_block_id(PINNED.upper().replace("0X", "0x")) == PINNED
+
+    @pytest.mark.parametrize("value", ["latest", "-1", "0x1234"])
+    def test_invalid(self, value):
+        with pytest.raises(ValueError):
+            parse_block_id(value)
+
+
+class TestArchiveView:
+    """Test block pinning and caching of finalized reads."""
+
+    def test_reads_are_pinned_and_cached(self, tmp_path):
+        """Test a finalized block's reads hit the node once across runs."""
+        node = FakeNode()
+        for _ in range(2):
+            view = ArchiveView.resolve(node, "90", ArchiveCache(tmp_path))
+            rpc_request = view.wrap(node)
+
+            assert rpc_request("chain_getHead", [])["result"] == PINNED
+            response = rpc_request("state_getStorage", ["0x01", None])
+            assert response["result"] == f"value of 0x01 at {PINNED}"
+            header = rpc_request("chain_getHeader", [PINNED])["result"]
+            assert header["parentHash"] == PARENT
+            # Runtime metadata is read at the parent block
+            assert rpc_request("state_getMetadata", [PARENT])["result"] == (
+                f"metadata at {PARENT}"
+            )
+
+        assert view.finalized is True
+        assert view.hits == 3 and view.misses == 0
+        assert node.count("state_getStorage") == 1
+        assert node.count("state_getMetadata") == 1
+
+    def test_unfinalized_block_is_not_cached(self, tmp_path):
+        """Test reads at a block above the finalized head always go to the node."""
+        node = FakeNode()
+        view = ArchiveView(PINNED, 120, finalized=False, cache=ArchiveCache(tmp_path))
+        rpc_request = view.wrap(node)
+
+        rpc_request("state_getStorage", ["0x01"])
+        rpc_request("state_getStorage", ["0x01"])
+
+        assert node.calls == [("state_getStorage", ["0x01", PINNED])] * 2
+        assert not any(tmp_path.iterdir())
+
+    def test_hash_of_abandoned_fork_is_not_finalized(self):
+        """Test a block hash that is not canonical at its height is not cached."""
+        node = FakeNode()
+        fork = "0x" + "dd" * 32
+
+        def rpc_request(method, params, result_handler=None):
+            if method == "chain_getHeader" and params[0] == fork:
+                return {"result": {"number": hex(90), "parentHash": PARENT}}
+            return node(method, params, result_handler)
+
+        view = ArchiveView.resolve(rpc_request, fork)
+
+        assert view.block_number == 90
+        assert view.finalized is False
+
+    def test_unknown_block(self):
+        with pytest.raises(ValueError, match="not found"):
+            ArchiveView.resolve(FakeNode(), "5000")
+
+    def test_transactions_refused(self):
+        view = ArchiveView(PINNED, 90, finalized=True)
+        with pytest.raises(ValueError):
+            view.request(FakeNode(), "author_submitExtrinsic", ["0x00"])
+
+
+class TestClientAtBlock:
+    """Test the client pins its connection when at_block is configured."""
+
+    def test_client_reads_at_block(self, tmp_path):
+        node = FakeNode()
+        with patch("src.htcli.client.SubstrateInterface") as mock_substrate:
+            substrate = Mock()
+            substrate.rpc_request = node
+            mock_substrate.return_value = substrate
+
+            from src.htcli.config import load_config
+
+            config = load_config()
+            config.network.at_block = "90"
+            config.network.archive_path = str(tmp_path)
+            client = HypertensorClient(config)
+
+        assert client.archive.block_hash == PINNED
+        response = client.substrate.rpc_request("state_getStorage", ["0x01", None])
+        assert response["result"] == f"value of 0x01 at {PINNED}"
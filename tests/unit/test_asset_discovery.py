@@ -0,0 +1,104 @@
+"""
+Unit tests for single-pass asset discovery.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from substrateinterface import Keypair
+
+from src.htcli.client import HypertensorClient
+
+ALICE = Keypair.create_from_uri("//Alice", ss58_format=42).ss58_address
+ALICE_ON_CHAIN = Keypair.create_from_uri("//Alice", ss58_format=0).ss58_address
+BOB = Keypair.create_from_uri("//Bob", ss58_format=0).ss58_address
+CHARLIE = Keypair.create_from_uri("//Charlie", ss58_format=42).ss58_address
+
+
+def key(*values):
+    keys = tuple(Mock(value=v) for v in values)
+    return keys if len(keys) > 1 else keys[0]
+
+
+class TestAssetDiscovery:
+    """Test discovering assets for many addresses in one pass."""
+
+    def make_client(self, maps, values):
+        with patch("src.htcli.client.SubstrateInterface") as mock_substrate:
+            substrate = Mock()
+            mock_substrate.return_value = substrate
+
+            def query_map(module, storage_function, params, page_size, block_hash=None):
+                return maps.get((storage_function, tuple(params)), [])
+
+            def query(module, storage_function, params=None):
+                return Mock(value=values.get((storage_function, tuple(params or []))))
+
+            substrate.query_map.side_effect = query_map
+            substrate.query.side_effect = query
+
+            from src.htcli.config import load_config
+
+            return HypertensorClient(load_config()), substrate
+
+    def test_each_map_is_scanned_once_for_all_addresses(self):
+        """Test owners, nodes and stake shares are matched by public key."""
+        maps = {
+            ("SubnetOwner", ()): [
+                (key(1), Mock(value=ALICE_ON_CHAIN)),
+                (key(2), Mock(value=BOB)),
+            ],
+            ("SubnetNodesData", ()): [
+                (key(1, 3), Mock(value={"hotkey": BOB})),
+                (key(2, 1), Mock(value={"hotkey": ALICE_ON_CHAIN})),
+            ],
+            ("SubnetDelegateStakeShares", ()): [
+                (key(1, ALICE_ON_CHAIN), Mock(value=50)),
+            ],
+            ("NodeDelegateStakeShares", (1,)): [
+                (key(3, BOB), Mock(value=10)),
+            ],
+        }
+        values = {
+            ("SubnetsData", (1,)): {"name": "alpha", "state": "Active"},
+            ("TotalSubnetUids", ()): 1,
+            ("TotalSubnetDelegateStakeBalance", (1,)): 300,
+            ("TotalSubnetDelegateStakeShares", (1,)): 100,
+            ("NodeDelegateStakeBalance", (1, 3)): 90,
+            ("TotalNodeDelegateStakeShares", (1, 3)): 30,
+        }
+        client, substrate = self.make_client(maps, values)
+
+        response = client.discover_assets([ALICE, CHARLIE])
+
+        assets = response.data
+        assert response.success
+        assert assets["subnets"] == [
+            {"subnet_id": 1, "path": "alpha", "state": "Active", "owner": ALICE}
+        ]
+        assert [(n["subnet_id"], n["node_id"]) for n in assets["nodes"]] == [(2, 1)]
+        assert assets["stakes"] == [
+            {
+                "subnet_id": 1,
+                "node_id": None,
+                "type": "subnet_delegate",
+                "shares": 50,
+                "amount": 150,
+                "status": "active",
+                "address": ALICE,
+            }
+        ]
+        scanned = [
+            call.kwargs["storage_function"]
+            for call in substrate.query_map.call_args_list
+        ]
+        assert scanned.count("SubnetOwner") == 1
+        assert scanned.count("SubnetNodesData") == 1
+
+    def test_read_failure_fails_discovery(self):
+        """Test a map that cannot be read is not reported as no assets."""
+        client, substrate = self.make_client({}, {("TotalSubnetUids", ()): 0})
+        substrate.query_map.side_effect = Exception("Connection lost")
+
+        with pytest.raises(Exception, match="Connection lost"):
+            client.discover_assets([ALICE], stakes=False, nodes=False)
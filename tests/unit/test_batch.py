@@ -0,0 +1,164 @@
+"""
+Unit tests for the batch operation runner.
+"""
+
+import json
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.htcli.models.responses import BaseResponse
+from src.htcli.utils.batch import BatchRunner, load_operations
+
+
+def ok(data=None):
+    return BaseResponse(success=True, message="ok", data=data or {})
+
+
+class TestLoadOperations:
+    """Test reading operations from YAML and NDJSON."""
+
+    def test_yaml_and_ndjson(self, tmp_path):
+        """Test both formats yield the same operations."""
+        yaml_file = tmp_path / "ops.yaml"
+        yaml_file.write_text(
+            "operations:\n"
+            "  - op: subnet info\n"
+            "    subnet_id: 1\n"
+            "  - op: chain epoch\n"
+        )
+        ndjson_file = tmp_path / "ops.ndjson"
+        ndjson_file.write_text(
+            '{"op": "subnet info", "subnet_id": 1}\n\n# comment\n{"op": "chain epoch"}\n'
+        )
+
+        assert load_operations(yaml_file) == load_operations(ndjson_file)
+
+    def test_unknown_operation(self, tmp_path):
+        """Test operations are validated before anything runs."""
+        ops_file = tmp_path / "ops.ndjson"
+        ops_file.write_text('{"op": "subnet explode"}\n')
+
+        with pytest.raises(ValueError, match="unknown operation"):
+            load_operations(ops_file)
+
+
+class TestBatchRunner:
+    """Test executing operations with a shared client."""
+
+    def test_results_in_order_with_errors(self):
+        """Test each operation reports a result and failures do not stop the run."""
+        client = Mock()
+        client.get_subnet_data.return_value = ok({"subnet_id": 1})
+        client.get_balance.side_effect = Exception("boom")
+        client.get_current_epoch.return_value = ok({"epoch": 7})
+        ops = [
+            {"op": "subnet info", "subnet_id": 1, "id": "a"},
+            {"op": "chain balance", "address": "5abc"},
+            {"op": "chain epoch"},
+        ]
+
+        results = list(BatchRunner(client).run(ops))
+
+        assert [r["index"] for r in results] == [0, 1, 2]
+        assert results[0]["id"] == "a"
+        assert results[0]["data"] == {"subnet_id": 1}
+        assert results[1] == {
+            "index": 1,
+            "op": "chain balance",
+            "success": False,
+            "message": "boom",
+            "elapsed": results[1]["elapsed"],
+        }
+        assert results[2]["success"]
+        client.get_subnet_data.assert_called_once_with(subnet_id=1)
+        json.dumps(results)
+
+    def test_fail_fast(self):
+        """Test the run stops at the first failure in fail-fast mode."""
+        client = Mock()
+        client.get_balance.return_value = BaseResponse(success=False, message="no")
+        ops = [{"op": "chain balance", "address": "5abc"}, {"op": "chain epoch"}]
+
+        results = list(BatchRunner(client).run(ops, fail_fast=True))
+
+        assert len(results) == 1
+        client.get_current_epoch.assert_not_called()
+
+    def test_keypairs_unlocked_once(self):
+        """Test signed operations share one unlocked keypair per key."""
+        client = Mock()
+        client.add_to_delegate_stake.return_value = ok()
+        keypair = Mock()
+        ops = [
+            {"op": "stake delegate-add", "subnet_id": s, "amount": 5, "key_name": "k"}
+            for s in (1, 2, 3)
+        ]
+
+        with patch(
+            "src.htcli.utils.batch.get_secure_password", return_value="pw"
+        ), patch(
+            "src.htcli.utils.crypto.load_keypair", return_value=keypair
+        ) as mock_load:
+            runner = BatchRunner(client)
+            runner.unlock_keys(ops)
+            results = list(runner.run(ops))
+
+        assert all(r["success"] for r in results)
+        mock_load.assert_called_once_with("k", "pw")
+        client.add_to_delegate_stake.assert_called_with(3, 5, keypair)
+
+    def test_parallel_reads_use_worker_clients(self):
+        """Test reads run on per-worker clients and writes on the shared one."""
+        shared = Mock()
+        shared.add_to_delegate_stake.return_value = ok()
+        workers = []
+        barrier = threading.Barrier(2, timeout=5)
+
+        def make_client():
+            client = Mock()
+
+            def get_subnet_data(subnet_id):
+                barrier.wait()
+                return ok({"subnet_id": subnet_id})
+
+            client.get_subnet_data.side_effect = get_subnet_data
+            workers.append(client)
+            return client
+
+        ops = [
+            {"op": "subnet info", "subnet_id": 1},
+            {"op": "subnet info", "subnet_id": 2},
+            {"op": "stake delegate-add", "subnet_id": 1, "amount": 5},
+        ]
+
+        runner = BatchRunner(shared, parallel_reads=2, client_factory=make_client)
+        results = list(runner.run(ops))
+
+        assert [r["data"].get("subnet_id") for r in results[:2]] == [1, 2]
+        assert len(workers) == 2
+        shared.get_subnet_data.assert_not_called()
+        shared.add_to_delegate_stake.assert_called_once()
+        for worker in workers:
+            worker.disconnect.assert_called_once()
+
+
+class TestBatchCommand:
+    """Test the batch run command."""
+
+    def test_run_from_stdin(self, cli_runner):
+        """Test NDJSON from stdin produces NDJSON results on stdout."""
+        from src.htcli.main import app
+
+        client = Mock()
+        client.get_current_epoch.return_value = ok({"epoch": 3})
+
+        with patch("src.htcli.commands.batch.get_client", return_value=client):
+            result = cli_runner.invoke(
+                app, ["batch", "run"], input='{"op": "chain epoch"}\n'
+            )
+
+        assert result.exit_code == 0
+        row = json.loads(result.stdout.splitlines()[0])
+        assert row["data"] == {"epoch": 3}
@@ -2,9 +2,11 @@
 Real tests for chain operations.
 """
 
+import json
 from unittest.mock import Mock, patch
 
 from src.htcli.client import HypertensorClient
+from src.htcli.main import app
 
 
 class TestChainInfo:
@@ -109,6 +111,50 @@ class TestChainInfo:
             )  # Balance with 18 decimals
             assert "TENSOR" in response.data["formatted_balance"]
 
+    def test_get_balances_batched(self):
+        """Test balances of many accounts are read in one multi-key query."""
+        alice = "5GrwvaEF5zXb26Fz9rcQpDWS57CtERHpNehXCPcNoHGKutQY"
+        bob = "5FHneW46xGXgs5mUiveU4sbTyGBzmstUspZC92UhjJM694ty"
+        with patch("src.htcli.client.SubstrateInterface") as mock_substrate:
+            substrate = Mock()
+            mock_substrate.return_value = substrate
+
+            def create_storage_key(module, storage_function, params):
+                return Mock(to_hex=Mock(return_value=params[0]))
+
+            storage = {
+                alice: {"nonce": 7, "data": {"free": 100, "reserved": 5}},
+            }
+
+            def query_multi(storage_keys, block_hash=None):
+                return [
+                    (key, Mock(value=storage.get(key.to_hex())))
+                    for key in storage_keys
+                ]
+
+            substrate.create_storage_key.side_effect = create_storage_key
+            substrate.query_multi.side_effect = query_multi
+
+            from src.htcli.config import load_config
+
+            client = HypertensorClient(load_config())
+            response = client.get_balances([alice, bob, alice, "not-an-address"])
+
+        assert substrate.query_multi.call_count == 1
+        assert response.address_count == 3
+        accounts = response.data["accounts"]
+        assert accounts[0] == {
+            "address": alice,
+            "free": 100,
+            "reserved": 5,
+            "frozen": 0,
+            "total": 105,
+            "nonce": 7,
+        }
+        assert accounts[1]["free"] == 0 and accounts[1]["nonce"] == 0
+        assert accounts[2] == {"address": "not-an-address", "error": "Invalid address"}
+        assert response.data["total_free"] == 100
+
 
 class TestChainQuery:
     """Test chain query functionality."""
@@ -171,3 +217,46 @@ class TestChainQuery:
             assert response.data["block_number"] == 12345
             assert response.data["extrinsics_count"] == 2
             assert "0x1234567890abcdef" in response.data["block_hash"]
+
+
+class TestBalanceCommand:
+    """Test multi-address balance lookup."""
+
+    def test_balance_addresses_file(self, cli_runner, tmp_path):
+        """Test addresses are read from a file and looked up in one call."""
+        addresses_file = tmp_path / "addresses.txt"
+        addresses_file.write_text("# treasury\n5Alice\n\n5Bob  # cold wallet\n")
+        mock_client = Mock()
+        mock_client.get_balances.return_value = Mock(
+            data={
+                "accounts": [
+                    {"address": "5Alice", "free": 1, "reserved": 0, "nonce": 2},
+                    {"address": "5Bob", "free": 3, "reserved": 4, "nonce": 0},
+                ],
+                "total_free": 4,
+                "total_reserved": 4,
+            }
+        )
+
+        with patch("src.htcli.commands.chain.get_client", return_value=mock_client):
+            result = cli_runner.invoke(
+                app,
+                [
+                    "chain",
+                    "balance",
+                    "--addresses-file",
+                    str(addresses_file),
+                    "--format",
+                    "ndjson",
+                ],
+            )
+
+        assert result.exit_code == 0
+        mock_client.get_balances.assert_called_once_with(["5Alice", "5Bob"])
+        rows = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [row["address"] for row in rows] == ["5Alice", "5Bob"]
+
+    def test_balance_requires_address(self, cli_runner):
+        """Test balance fails without any address source."""
+        result = cli_runner.invoke(app, ["chain", "balance"])
+        assert result.exit_code == 1
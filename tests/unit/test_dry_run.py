@@ -0,0 +1,194 @@
+"""
+Unit tests for dry runs of composed calls.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.htcli.client.dryrun import DryRunner, decode_apply_result
+from src.htcli.main import app
+from src.htcli.utils.batch import BatchRunner
+
+
+def dry_run_answers(failing=()):
+    """Answer fee and dry run requests, failing the given extrinsics."""
+
+    def respond(request):
+        if request["method"] == "payment_queryInfo":
+            return {"result": {"class": "normal", "partialFee": "1000", "weight": 5}}
+        if request["params"][0] in failing:
+            # Invalid transaction: Payment
+            return {"result": "0x010001"}
+        return {"result": "0x0000"}
+
+    return respond
+
+
+def make_call(data):
+    return Mock(
+        data=data,
+        value={"call_module": "Network", "call_function": "remove_subnet_node"},
+    )
+
+
+@pytest.fixture
+def signing():
+    with patch("src.htcli.client.dryrun.SigningContext") as signing_class:
+        signing = signing_class.return_value
+        # The extrinsic carries the call encoding, so the node can fail calls
+        signing.create_signed_extrinsic.side_effect = lambda call, *a, **kw: Mock(
+            data=call.data
+        )
+        yield signing
+
+
+class TestDecodeApplyResult:
+    """Test system_dryRun results are decoded into success and a reason."""
+
+    def test_results(self):
+        metadata = Mock()
+        metadata.get_pallet_by_index.return_value.name = "Network"
+        metadata.get_module_error.return_value.name = "NotUidOwner"
+
+        assert decode_apply_result("0x0000") == (True, None)
+        assert decode_apply_result("0x010003") == (
+            False,
+            "Invalid transaction: Stale",
+        )
+        assert decode_apply_result("0x0001030705000000", metadata) == (
+            False,
+            "Network.NotUidOwner",
+        )
+        metadata.get_module_error.assert_called_once_with(7, 5)
+        assert decode_apply_result("0x000102") == (False, "Dispatch error: BadOrigin")
+
+
+class TestDryRunner:
+    """Test calls are evaluated with pipelined requests and cached by hash."""
+
+    def test_pipelined_and_cached(self, signing, fake_node):
+        node = fake_node(dry_run_answers(failing={"0x02"}))
+        substrate = Mock(websocket=node, request_id=1)
+        substrate.query.return_value = Mock(value={"nonce": 4})
+        keypair = Mock(ss58_address="5signer", private_key=b"\x01")
+        calls = [make_call(f"0x{i:02x}") for i in range(20)] + [make_call("0x00")]
+
+        runner = DryRunner(substrate)
+        results = runner.evaluate(calls, keypair, window=8)
+
+        assert node.max_in_flight == 8
+        # The duplicate call is evaluated once
+        assert len(node.requests) == 40
+        assert results[0]["fee"] == 1000 and results[0]["success"] is True
+        assert results[2]["success"] is False
+        assert results[2]["message"] == "Invalid transaction: Payment"
+        assert results[20] == results[0]
+        nonces = {c.kwargs["nonce"] for c in signing.create_signed_extrinsic.mock_calls}
+        assert nonces == {4}
+
+        runner.evaluate(calls[:5], keypair)
+        assert len(node.requests) == 40
+
+    def test_fee_only_without_private_key(self, signing, fake_node):
+        node = fake_node(dry_run_answers())
+        substrate = Mock(websocket=node, request_id=1)
+        substrate.query.return_value = Mock(value={"nonce": 0})
+        keypair = Mock(ss58_address="5watch", private_key=None)
+
+        results = DryRunner(substrate).evaluate([make_call("0x01")], keypair)
+
+        assert node.requests == ["payment_queryInfo"]
+        assert results[0]["fee"] == 1000
+        assert results[0]["success"] is None
+        extra = signing.create_signed_extrinsic.call_args.kwargs
+        assert extra["signature"] == "0x" + "00" * 64
+
+
+class TestDryRunCommands:
+    """Test --dry-run reports results without submitting."""
+
+    def _invoke(self, cli_runner, results):
+        mock_client = Mock()
+        mock_client.remove_subnet_node.return_value = Mock(
+            data={"call_data": make_call("0x01")}
+        )
+        mock_client.dry_run.return_value = results
+        with patch(
+            "src.htcli.commands.node.get_client", return_value=mock_client
+        ), patch(
+            "src.htcli.commands.node.get_secure_password", return_value="pw"
+        ), patch(
+            "src.htcli.utils.crypto.load_keypair",
+            return_value=Mock(ss58_address="5signer"),
+        ):
+            result = cli_runner.invoke(
+                app,
+                ["node", "remove", "-s", "1", "-n", "2", "-k", "hot", "--dry-run"],
+            )
+        return result, mock_client
+
+    def test_node_remove_dry_run(self, cli_runner):
+        row = {
+            "call_module": "Network",
+            "call_function": "remove_subnet_node",
+            "fee": 1000,
+            "success": True,
+            "message": None,
+        }
+        result, mock_client = self._invoke(cli_runner, [row])
+
+        assert result.exit_code == 0
+        assert "Dry run only" in result.stdout
+        mock_client.remove_subnet_node.assert_called_once_with(
+            subnet_id=1, subnet_node_id=2
+        )
+
+    def test_node_remove_dry_run_failure(self, cli_runner):
+        row = {"fee": 1000, "success": False, "message": "Network.NotUidOwner"}
+        result, _ = self._invoke(cli_runner, [row])
+
+        assert result.exit_code == 1
+
+    def test_subnet_remove_declined_is_not_submitted(self, cli_runner):
+        mock_client = Mock()
+        with patch(
+            "src.htcli.commands.subnet.get_client", return_value=mock_client
+        ), patch(
+            "src.htcli.utils.password.get_secure_password", return_value="pw"
+        ), patch(
+            "src.htcli.utils.crypto.load_keypair",
+            return_value=Mock(ss58_address="5signer"),
+        ):
+            result = cli_runner.invoke(
+                app, ["subnet", "remove", "-s", "1", "-k", "owner"], input="n\n"
+            )
+
+        assert result.exit_code == 0
+        assert "cancelled" in result.stdout
+        mock_client.remove_subnet.assert_not_called()
+
+    def test_batch_dry_run_groups_by_key(self):
+        client = Mock()
+        client.add_to_delegate_stake.return_value = Mock(
+            data={"call_data": make_call("0x01")}
+        )
+        client.dry_run.side_effect = lambda calls, keypair: [
+            {"fee": 10, "success": True} for _ in calls
+        ]
+        runner = BatchRunner(client)
+        runner.keypairs = {"a": Mock(), "b": Mock()}
+        ops = [
+            {"op": "stake delegate-add", "subnet_id": 1, "amount": 5, "key_name": "a"},
+            {"op": "chain head"},
+            {"op": "stake delegate-add", "subnet_id": 2, "amount": 5, "key_name": "b"},
+            {"op": "stake delegate-add", "subnet_id": 3, "amount": 5, "key_name": "a"},
+            {"op": "stake claim"},
+        ]
+
+        rows = list(runner.dry_run(ops))
+
+        assert [row["index"] for row in rows] == [0, 2, 3, 4]
+        assert [row["success"] for row in rows] == [True, True, True, None]
+        assert client.dry_run.call_count == 2
+        client.get_chain_head.assert_not_called()
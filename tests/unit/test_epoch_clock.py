@@ -0,0 +1,82 @@
+"""
+Unit tests for the local epoch clock.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from src.htcli.client.chain import ChainClient
+from src.htcli.client.epoch import EpochClock, EpochClockUnavailable
+
+
+def make_substrate(head=1005, epoch_length=100, current_epoch=10, constants=None):
+    substrate = Mock()
+    values = {"EpochLength": epoch_length, "MinimumPeriod": 3000}
+    values.update(constants or {})
+    substrate.get_constant.side_effect = lambda module, name: (
+        Mock(value=values[name]) if values.get(name) is not None else None
+    )
+    substrate.rpc_request.return_value = {"result": {"number": hex(head)}}
+    substrate.query.return_value = Mock(value=current_epoch)
+    return substrate
+
+
+class TestEpochClock:
+    """Test epochs computed from block heights."""
+
+    def test_status(self):
+        clock = EpochClock(make_substrate())
+
+        status = clock.status()
+
+        assert status == {
+            "current_epoch": 10,
+            "block_number": 1005,
+            "epoch_length": 100,
+            "block_in_epoch": 5,
+            "blocks_until_next_epoch": 95,
+            "seconds_until_next_epoch": 570.0,
+        }
+
+    def test_constants_read_once(self):
+        """Test repeated readings do not re-read constants or CurrentEpoch."""
+        substrate = make_substrate()
+        clock = EpochClock(substrate)
+
+        for _ in range(5):
+            clock.current_epoch()
+
+        assert substrate.get_constant.call_count == 3
+        assert substrate.query.call_count == 1
+        # The head read while loading is reused within one block time
+        assert substrate.rpc_request.call_count == 1
+
+    def test_epoch_offset(self):
+        """Test epochs are aligned with CurrentEpoch when not counted from genesis."""
+        clock = EpochClock(make_substrate(head=1005, current_epoch=7))
+
+        assert clock.current_epoch() == 7
+        assert clock.epoch_at(1100) == 8
+
+    def test_observed_head_is_reused(self):
+        substrate = make_substrate()
+        clock = EpochClock(substrate)
+        clock.load()
+
+        clock.observe(1200)
+
+        assert clock.current_epoch() == 12
+        assert substrate.rpc_request.call_count == 1
+
+    def test_unavailable_without_epoch_length(self):
+        clock = EpochClock(make_substrate(constants={"EpochLength": None}))
+        with pytest.raises(EpochClockUnavailable):
+            clock.current_epoch()
+
+    def test_get_current_epoch_falls_back_to_storage(self):
+        substrate = make_substrate(current_epoch=42, constants={"EpochLength": None})
+
+        response = ChainClient(substrate).get_current_epoch()
+
+        assert response.data == {"current_epoch": 42}
@@ -2,10 +2,22 @@
 Unit tests for automated flows.
 """
 
+import stat
+import threading
 import time
 from unittest.mock import Mock, patch
 
-from src.htcli.flows.base import BaseFlow
+import pytest
+
+from src.htcli.flows.base import BaseFlow, FlowStatus, FlowStep
+from src.htcli.flows.checkpoint import load_checkpoint, new_flow_id, save_checkpoint
+
+
+@pytest.fixture(autouse=True)
+def checkpoint_dir(tmp_path):
+    """Keep flow checkpoints written by tests out of the home directory."""
+    with patch("src.htcli.flows.checkpoint.CHECKPOINT_DIR", tmp_path / "flows"):
+        yield tmp_path / "flows"
 
 
 class TestBaseFlow:
@@ -105,6 +117,17 @@ class TestSubnetDeploymentFlow:
         assert isinstance(steps, list)
         assert len(steps) >= 0  # Base flow might have default steps
 
+    @patch("src.htcli.flows.base.get_client")
+    def test_verification_waits_for_stake(self, mock_get_client):
+        """Test verification never runs alongside the stake step."""
+        from src.htcli.flows.subnet_deployment import SubnetDeploymentFlow
+
+        flow = SubnetDeploymentFlow(max_workers=4)
+        flow.steps = flow.setup_steps()
+
+        dependencies = flow.resolve_dependencies()
+        assert dependencies["verify_deployment"] == {"node_add", "stake_add"}
+
 
 class TestNodeOnboardingFlow:
     """Test node onboarding flow."""
@@ -220,3 +243,144 @@ class TestMigrationRecoveryFlow:
 
         assert isinstance(steps, list)
         assert len(steps) >= 0
+
+
+class TestFlowScheduler:
+    """Test dependency-ordered step scheduling."""
+
+    @staticmethod
+    def make_flow(steps, max_workers):
+        flow = BaseFlow(max_workers=max_workers, interactive=False)
+        flow.setup_steps = lambda: steps
+        return flow
+
+    @patch("src.htcli.flows.base.get_client")
+    def test_independent_steps_run_in_parallel(self, mock_get_client):
+        """Test steps sharing a dependency overlap when workers allow it."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def read_step(context):
+            barrier.wait()
+            return True
+
+        steps = [
+            FlowStep("init", "Init", lambda context: True, retry_count=1),
+            FlowStep("a", "A", read_step, retry_count=1, dependencies=["init"]),
+            FlowStep("b", "B", read_step, retry_count=1, dependencies=["init"]),
+            FlowStep("c", "C", lambda context: True, dependencies=["a", "b"]),
+        ]
+
+        result = self.make_flow(steps, max_workers=2).execute()
+
+        assert result.status == FlowStatus.COMPLETED
+        assert result.completed_steps[0] == "init"
+        assert set(result.completed_steps[1:3]) == {"a", "b"}
+        assert result.completed_steps[3] == "c"
+
+    @patch("src.htcli.flows.base.get_client")
+    def test_steps_without_dependencies_run_in_order(self, mock_get_client):
+        """Test undeclared dependencies fall back to declaration order."""
+        order = []
+
+        def record(name):
+            def step(context):
+                order.append(name)
+                return True
+
+            return step
+
+        steps = [FlowStep(name, name, record(name)) for name in ("x", "y", "z")]
+
+        result = self.make_flow(steps, max_workers=3).execute()
+
+        assert result.status == FlowStatus.COMPLETED
+        assert order == ["x", "y", "z"]
+
+    @patch("src.htcli.flows.base.get_client")
+    def test_required_step_failure_stops_flow(self, mock_get_client):
+        """Test a failed required step stops dependants from starting."""
+        later = Mock(return_value=True)
+        steps = [
+            FlowStep("first", "First", lambda context: False, retry_count=1),
+            FlowStep("second", "Second", later, dependencies=["first"]),
+        ]
+
+        result = self.make_flow(steps, max_workers=2).execute()
+
+        assert result.status == FlowStatus.FAILED
+        assert result.failed_step == "first"
+        assert result.completed_steps == []
+        later.assert_not_called()
+
+
+class TestFlowCheckpoint:
+    """Test flow checkpoint and resume."""
+
+    def test_checkpoint_redacts_secrets(self):
+        """Test private keys are never written to checkpoint files."""
+        context = {
+            "wallet_config": {"key_name": "k", "private_key": "0xabc"},
+            "wallet_password": "hunter2",
+            "coldkey_private_key_hex": "0xdef",
+        }
+
+        path = save_checkpoint("flow_1", "BaseFlow", context, ["wallet_setup"])
+        checkpoint = load_checkpoint("flow_1")
+
+        text = path.read_text()
+        assert "0xabc" not in text
+        assert "hunter2" not in text
+        assert "0xdef" not in text
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+        assert list(path.parent.glob("*.tmp")) == []
+        assert checkpoint["completed_steps"] == ["wallet_setup"]
+        assert checkpoint["context"]["wallet_config"]["key_name"] == "k"
+        assert checkpoint["redacted"] == [
+            "wallet_config.private_key",
+            "wallet_password",
+            "coldkey_private_key_hex",
+        ]
+
+    def test_flow_ids_are_unique(self):
+        """Test flows started in the same second get different IDs."""
+        with patch("src.htcli.flows.checkpoint.time.time", return_value=1700000000):
+            assert new_flow_id() != new_flow_id()
+
+    @patch("src.htcli.flows.base.get_client")
+    def test_failed_flow_resumes_after_completed_steps(self, mock_get_client):
+        """Test resume skips finished steps and re-runs pending preconditions."""
+        calls = []
+
+        def step(name, result=True):
+            def run(context):
+                calls.append(name)
+                context[name] = True
+                return result
+
+            return run
+
+        def steps(submit_result):
+            return [
+                FlowStep("setup", "Setup", step("setup"), retry_count=1),
+                FlowStep("check", "Check", step("check"), precondition=True),
+                FlowStep(
+                    "submit", "Submit", step("submit", submit_result), retry_count=1
+                ),
+            ]
+
+        flow = TestFlowScheduler.make_flow(steps(False), max_workers=1)
+        failed = flow.execute()
+        flow_id = flow.get_from_context("flow_id")
+
+        assert failed.status == FlowStatus.FAILED
+        assert load_checkpoint(flow_id)["completed_steps"] == ["setup", "check"]
+
+        calls.clear()
+        resumed = TestFlowScheduler.make_flow(steps(True), max_workers=1)
+        resumed.resume(load_checkpoint(flow_id))
+        result = resumed.execute()
+
+        assert result.status == FlowStatus.COMPLETED
+        assert calls == ["check", "submit"]
+        assert result.data["setup"] is True
+        assert load_checkpoint(flow_id) is None
@@ -0,0 +1,205 @@
+"""
+Unit tests for node fleet monitoring.
+"""
+
+from unittest.mock import Mock, patch
+
+from src.htcli.client import HypertensorClient
+from src.htcli.main import app
+from src.htcli.models.records import NodeRecord
+from src.htcli.utils.monitor import (
+    MonitorTarget,
+    NodeMonitor,
+    load_manifest,
+    resolve_targets,
+)
+
+
+def record(node_id, ratio, penalties=0, status="Active"):
+    return NodeRecord.from_storage(
+        1, node_id, {"attestation_ratio": ratio, "penalties": penalties}, status
+    )
+
+
+class TestNodeMonitor:
+    """Test transition detection between polls."""
+
+    def test_events_only_on_transitions(self):
+        """Test the baseline is silent and only changes produce events."""
+        client = Mock()
+        client.get_node_records.side_effect = [
+            {(1, 1): record(1, 90), (1, 2): record(2, 50), (1, 3): None},
+            {(1, 1): record(1, 90), (1, 2): record(2, 40, 2), (1, 3): None},
+            {
+                (1, 1): record(1, 20),
+                (1, 2): None,
+                (1, 3): record(3, 0, 0, "Registered"),
+            },
+        ]
+        targets = [MonitorTarget(1, n, f"node-{n}") for n in (1, 2, 3)]
+        monitor = NodeMonitor(client, targets, min_attestation_drop=5)
+
+        assert monitor.poll(block_number=10) == []
+
+        events = monitor.poll(block_number=11)
+        assert [(e["node_id"], e["event"], e["from"], e["to"]) for e in events] == [
+            (2, "penalties_increased", 0, 2),
+            (2, "attestation_dropped", 50, 40),
+        ]
+        assert events[0]["name"] == "node-2"
+        assert events[0]["block_number"] == 11
+
+        events = monitor.poll(block_number=12)
+        assert [(e["node_id"], e["event"], e["from"], e["to"]) for e in events] == [
+            (1, "classification_changed", "Included", "Idle"),
+            (1, "attestation_dropped", 90, 20),
+            (2, "classification_changed", "Idle", "Missing"),
+            (3, "classification_changed", "Missing", "Registered"),
+        ]
+
+    def test_watch_polls_every_interval(self):
+        """Test polls are pinned to blocks at least interval_blocks apart."""
+        client = Mock()
+        client.get_head_block.side_effect = [
+            {"block_number": n, "block_hash": f"0x{n}"} for n in (100, 101, 102, 103)
+        ]
+        client.get_node_records.return_value = {(1, 1): record(1, 90)}
+        sleep = Mock()
+
+        monitor = NodeMonitor(client, [MonitorTarget(1, 1)])
+        assert list(monitor.watch(interval_blocks=3, iterations=2, sleep=sleep)) == []
+
+        assert [c.args[1] for c in client.get_node_records.call_args_list] == [
+            "0x100",
+            "0x103",
+        ]
+        assert sleep.call_count == 2
+
+    def test_watch_waits_for_new_head(self):
+        """Test the same head is never read twice."""
+        client = Mock()
+        client.get_head_block.side_effect = [
+            {"block_number": n, "block_hash": f"0x{n}"} for n in (100, 100, 101)
+        ]
+        client.get_node_records.return_value = {}
+        sleep = Mock()
+
+        monitor = NodeMonitor(client, [MonitorTarget(1, 1)])
+        list(monitor.watch(interval_blocks=0, iterations=2, sleep=sleep))
+
+        assert [c.args[1] for c in client.get_node_records.call_args_list] == [
+            "0x100",
+            "0x101",
+        ]
+        assert sleep.call_count == 1
+
+    def test_watch_picks_up_new_nodes(self):
+        """Test whole-subnet entries are re-resolved while watching."""
+        client = Mock()
+        client.get_head_block.side_effect = [
+            {"block_number": n, "block_hash": f"0x{n}"} for n in (100, 101, 110)
+        ]
+        client.get_subnet_nodes_status.side_effect = [
+            Mock(data={"nodes": [{"node_id": 1}]}),
+            Mock(data={"nodes": [{"node_id": 2}]}),
+        ]
+        client.get_node_records.return_value = {}
+        entries = [{"subnet_id": 1}]
+
+        monitor = NodeMonitor(
+            client, resolve_targets(client, entries), entries=entries
+        )
+        list(monitor.watch(iterations=3, resolve_blocks=10, sleep=Mock()))
+
+        assert [c.args[0] for c in client.get_node_records.call_args_list] == [
+            [(1, 1)],
+            [(1, 1)],
+            [(1, 1), (1, 2)],
+        ]
+
+    def test_monitor_refuses_pinned_block(self, cli_runner, tmp_path):
+        """Test node monitor refuses to run with reads pinned to a block."""
+        manifest = tmp_path / "nodes.yaml"
+        manifest.write_text("- subnet_id: 1\n  node_id: 1\n")
+        client = Mock()
+        client.config.network.at_block = "100"
+
+        with patch("src.htcli.commands.node.get_client", return_value=client):
+            result = cli_runner.invoke(
+                app, ["node", "monitor", "--manifest", str(manifest)]
+            )
+
+        assert result.exit_code == 1
+        assert "--at-block" in result.stdout
+        client.get_head_block.assert_not_called()
+
+
+class TestManifest:
+    """Test manifest loading and target resolution."""
+
+    def test_subnet_entries_expand_to_nodes(self, tmp_path):
+        """Test entries without a node ID cover every node in the subnet."""
+        manifest = tmp_path / "nodes.yaml"
+        manifest.write_text(
+            "nodes:\n"
+            "  - subnet_id: 1\n"
+            "    node_id: 4\n"
+            "    name: eu-1\n"
+            "  - subnet_id: 2\n"
+        )
+        client = Mock()
+        client.get_subnet_nodes_status.return_value = Mock(
+            data={"nodes": [{"node_id": 7}, {"node_id": 8}]}
+        )
+
+        targets = resolve_targets(client, load_manifest(manifest))
+
+        assert targets == [
+            MonitorTarget(1, 4, "eu-1"),
+            MonitorTarget(2, 7),
+            MonitorTarget(2, 8),
+        ]
+
+
+class TestNodeRecordsQuery:
+    """Test batched node reads at a block."""
+
+    def test_get_node_records(self):
+        """Test registered data is only read for nodes that are not active."""
+        with patch("src.htcli.client.SubstrateInterface") as mock_substrate:
+            substrate = Mock()
+            mock_substrate.return_value = substrate
+
+            def create_storage_key(module, storage_function, params):
+                return Mock(to_hex=Mock(return_value=f"{storage_function}{params}"))
+
+            storage = {
+                "SubnetNodesData[1, 1]": {"hotkey": "5a"},
+                "RegisteredSubnetNodesData[2, 5]": {"hotkey": "5r"},
+            }
+
+            def query_multi(storage_keys, block_hash=None):
+                return [
+                    (key, Mock(value=storage.get(key.to_hex())))
+                    for key in reversed(storage_keys)
+                ]
+
+            substrate.create_storage_key.side_effect = create_storage_key
+            substrate.query_multi.side_effect = query_multi
+
+            from src.htcli.config import load_config
+
+            client = HypertensorClient(load_config())
+            records = client.get_node_records([(1, 1), (2, 5), (3, 3)], "0xabc")
+
+        assert records[(1, 1)].status == "Active"
+        assert records[(2, 5)].status == "Registered"
+        assert records[(2, 5)].hotkey == "5r"
+        assert records[(3, 3)] is None
+        assert substrate.query_multi.call_count == 2
+        registered_keys = substrate.query_multi.call_args_list[1].args[0]
+        assert [key.to_hex() for key in registered_keys] == [
+            "RegisteredSubnetNodesData[2, 5]",
+            "RegisteredSubnetNodesData[3, 3]",
+        ]
+        assert substrate.query_multi.call_args_list[1].kwargs["block_hash"] == "0xabc"
@@ -2,6 +2,7 @@
 Unit tests for node operations.
 """
 
+import json
 from unittest.mock import Mock, patch
 
 from src.htcli.client import HypertensorClient
@@ -287,3 +288,106 @@ class TestNodeCleanup:
 
             assert response.success is True
             assert "call composed successfully" in response.message
+
+
+class TestBulkNodeStatus:
+    """Test reading the status of every node in a subnet."""
+
+    def test_subnet_nodes_status(self):
+        """Test both node maps are read once and classified per node."""
+        with patch("src.htcli.client.SubstrateInterface") as mock_substrate:
+            mock_substrate_instance = Mock()
+            mock_substrate.return_value = mock_substrate_instance
+            mock_substrate_instance.query.return_value = Mock(value=20)
+
+            maps = {
+                "RegisteredSubnetNodesData": [
+                    (Mock(value=3), Mock(value={"hotkey": "5reg"})),
+                    # Activated since registration; the active entry wins
+                    (Mock(value=1), Mock(value={"hotkey": "5old"})),
+                ],
+                "SubnetNodesData": [
+                    (
+                        Mock(value=1),
+                        Mock(value={"hotkey": "5a", "attestation_ratio": 90}),
+                    ),
+                    (
+                        Mock(value=2),
+                        Mock(value={"hotkey": "5b", "attestation_ratio": 10}),
+                    ),
+                ],
+            }
+            mock_substrate_instance.query_map.side_effect = (
+                lambda module, storage_function, params, **kwargs: maps[
+                    storage_function
+                ]
+            )
+
+            from src.htcli.config import load_config
+
+            client = HypertensorClient(load_config())
+            response = client.get_subnet_nodes_status(1)
+
+            nodes = response.data["nodes"]
+            assert response.success is True
+            assert response.data["current_epoch"] == 20
+            assert [(n["node_id"], n["classification"]) for n in nodes] == [
+                (1, "Included"),
+                (2, "Idle"),
+                (3, "Registered"),
+            ]
+            assert nodes[0]["hotkey"] == "5a"
+            assert response.registered_count == 1
+            assert mock_substrate_instance.query.call_count == 1
+            assert mock_substrate_instance.query_map.call_count == 2
+            for call in mock_substrate_instance.query_map.call_args_list:
+                assert call.kwargs["params"] == [1]
+
+    def test_status_all_command_sorts(self, cli_runner):
+        """Test node status --all prints every node in the requested order."""
+        from src.htcli.main import app
+        from src.htcli.models.responses import NodesListResponse
+
+        client = Mock()
+        client.get_subnet_nodes_status.return_value = NodesListResponse(
+            success=True,
+            message="ok",
+            data={
+                "current_epoch": 5,
+                "nodes": [
+                    {"node_id": 1, "classification": "Idle", "stake": 10},
+                    {"node_id": 2, "classification": "Included", "stake": 30},
+                    {"node_id": 3, "classification": "Registered", "stake": 20},
+                ],
+            },
+        )
+
+        with patch("src.htcli.commands.node.get_client", return_value=client):
+            result = cli_runner.invoke(
+                app,
+                [
+                    "node",
+                    "status",
+                    "--subnet-id",
+                    "1",
+                    "--all",
+                    "--sort-by",
+                    "stake",
+                    "--desc",
+                    "--format",
+                    "ndjson",
+                ],
+            )
+
+        assert result.exit_code == 0
+        rows = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [row["node_id"] for row in rows] == [2, 3, 1]
+
+    def test_status_requires_node_or_all(self, cli_runner):
+        """Test node status needs exactly one of --node-id and --all."""
+        from src.htcli.main import app
+
+        with patch("src.htcli.commands.node.get_client"):
+            result = cli_runner.invoke(app, ["node", "status", "--subnet-id", "1"])
+
+        assert result.exit_code == 1
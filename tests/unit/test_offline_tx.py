@@ -0,0 +1,388 @@
+"""
+Unit tests for offline transaction building, signing and submission.
+"""
+
+import json
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from scalecodec.base import RuntimeConfiguration, ScaleBytes
+from scalecodec.type_registry import load_type_registry_preset
+from substrateinterface import Keypair
+from substrateinterface.exceptions import SubstrateRequestException
+
+from src.htcli.client.tx import (
+    OfflineRPC,
+    call_payload,
+    offline_substrate,
+    sign_payload,
+    submit_pipelined,
+)
+from src.htcli.main import app
+
+GENESIS = "0x" + "11" * 32
+CHECKPOINT = "0x" + "22" * 32
+
+CONTEXT = {
+    "type": "context",
+    "chain": "Hypertensor",
+    "ss58_format": 42,
+    "genesis_hash": GENESIS,
+    "spec_version": 100,
+    "transaction_version": 1,
+    "checkpoint": {"number": 500, "hash": CHECKPOINT},
+    "metadata": "0x6d657461",
+}
+
+
+ALICE = Keypair.create_from_uri("//Alice")
+BOB = Keypair.create_from_uri("//Bob")
+
+
+def _type(path, definition, params=()):
+    return {
+        "path": list(path),
+        "params": [{"name": name, "type": ty} for name, ty in params],
+        "def": definition,
+        "docs": [],
+    }
+
+
+def _field(ty, name=None, type_name=None):
+    return {"name": name, "type": ty, "typeName": type_name, "docs": []}
+
+
+def _variant(name, index, fields=()):
+    return {"name": name, "fields": list(fields), "index": index, "docs": []}
+
+
+def _extension(identifier, ty, additional_signed):
+    return {
+        "identifier": identifier,
+        "ty": ty,
+        "additional_signed": additional_signed,
+    }
+
+
+def build_metadata() -> str:
+    """
+    Encode V14 metadata of a runtime with one Network call.
+
+    It has the extrinsic format and signed extensions of a standard runtime,
+    so the library signs against it exactly as against a node's metadata.
+    """
+    types = [
+        _type((), {"primitive": "u8"}),
+        _type((), {"array": {"len": 32, "type": 0}}),
+        _type(
+            ("sp_core", "crypto", "AccountId32"),
+            {"composite": {"fields": [_field(1)]}},
+        ),
+        _type((), {"tuple": []}),
+        _type(
+            ("sp_runtime", "multiaddress", "MultiAddress"),
+            {"variant": {"variants": [_variant("Id", 0, [_field(2)])]}},
+            [("AccountId", 2), ("AccountIndex", 3)],
+        ),
+        _type((), {"array": {"len": 64, "type": 0}}),
+        _type(
+            ("sp_core", "sr25519", "Signature"),
+            {"composite": {"fields": [_field(5)]}},
+        ),
+        _type(
+            ("sp_core", "ed25519", "Signature"),
+            {"composite": {"fields": [_field(5)]}},
+        ),
+        _type(
+            ("sp_runtime", "MultiSignature"),
+            {
+                "variant": {
+                    "variants": [
+                        _variant("Ed25519", 0, [_field(7)]),
+                        _variant("Sr25519", 1, [_field(6)]),
+                    ]
+                }
+            },
+        ),
+        _type((), {"primitive": "u32"}),
+        _type((), {"primitive": "u128"}),
+        _type(
+            ("pallet_network", "pallet", "Call"),
+            {
+                "variant": {
+                    "variants": [
+                        _variant(
+                            "add_to_delegate_stake",
+                            0,
+                            [
+                                _field(9, "subnet_id", "u32"),
+                                _field(10, "stake_to_be_added", "u128"),
+                            ],
+                        )
+                    ]
+                }
+            },
+        ),
+        _type(
+            ("node_runtime", "RuntimeCall"),
+            {"variant": {"variants": [_variant("Network", 7, [_field(11)])]}},
+        ),
+        _type((), {"compact": {"type": 9}}),
+        _type((), {"compact": {"type": 10}}),
+        _type(
+            ("sp_runtime", "generic", "era", "Era"),
+            {"variant": {"variants": [_variant("Immortal", 0)]}},
+        ),
+        _type(("primitive_types", "H256"), {"composite": {"fields": [_field(1)]}}),
+        _type(
+            ("sp_runtime", "generic", "unchecked_extrinsic", "UncheckedExtrinsic"),
+            {"composite": {"fields": [_field(18)]}},
+            [("Address", 4), ("Call", 12), ("Signature", 8), ("Extra", 3)],
+        ),
+        _type((), {"sequence": {"type": 0}}),
+    ]
+    metadata = {
+        "types": {"types": [{"id": i, "type": ty} for i, ty in enumerate(types)]},
+        "pallets": [
+            {
+                "name": "Network",
+                "storage": None,
+                "calls": {"ty": 11},
+                "event": None,
+                "constants": [],
+                "error": None,
+                "index": 7,
+            }
+        ],
+        "extrinsic": {
+            "ty": 17,
+            "version": 4,
+            "signed_extensions": [
+                _extension("CheckSpecVersion", 3, 9),
+                _extension("CheckTxVersion", 3, 9),
+                _extension("CheckGenesis", 3, 16),
+                _extension("CheckMortality", 15, 16),
+                _extension("CheckNonce", 13, 3),
+                _extension("ChargeTransactionPayment", 14, 3),
+            ],
+        },
+        "runtime_type": 12,
+    }
+    runtime_config = RuntimeConfiguration()
+    runtime_config.update_type_registry(load_type_registry_preset("core"))
+    encoded = runtime_config.create_scale_object("MetadataVersioned").encode(
+        ("0x6d657461", {"V14": metadata})
+    )
+    return str(encoded)
+
+
+def submit_answers(rejected=()):
+    """Answer author_submitExtrinsic requests, rejecting the given extrinsics."""
+
+    def respond(request):
+        if request["params"][0] in rejected:
+            error = {"code": 1010, "message": "Invalid Transaction", "data": "Stale"}
+            return {"error": error}
+        return {"result": "0xhash"}
+
+    return respond
+
+
+class TestOfflineRPC:
+    """Test the RPC requests made while signing are answered from the context."""
+
+    def test_answers_from_context(self):
+        rpc = OfflineRPC(CONTEXT)
+
+        assert rpc("chain_getBlockHash", [0])["result"] == GENESIS
+        assert rpc("chain_getBlockHash", [500])["result"] == CHECKPOINT
+        assert rpc("chain_getHead", [])["result"] == CHECKPOINT
+        assert rpc("state_getRuntimeVersion", [CHECKPOINT])["result"] == {
+            "specVersion": 100,
+            "transactionVersion": 1,
+        }
+        assert rpc("state_getMetadata", [CHECKPOINT])["result"] == "0x6d657461"
+
+    def test_other_requests_fail(self):
+        rpc = OfflineRPC(CONTEXT)
+
+        assert "error" in rpc("system_accountNextIndex", ["5abc"])
+        assert "error" in rpc("chain_getBlockHash", [499])
+
+
+class TestOfflineSigning:
+    """Test payloads are signed by a real SubstrateInterface without a node."""
+
+    def test_sign_payload(self):
+        context = {**CONTEXT, "metadata": build_metadata()}
+        substrate = offline_substrate(context)
+        call = substrate.compose_call(
+            "Network", "add_to_delegate_stake", {"subnet_id": 1, "stake_to_be_added": 5}
+        )
+
+        record = sign_payload(substrate, context, call_payload(call), ALICE, 7, 64)
+
+        extrinsic = substrate.create_scale_object(
+            "Extrinsic",
+            data=ScaleBytes(record["extrinsic"]),
+            metadata=substrate.metadata,
+        )
+        extrinsic.decode()
+        assert extrinsic.value["address"] == ALICE.ss58_address
+        assert extrinsic.value["nonce"] == 7
+        assert extrinsic.value["call"]["call_function"] == "add_to_delegate_stake"
+
+        # The signed payload commits to the context's genesis and checkpoint
+        payload = substrate.generate_signature_payload(
+            call, era={"period": 64, "current": 500}, nonce=7
+        )
+        assert bytes.fromhex(GENESIS[2:]) in payload.data
+        assert bytes.fromhex(CHECKPOINT[2:]) in payload.data
+        signature = extrinsic.value["signature"]["Sr25519"]
+        assert ALICE.verify(payload, bytes.fromhex(signature[2:]))
+
+    def test_never_connects(self):
+        substrate = offline_substrate({**CONTEXT, "metadata": build_metadata()})
+
+        with pytest.raises(SubstrateRequestException, match="not available offline"):
+            substrate.get_block_hash(1)
+
+
+class TestSubmitPipelined:
+    """Test signed extrinsics are submitted with several requests in flight."""
+
+    def test_window_and_errors(self, fake_node):
+        node = fake_node(submit_answers(rejected={"0x02"}))
+        substrate = Mock(websocket=node, request_id=1)
+        extrinsics = [
+            {"index": i, "extrinsic": f"0x{i:02x}", "nonce": i} for i in range(10)
+        ]
+
+        results = list(submit_pipelined(substrate, extrinsics, window=4))
+
+        assert node.max_in_flight == 4
+        assert [r["index"] for r in results] == list(range(10))
+        assert results[0]["success"] and results[0]["result"] == "0xhash"
+        assert results[2]["success"] is False
+        assert results[2]["message"] == "Invalid Transaction: Stale"
+        assert substrate.request_id == 11
+
+
+class TestTxCommands:
+    """Test the tx build, sign and submit commands."""
+
+    def test_build_assigns_nonces(self, cli_runner, tmp_path):
+        ops_file = tmp_path / "ops.ndjson"
+        out = tmp_path / "payloads.ndjson"
+        ops_file.write_text(
+            '{"op": "stake delegate-add", "subnet_id": 1, "amount": 10}\n'
+            '{"op": "stake claim", "id": "claim"}\n'
+        )
+        call = Mock(
+            value={
+                "call_module": "Network",
+                "call_function": "add_to_delegate_stake",
+                "call_args": {"subnet_id": 1},
+            },
+            data="0x0a01",
+        )
+        mock_client = MagicMock()
+        mock_client.read_chain_context.return_value = CONTEXT
+        mock_client.substrate.get_account_nonce.return_value = 7
+        mock_client.add_to_delegate_stake.return_value = Mock(
+            data={"call_data": call}
+        )
+        mock_client.claim_unbondings.return_value = Mock(data={"call_data": call})
+
+        with patch("src.htcli.commands.tx.get_client", return_value=mock_client):
+            result = cli_runner.invoke(
+                app,
+                ["tx", "build", str(ops_file), "--signer", "5signer", "-o", str(out)],
+            )
+
+        assert result.exit_code == 0
+        records = [json.loads(line) for line in out.read_text().splitlines()]
+        assert records[0]["genesis_hash"] == GENESIS
+        assert records[0]["signer"] == "5signer"
+        assert [(r["index"], r["nonce"], r["call"]) for r in records[1:]] == [
+            (0, 7, "0x0a01"),
+            (1, 8, "0x0a01"),
+        ]
+        assert records[2]["id"] == "claim"
+        mock_client.add_to_delegate_stake.assert_called_once_with(1, 10, None)
+        mock_client.signing_context.assert_called_once()
+
+    def test_sign_with_explicit_nonce(self, cli_runner, tmp_path):
+        payloads = tmp_path / "payloads.ndjson"
+        out = tmp_path / "signed.ndjson"
+        payload = {
+            "type": "call",
+            "index": 0,
+            "op": "stake claim",
+            "call_module": "Network",
+            "call_function": "claim_unbondings",
+            "call": "0x0a02",
+        }
+        payloads.write_text(
+            "\n".join(json.dumps(r) for r in (CONTEXT, payload, payload)) + "\n"
+        )
+        substrate = Mock()
+        substrate.create_signed_extrinsic.return_value = Mock(
+            data="0xsigned", extrinsic_hash=b"\x01" * 32
+        )
+        keypair = Mock(ss58_address="5signer")
+
+        with patch(
+            "src.htcli.commands.tx.offline_substrate", return_value=substrate
+        ), patch(
+            "src.htcli.commands.tx.get_secure_password", return_value="pw"
+        ), patch(
+            "src.htcli.utils.crypto.load_keypair", return_value=keypair
+        ), patch(
+            "src.htcli.commands.tx.get_client"
+        ) as get_client:
+            result = cli_runner.invoke(
+                app,
+                ["tx", "sign", str(payloads), "-k", "cold", "--nonce", "3"]
+                + ["--output", str(out)],
+            )
+
+        assert result.exit_code == 0
+        get_client.assert_not_called()
+        records = [json.loads(line) for line in out.read_text().splitlines()]
+        assert "metadata" not in records[0]
+        assert [r["nonce"] for r in records[1:]] == [3, 4]
+        assert records[1]["extrinsic_hash"] == "0x" + "01" * 32
+        era = substrate.create_signed_extrinsic.call_args.kwargs["era"]
+        assert era == {"period": 4096, "current": 500}
+
+    def test_sign_refuses_other_signer(self, cli_runner, tmp_path):
+        payloads = tmp_path / "payloads.ndjson"
+        payload = {"type": "call", "call": "0x0a02", "nonce": 7}
+        context = {**CONTEXT, "signer": BOB.ss58_address}
+        payloads.write_text(json.dumps(context) + "\n" + json.dumps(payload) + "\n")
+
+        with patch(
+            "src.htcli.commands.tx.offline_substrate"
+        ) as offline, patch(
+            "src.htcli.commands.tx.get_secure_password", return_value="pw"
+        ), patch(
+            "src.htcli.utils.crypto.load_keypair", return_value=ALICE
+        ):
+            result = cli_runner.invoke(app, ["tx", "sign", str(payloads), "-k", "a"])
+
+        assert result.exit_code == 1
+        assert "Nonces were assigned for" in result.stdout
+        offline.assert_not_called()
+
+    def test_submit_rejects_other_chain(self, cli_runner, tmp_path):
+        signed = tmp_path / "signed.ndjson"
+        signed.write_text(json.dumps({**CONTEXT, "genesis_hash": "0x33"}) + "\n")
+        mock_client = Mock()
+        mock_client.substrate.get_block_hash.return_value = GENESIS
+
+        with patch("src.htcli.commands.tx.get_client", return_value=mock_client):
+            result = cli_runner.invoke(app, ["tx", "submit", str(signed)])
+
+        assert result.exit_code == 1
+        mock_client.submit_extrinsics.assert_not_called()
@@ -0,0 +1,119 @@
+"""
+Unit tests for streaming output.
+"""
+
+import io
+import json
+from unittest.mock import Mock, patch
+
+from src.htcli.client import HypertensorClient
+from src.htcli.main import app
+from src.htcli.models.records import NodeRecord
+from src.htcli.utils.streaming import StreamWriter, stream_rows
+
+
+class TestStreamWriter:
+    """Test the NDJSON/CSV stream writer."""
+
+    def test_ndjson_writes_one_line_per_row(self):
+        """Test NDJSON output is one compact JSON document per line."""
+        stream = io.StringIO()
+        writer = StreamWriter(stream, "ndjson")
+
+        count = writer.write_all([{"node_id": 1, "stake": 10}, {"node_id": 2}])
+
+        lines = stream.getvalue().splitlines()
+        assert count == 2
+        assert [json.loads(line) for line in lines] == [
+            {"node_id": 1, "stake": 10},
+            {"node_id": 2},
+        ]
+
+    def test_csv_uses_first_row_headers(self):
+        """Test CSV output takes its columns from the first row."""
+        stream = io.StringIO()
+        writer = StreamWriter(stream, "csv")
+
+        writer.write_all(
+            [{"node_id": 1, "peer_id": "Qm1"}, {"node_id": 2, "extra": [1, 2]}]
+        )
+
+        lines = stream.getvalue().splitlines()
+        assert lines[0] == "node_id,peer_id"
+        assert lines[1] == "1,Qm1"
+        assert lines[2] == "2,"
+
+    def test_rows_are_consumed_lazily(self, tmp_path):
+        """Test rows are written as the iterator yields them."""
+        output = tmp_path / "nodes.ndjson"
+        seen = []
+
+        def rows():
+            for node_id in range(3):
+                seen.append(node_id)
+                yield {"node_id": node_id}
+
+        count = stream_rows(rows(), "ndjson", output)
+
+        assert count == 3
+        assert seen == [0, 1, 2]
+        assert len(output.read_text().splitlines()) == 3
+
+
+class TestNodeListStreaming:
+    """Test streaming node listing."""
+
+    def test_iter_subnet_node_records_skips_empty_slots(self):
+        """Test node iteration yields records and skips empty node slots."""
+        with patch("src.htcli.client.SubstrateInterface") as mock_substrate:
+            mock_substrate_instance = Mock()
+            mock_substrate.return_value = mock_substrate_instance
+
+            mock_substrate_instance.query.side_effect = [
+                Mock(value=2),
+                Mock(value={"hotkey": "5abc", "peer_id": "Qm1"}),
+                Mock(value=None),
+            ]
+
+            from src.htcli.config import load_config
+
+            client = HypertensorClient(load_config())
+            nodes = list(client.iter_subnet_node_records(1))
+
+            assert [node.to_row() for node in nodes] == [
+                {"subnet_id": 1, "node_id": 1, "hotkey": "5abc", "peer_id": "Qm1"}
+            ]
+
+    def test_node_list_ndjson(self, cli_runner):
+        """Test node list writes plain NDJSON without Rich output."""
+        mock_client = Mock()
+        mock_client.iter_subnet_node_records.return_value = iter(
+            [NodeRecord.from_storage(1, 1, {"hotkey": "5abc"})]
+        )
+
+        with patch("src.htcli.commands.node.get_client", return_value=mock_client):
+            result = cli_runner.invoke(
+                app, ["node", "list", "--subnet-id", "1", "--format", "ndjson"]
+            )
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout.strip()) == {
+            "subnet_id": 1,
+            "node_id": 1,
+            "hotkey": "5abc",
+        }
+
+    def test_node_list_table_uses_rows(self, cli_runner):
+        """Test node list renders records as flat rows."""
+        mock_client = Mock()
+        mock_client.get_subnet_nodes.return_value = Mock(
+            success=True,
+            data={"nodes": [NodeRecord.from_storage(1, 1, {"peer_id": "QmPeer"})]},
+        )
+
+        with patch("src.htcli.commands.node.get_client", return_value=mock_client):
+            result = cli_runner.invoke(app, ["node", "list", "--subnet-id", "1"])
+
+        assert result.exit_code == 0
+        assert "QmPeer" in result.stdout
+        assert "Found 1 node(s)" in result.stdout
@@ -0,0 +1,83 @@
+"""
+Unit tests for compact node and subnet records.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.htcli.client import HypertensorClient
+from src.htcli.models.records import NodeRecord, SubnetRecord
+
+
+class TestNodeRecord:
+    """Test NodeRecord conversion and classification."""
+
+    def test_storage_round_trip(self):
+        """Test unknown storage fields survive conversion back to a dict."""
+        raw = {"hotkey": "5abc", "peer_id": "Qm1", "stake": 10, "a": "x"}
+
+        record = NodeRecord.from_storage(1, 3, raw)
+
+        assert record.hotkey == "5abc"
+        assert record.extra == {"a": "x"}
+        assert record.to_storage() == raw
+        assert record.to_listing() == {"node_id": 3, "data": raw}
+        assert record.to_row() == {"subnet_id": 1, "node_id": 3, **raw}
+
+    def test_records_have_no_instance_dict(self):
+        """Test records are slotted and reject unknown attributes."""
+        record = NodeRecord.from_storage(1, 1, {"hotkey": "5abc"})
+
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.unknown = 1
+
+    @pytest.mark.parametrize(
+        "ratio,status,expected",
+        [
+            (80, "Active", "Included"),
+            (10, "Active", "Idle"),
+            (90, "Registered", "Registered"),
+        ],
+    )
+    def test_classification(self, ratio, status, expected):
+        """Test classification follows status and attestation ratio."""
+        record = NodeRecord.from_storage(
+            1, 1, {"attestation_ratio": ratio}, status=status
+        )
+
+        assert record.classification == expected
+
+    def test_subnet_record_empty(self):
+        """Test an empty storage value gives an empty subnet record."""
+        assert SubnetRecord.from_storage(1, None).is_empty
+        assert not SubnetRecord.from_storage(1, {"name": "s"}).is_empty
+
+
+class TestNodeStatusRecords:
+    """Test node status built from records."""
+
+    def test_registered_node_status(self):
+        """Test a registered node reports zero attestation and penalties."""
+        with patch("src.htcli.client.SubstrateInterface") as mock_substrate:
+            mock_substrate_instance = Mock()
+            mock_substrate.return_value = mock_substrate_instance
+
+            mock_substrate_instance.query.side_effect = [
+                Mock(value=12),
+                Mock(value=None),
+                Mock(value={"hotkey": "5abc", "penalties": 4}),
+            ]
+
+            from src.htcli.config import load_config
+
+            client = HypertensorClient(load_config())
+            response = client.get_subnet_node_status(1, 2)
+
+            node = response.data["node"]
+            assert response.success
+            assert node["classification"] == "Registered"
+            assert node["current_epoch"] == 12
+            assert node["hotkey"] == "5abc"
+            assert node["penalties"] == 0
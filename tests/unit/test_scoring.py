@@ -0,0 +1,95 @@
+"""
+Unit tests for columnar opportunity scoring.
+"""
+
+import numpy as np
+import pytest
+
+from src.htcli.models.records import NodeRecord
+from src.htcli.utils.scoring import TENSOR, OpportunityScorer
+
+
+def make_scorer():
+    scorer = OpportunityScorer()
+    # Active subnet, strong node with a moderate stake
+    scorer.add(
+        1, 1, "Active", 12, current_stake=100 * TENSOR, performance_score=0.9
+    )
+    # Registered subnet, weak node
+    scorer.add(2, 1, "Registered", 1, performance_score=0.25, reward_rate=0.05)
+    # Active subnet, average node with a very large stake
+    scorer.add(1, 2, "Active", 12, current_stake=5000 * TENSOR)
+    return scorer
+
+
+class TestOpportunityScorer:
+    """Test vectorized risk and attractiveness scoring."""
+
+    def test_scores(self):
+        """Test risk and attractiveness follow the weighted scoring rules."""
+        scorer = make_scorer()
+        scorer.score()
+
+        assert scorer.risk_scores == pytest.approx([0.1, 0.8, 0.3])
+        assert scorer.attractiveness_scores[0] == pytest.approx(
+            0.9 * 0.3 + 1.0 * 0.3 + 0.9 * 0.2 + 1.0 * 0.2
+        )
+        assert scorer.attractiveness_scores[1] == pytest.approx(
+            0.25 * 0.3 + 0.5 * 0.3 + 0.2 * 0.2 + 0.8 * 0.2
+        )
+
+    def test_strategy_mask(self):
+        """Test strategies filter by risk and subnet maturity."""
+        scorer = make_scorer()
+
+        assert scorer.strategy_mask("conservative", True).tolist() == [
+            True,
+            False,
+            True,
+        ]
+        assert scorer.strategy_mask("aggressive", True).tolist() == [
+            False,
+            True,
+            True,
+        ]
+        assert scorer.strategy_mask("balanced", False).tolist() == [
+            True,
+            False,
+            True,
+        ]
+
+    def test_top_k_orders_best_first(self):
+        """Test top-k selection returns the best candidates in order."""
+        scorer = OpportunityScorer()
+        rng = np.random.default_rng(7)
+        for node_id, performance in enumerate(rng.random(1000)):
+            scorer.add(
+                1, node_id, "Active", 20, performance_score=float(performance)
+            )
+
+        top = scorer.top_k(5)
+
+        expected = np.argsort(-scorer.attractiveness_scores, kind="stable")[:5]
+        assert top.tolist() == expected.tolist()
+
+    def test_add_subnet_nodes_from_records(self):
+        """Test node records supply stake, performance and reward rate."""
+        scorer = OpportunityScorer()
+        record = NodeRecord.from_storage(
+            3,
+            4,
+            {
+                "stake": 20 * TENSOR,
+                "attestation_ratio": 70,
+                "delegate_reward_rate": TENSOR // 20,
+            },
+        )
+
+        scorer.add_subnet_nodes({"subnet_id": 3, "state": "Active"}, [record])
+        opportunity = scorer.to_opportunities(scorer.top_k(1))[0]
+
+        assert opportunity["subnet_id"] == 3
+        assert opportunity["node_id"] == 4
+        assert opportunity["current_stake"] == 20 * TENSOR
+        assert opportunity["performance_score"] == pytest.approx(0.7)
+        assert opportunity["reward_rate"] == pytest.approx(0.05)
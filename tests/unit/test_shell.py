@@ -0,0 +1,113 @@
+"""
+Unit tests for the interactive shell.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.htcli import dependencies
+from src.htcli.main import app
+from src.htcli.models.records import NodeRecord, SubnetRecord
+from src.htcli.models.responses import BaseResponse
+from src.htcli.shell import HtcliShell
+
+
+@pytest.fixture
+def shell(monkeypatch):
+    # Keep the root callback from treating the run as a bare `htcli`
+    monkeypatch.setattr("sys.argv", ["htcli", "shell"])
+    monkeypatch.setattr(dependencies, "_client", None)
+    return HtcliShell(app)
+
+
+class TestShellDispatch:
+    """Test commands run in-process on one client."""
+
+    def test_client_shared_between_commands(self, shell):
+        """Test the client is created once for the whole session."""
+        client = Mock()
+        client.get_current_epoch.return_value = BaseResponse(
+            success=True, message="ok", data={"epoch": 5}
+        )
+
+        def make_client(config):
+            client.config = config
+            return client
+
+        with patch(
+            "src.htcli.dependencies.HypertensorClient", side_effect=make_client
+        ) as mock_client:
+            assert shell.execute("chain epoch --format json") == 0
+            assert shell.execute("chain epoch") == 0
+
+        mock_client.assert_called_once()
+        assert client.get_current_epoch.call_count == 2
+
+    def test_global_options_apply_per_command(self, shell):
+        """Test each command's global options reach the shared client."""
+        clients = []
+
+        def make_client(config):
+            client = Mock(config=config)
+            client.get_current_epoch.return_value = BaseResponse(
+                success=True, message="ok", data={"epoch": 5}
+            )
+            clients.append(client)
+            return client
+
+        with patch(
+            "src.htcli.dependencies.HypertensorClient", side_effect=make_client
+        ):
+            assert shell.execute("chain epoch") == 0
+            assert shell.execute("--mine chain epoch") == 0
+            assert len(clients) == 1
+            assert clients[0].config.filter.mine is True
+
+            assert shell.execute("--at-block 100 chain epoch") == 0
+            assert len(clients) == 2
+            clients[0].disconnect.assert_called_once()
+            assert clients[1].config.network.at_block == "100"
+
+            assert shell.execute("chain epoch") == 0
+            assert len(clients) == 3
+            assert clients[2].config.network.at_block is None
+
+    def test_errors_do_not_end_session(self, shell):
+        """Test usage errors and failures return an exit code."""
+        assert shell.execute("no-such-command") == 2
+        assert shell.execute('chain "unterminated') == 2
+        assert shell.execute("") == 0
+
+
+class TestShellCompletion:
+    """Test tab completion of commands, options and chain IDs."""
+
+    def test_command_and_option_completion(self, shell):
+        """Test completion walks the command tree."""
+        assert "node" in shell.completions([], "")
+        assert shell.completions(["node"], "st") == ["status"]
+        assert "--subnet-id" in shell.completions(["node", "status"], "--s")
+
+    def test_id_completion_is_cached(self, shell):
+        """Test subnet and node IDs come from the chain once."""
+        client = Mock()
+        client.iter_subnets_data.return_value = [
+            SubnetRecord.from_storage(subnet_id, {}) for subnet_id in (1, 12)
+        ]
+        client.iter_subnet_node_records.side_effect = lambda subnet_id: [
+            NodeRecord.from_storage(subnet_id, node_id, {}) for node_id in (3, 4)
+        ]
+
+        with patch("src.htcli.shell.get_client", return_value=client):
+            tokens = ["node", "status", "--subnet-id"]
+            assert shell.completions(tokens, "1") == ["1", "12"]
+            assert shell.completions(tokens, "") == ["1", "12"]
+            tokens = ["node", "status", "-s", "12", "--node-id"]
+            assert shell.completions(tokens, "") == ["3", "4"]
+
+        client.iter_subnets_data.assert_called_once()
+        client.iter_subnet_node_records.assert_called_once_with(12)
+
+        shell.refresh()
+        assert shell._subnet_ids is None
@@ -0,0 +1,113 @@
+"""
+Unit tests for the reusable signing context.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from substrateinterface.exceptions import SubstrateRequestException
+
+from src.htcli.client.signing import SigningContext
+
+CONTEXT = {
+    "genesis_hash": "0x" + "11" * 32,
+    "spec_version": 100,
+    "transaction_version": 1,
+    "checkpoint": {"number": 500, "hash": "0x" + "22" * 32},
+}
+
+
+class FakeSubstrate:
+    """Connection that counts the chain reads made while signing."""
+
+    def __init__(self, fail_submit=False):
+        self.fail_submit = fail_submit
+        self.nonce_reads = 0
+
+    def get_account_nonce(self, address):
+        self.nonce_reads += 1
+        return 7
+
+    def compose_call(self, call_module, call_function, call_params=None):
+        return "uncached"
+
+    def create_signed_extrinsic(self, call, keypair, era=None, nonce=None):
+        return "uncached"
+
+    def submit_extrinsic(self, extrinsic, wait_for_inclusion=False):
+        if self.fail_submit:
+            raise SubstrateRequestException("Invalid Transaction")
+        return Mock(extrinsic_hash="0xabc")
+
+
+def make_signer():
+    signer = Mock()
+    signer.get_metadata_call_function.return_value = Mock(
+        value={"fields": [{"name": "subnet_id"}, {"name": "stake_to_be_added"}]}
+    )
+    signer.compose_call.side_effect = lambda **kwargs: kwargs
+    signer.create_signed_extrinsic.side_effect = lambda **kwargs: kwargs
+    return signer
+
+
+@pytest.fixture
+def signer():
+    signer = make_signer()
+    with patch(
+        "src.htcli.client.signing.read_chain_context", return_value=CONTEXT
+    ) as read_context, patch(
+        "src.htcli.client.signing.offline_substrate", return_value=signer
+    ):
+        signer.read_context = read_context
+        yield signer
+
+
+class TestSigningContext:
+    """Test many extrinsics are signed with chain state read once."""
+
+    def test_batch_reads_chain_state_once(self, signer):
+        substrate = FakeSubstrate()
+        context = SigningContext(substrate)
+        keypair = Mock(ss58_address="5signer")
+
+        extrinsics = [
+            context.create_signed_extrinsic(
+                context.compose_call(
+                    "Network",
+                    "add_to_delegate_stake",
+                    {"subnet_id": subnet_id, "stake_to_be_added": 5},
+                ),
+                keypair,
+            )
+            for subnet_id in range(1, 11)
+        ]
+
+        assert signer.read_context.call_count == 1
+        assert signer.get_metadata_call_function.call_count == 1
+        assert substrate.nonce_reads == 1
+        assert [e["nonce"] for e in extrinsics] == list(range(7, 17))
+        assert extrinsics[0]["era"] == {"period": 64, "current": 500}
+
+    def test_template_checks_parameters(self, signer):
+        context = SigningContext(FakeSubstrate())
+
+        with pytest.raises(ValueError, match="missing parameters"):
+            context.compose_call("Network", "add_to_delegate_stake", {"subnet_id": 1})
+
+    def test_installed_routes_and_restores(self, signer):
+        substrate = FakeSubstrate(fail_submit=True)
+        context = SigningContext(substrate)
+        keypair = Mock(ss58_address="5signer")
+        params = {"subnet_id": 1, "stake_to_be_added": 5}
+
+        with context.installed():
+            call = substrate.compose_call("Network", "add_to_delegate_stake", params)
+            extrinsic = substrate.create_signed_extrinsic(call=call, keypair=keypair)
+            with pytest.raises(SubstrateRequestException, match="Invalid Transaction"):
+                substrate.submit_extrinsic(extrinsic, wait_for_inclusion=True)
+            # The nonce is read again after a failed submission
+            substrate.create_signed_extrinsic(call=call, keypair=keypair)
+
+        assert substrate.nonce_reads == 2
+        assert substrate.compose_call("Network", "add_to_delegate_stake") == "uncached"
+        assert "compose_call" not in vars(substrate)
@@ -2,6 +2,7 @@
 Unit tests for staking operations.
 """
 
+import time
 from unittest.mock import Mock, patch
 
 from src.htcli.client import HypertensorClient
@@ -224,6 +225,7 @@ class TestStakingInformation:
                 Mock(value=10),  # delegator count
                 Mock(value=1500),  # average reward rate
                 Mock(value=1000000000000000000),  # unbonding stake
+                Mock(value=5000000000000000000),  # total shares
                 Mock(value=100000000000000000),  # claimable rewards
             ]
 
@@ -266,3 +268,118 @@ class TestStakingInformation:
                 response.success is False
             )  # Expected to fail due to missing helper methods
             assert "Failed to get general staking info" in response.message
+
+
+class TestDelegatorStats:
+    """Test streaming aggregation of delegate stake share holders."""
+
+    def test_aggregate(self):
+        from src.htcli.utils.delegators import DelegatorAggregate
+
+        aggregate = DelegatorAggregate(top=2)
+        for account, shares in [("a", 5), ("b", 600), ("c", 0), ("d", 40), ("e", 9)]:
+            aggregate.add(account, shares)
+
+        stats = aggregate.to_dict()
+        assert stats["count"] == 4
+        assert stats["total_shares"] == 654
+        assert [h["account"] for h in stats["top_holders"]] == ["b", "d"]
+        assert stats["top_holder_percent"] == round(600 * 100 / 654, 4)
+        assert stats["histogram"] == [
+            {"range": "1e0-1e1", "count": 2},
+            {"range": "1e1-1e2", "count": 1},
+            {"range": "1e2-1e3", "count": 1},
+        ]
+
+    def test_node_delegators_scanned_once_per_block(self):
+        """Test the node prefix is scanned once and cached until the block changes."""
+        with patch("src.htcli.client.SubstrateInterface") as mock_substrate:
+            substrate = Mock()
+            mock_substrate.return_value = substrate
+            substrate.get_chain_head.return_value = "0x01"
+            substrate.query_map.side_effect = lambda **kwargs: iter(
+                [
+                    ((Mock(value="5a"),), Mock(value=30)),
+                    ((Mock(value="5b"),), Mock(value=70)),
+                ]
+            )
+
+            from src.htcli.config import load_config
+
+            client = HypertensorClient(load_config())
+            stats = client.get_delegator_stats(1, 2)
+            client.subnet._get_node_delegator_count(1, 2)
+
+            assert stats["count"] == 2
+            assert stats["top_holders"][0] == {
+                "account": "5b",
+                "shares": 70,
+                "share_percent": 70.0,
+            }
+            assert substrate.query_map.call_count == 1
+            assert substrate.query_map.call_args.kwargs["storage_function"] == (
+                "NodeDelegateStakeShares"
+            )
+            assert substrate.query_map.call_args.kwargs["params"] == [1, 2]
+
+            assert substrate.get_chain_head.call_count == 1
+
+            substrate.get_chain_head.return_value = "0x02"
+            with patch(
+                "src.htcli.client.subnet.time.monotonic",
+                return_value=time.monotonic() + 60,
+            ):
+                client.get_delegator_stats(1, 2)
+            assert substrate.get_chain_head.call_count == 2
+            assert substrate.query_map.call_count == 2
+
+            client.subnet.get_delegator_stats(1, 2, block_hash="0x01")
+            assert substrate.query_map.call_count == 3
+
+
+class TestShareConversion:
+    """Test exact conversion between delegate stake shares and balances."""
+
+    def test_scalar_conversion(self):
+        from src.htcli.utils.shares import shares_to_balance
+
+        assert shares_to_balance(10, 90, 30) == 30
+        assert shares_to_balance(1, 2, 3) == 0
+        assert shares_to_balance(10, 90, 0) == 0
+
+    def test_bulk_conversion_is_exact(self):
+        """Test 18-decimal balances are converted without rounding."""
+        from src.htcli.utils.shares import shares_to_balance, shares_to_balances
+
+        total_balance = 123_456_789 * 10**18 + 7
+        total_shares = 98_765_432 * 10**18 + 3
+        shares = [10**18 + i for i in range(1000)]
+
+        assert shares_to_balances(shares, total_balance, total_shares) == [
+            shares_to_balance(s, total_balance, total_shares) for s in shares
+        ]
+        assert shares_to_balances([10, 5, 7], [90, 0, 10], [30, 0, 3]) == [30, 0, 23]
+        assert shares_to_balances([], 1, 1) == []
+
+    def test_node_staking_info_uses_share_totals(self):
+        """Test the user's stake value is their share of the pool balance."""
+        with patch("src.htcli.client.SubstrateInterface") as mock_substrate:
+            substrate = Mock()
+            mock_substrate.return_value = substrate
+            values = {
+                "NodeDelegateStakeBalance": 3 * 10**24 + 1,
+                "TotalNodeDelegateStakeShares": 2 * 10**24,
+                "NodeDelegateStakeShares": 10**24,
+            }
+            substrate.query.side_effect = lambda module, storage_function, params: (
+                Mock(value=values.get(storage_function, 0))
+            )
+            substrate.query_map.side_effect = lambda **kwargs: iter([])
+
+            from src.htcli.config import load_config
+
+            client = HypertensorClient(load_config())
+            response = client.get_node_staking_info(1, 2, "5user")
+
+        assert response.data["user_stake_value"] == (3 * 10**24 + 1) // 2
+        assert response.data["total_node_shares"] == 2 * 10**24
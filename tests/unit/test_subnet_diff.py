@@ -0,0 +1,178 @@
+"""
+Unit tests for subnet state diffs between blocks.
+"""
+
+import json
+from unittest.mock import Mock, patch
+
+from src.htcli.client import HypertensorClient
+from src.htcli.main import app
+from src.htcli.utils.diff import diff_subnet_snapshots
+
+BEFORE = "0x" + "01" * 32
+AFTER = "0x" + "02" * 32
+
+
+def node(classification="Included", **fields):
+    data = {
+        "status": "Registered" if classification == "Registered" else "Active",
+        "classification": classification,
+        "hotkey": "5hot",
+        "penalties": 0,
+        "stake": 100,
+    }
+    data.update(fields)
+    return data
+
+
+class TestDiffSubnetSnapshots:
+    """Test comparison of subnet snapshots."""
+
+    def test_changes(self):
+        before = {
+            "parameters": {"state": "Registered", "churn_limit": 4},
+            "nodes": {1: node(), 2: node("Registered"), 3: node()},
+        }
+        after = {
+            "parameters": {"state": "Active", "churn_limit": 4},
+            "nodes": {1: node("Idle", penalties=2), 2: node("Registered"), 4: node()},
+        }
+
+        changes = diff_subnet_snapshots(before, after)
+
+        assert [
+            (c["scope"], c["node_id"], c["field"], c["change"], c["from"], c["to"])
+            for c in changes
+        ] == [
+            ("subnet", None, "state", "changed", "Registered", "Active"),
+            ("node", 1, "classification", "changed", "Included", "Idle"),
+            ("node", 1, "penalties", "changed", 0, 2),
+            ("node", 3, "classification", "removed", "Included", None),
+            ("node", 4, "classification", "added", None, "Included"),
+        ]
+
+    def test_no_changes(self):
+        snapshot = {"parameters": {"state": "Active"}, "nodes": {1: node()}}
+        assert diff_subnet_snapshots(snapshot, snapshot) == []
+
+
+class TestSubnetSnapshot:
+    """Test a subnet snapshot is read with map scans and one multi-key query."""
+
+    def test_get_subnet_snapshot(self):
+        with patch("src.htcli.client.SubstrateInterface") as mock_substrate:
+            substrate = Mock()
+            mock_substrate.return_value = substrate
+
+            def query_map(module, storage_function, params, block_hash, page_size):
+                if storage_function == "SubnetNodesData":
+                    key = (Mock(value=1), Mock(value=7))
+                    return [(key, Mock(value={"hotkey": "5hot", "penalties": 1}))]
+                return []
+
+            storage = {
+                "SubnetsData[1]": {"name": "subnet-1", "state": "Active"},
+                "TotalSubnetNodes[1]": 1,
+                "NodeDelegateStakeBalance[1, 7]": 50,
+                "AccountSubnetStake['5hot', 1]": 1000,
+            }
+
+            def create_storage_key(module, storage_function, params):
+                return Mock(to_hex=Mock(return_value=f"{storage_function}{params}"))
+
+            def query_multi(storage_keys, block_hash=None):
+                return [
+                    (key, Mock(value=storage.get(key.to_hex()))) for key in storage_keys
+                ]
+
+            substrate.query_map.side_effect = query_map
+            substrate.create_storage_key.side_effect = create_storage_key
+            substrate.query_multi.side_effect = query_multi
+
+            from src.htcli.config import load_config
+
+            client = HypertensorClient(load_config())
+            snapshot = client.get_subnet_snapshot(1, BEFORE)
+
+        assert substrate.query_multi.call_count == 1
+        assert substrate.query_multi.call_args.kwargs["block_hash"] == BEFORE
+        assert snapshot["parameters"]["name"] == "subnet-1"
+        assert snapshot["parameters"]["total_nodes"] == 1
+        assert snapshot["parameters"]["owner"] is None
+        assert snapshot["nodes"][7]["penalties"] == 1
+        assert snapshot["nodes"][7]["delegate_stake"] == 50
+        assert snapshot["nodes"][7]["stake"] == 1000
+        assert snapshot["unavailable"] == []
+
+    def test_storage_missing_from_metadata(self):
+        """Test a storage item the runtime lacks is skipped, not fatal."""
+        with patch("src.htcli.client.SubstrateInterface") as mock_substrate:
+            substrate = Mock()
+            mock_substrate.return_value = substrate
+            substrate.query_map.return_value = []
+            substrate.get_metadata_storage_function.side_effect = (
+                lambda module, storage_function: storage_function != "ChurnDenominator"
+            )
+
+            def create_storage_key(module, storage_function, params):
+                if storage_function == "ChurnDenominator":
+                    raise ValueError(f"Storage function {storage_function} not found")
+                return Mock(to_hex=Mock(return_value=f"{storage_function}{params}"))
+
+            substrate.create_storage_key.side_effect = create_storage_key
+            substrate.query_multi.side_effect = lambda keys, block_hash=None: [
+                (key, Mock(value=None)) for key in keys
+            ]
+
+            from src.htcli.config import load_config
+
+            client = HypertensorClient(load_config())
+            snapshot = client.get_subnet_snapshot(1, BEFORE)
+
+        assert "churn_limit" not in snapshot["parameters"]
+        assert "total_nodes" in snapshot["parameters"]
+        assert snapshot["unavailable"] == ["churn_limit"]
+
+
+class TestSubnetDiffCommand:
+    """Test the subnet diff command."""
+
+    def test_diff_ndjson(self, cli_runner):
+        mock_client = Mock()
+        mock_client.resolve_block.side_effect = lambda block: {
+            "block_number": int(block) if block else 200,
+            "block_hash": BEFORE if block else AFTER,
+        }
+        mock_client.get_subnet_snapshot.side_effect = lambda subnet_id, block_hash: {
+            "parameters": {"state": "Registered" if block_hash == BEFORE else "Active"},
+            "nodes": {},
+        }
+
+        with patch("src.htcli.commands.subnet.get_client", return_value=mock_client):
+            result = cli_runner.invoke(
+                app,
+                [
+                    "subnet",
+                    "diff",
+                    "--subnet-id",
+                    "1",
+                    "--from-block",
+                    "100",
+                    "--format",
+                    "ndjson",
+                ],
+            )
+
+        assert result.exit_code == 0
+        rows = [json.loads(line) for line in result.stdout.splitlines()]
+        assert rows == [
+            {
+                "subnet_id": 1,
+                "scope": "subnet",
+                "node_id": None,
+                "field": "state",
+                "change": "changed",
+                "from": "Registered",
+                "to": "Active",
+            }
+        ]
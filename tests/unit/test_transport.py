@@ -0,0 +1,115 @@
+"""
+Unit tests for the resilient RPC transport.
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from websocket import WebSocketConnectionClosedException, WebSocketTimeoutException
+
+from src.htcli.client.transport import (
+    CircuitBreaker,
+    CircuitOpenError,
+    ResilientTransport,
+    RetryPolicy,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_sleep():
+    with patch("src.htcli.client.transport.time.sleep") as mock_sleep:
+        yield mock_sleep
+
+
+def make_transport(endpoint, retry_attempts=3, timeout=30.0):
+    substrate = Mock()
+    policy = RetryPolicy(retry_attempts=retry_attempts, timeout=timeout)
+    return ResilientTransport(substrate, endpoint, policy), substrate
+
+
+class TestResilientTransport:
+    """Test retries, reconnects and deadlines."""
+
+    def test_read_retried_after_reconnect(self, no_sleep):
+        """Test a dropped read is replayed on a new connection."""
+        transport, substrate = make_transport("wss://retry")
+        rpc = Mock(side_effect=[WebSocketConnectionClosedException(), {"result": 1}])
+
+        result = transport.request(rpc, "state_getStorage", ["0x"])
+
+        assert result == {"result": 1}
+        assert rpc.call_count == 2
+        substrate.connect_websocket.assert_called_once()
+        assert no_sleep.call_count == 1
+        assert no_sleep.call_args[0][0] <= RetryPolicy().base_delay
+
+    def test_read_gives_up_after_retry_attempts(self):
+        """Test the last transport error is raised once attempts run out."""
+        transport, _ = make_transport("wss://give-up", retry_attempts=2)
+        rpc = Mock(side_effect=WebSocketTimeoutException("timed out"))
+
+        with pytest.raises(WebSocketTimeoutException):
+            transport.request(rpc, "state_getStorage", ["0x"])
+
+        assert rpc.call_count == 3
+
+    def test_submission_not_replayed(self):
+        """Test transaction submissions are sent only once."""
+        transport, substrate = make_transport("wss://submit")
+        rpc = Mock(side_effect=WebSocketConnectionClosedException())
+
+        with pytest.raises(WebSocketConnectionClosedException):
+            transport.request(rpc, "author_submitAndWatchExtrinsic", ["0x"], Mock())
+
+        assert rpc.call_count == 1
+        substrate.connect_websocket.assert_called_once()
+
+    def test_node_errors_not_retried(self):
+        """Test errors reported by the node are raised immediately."""
+        transport, _ = make_transport("wss://node-error")
+        rpc = Mock(side_effect=ValueError("bad params"))
+
+        with pytest.raises(ValueError):
+            transport.request(rpc, "state_getStorage", ["0x"])
+
+        assert rpc.call_count == 1
+
+    def test_deadline_bounds_socket_timeout(self):
+        """Test each read attempt only gets the time left before the deadline."""
+        transport, substrate = make_transport("wss://deadline", timeout=2.0)
+
+        transport.request(Mock(return_value={}), "state_getStorage", ["0x"])
+
+        timeout = substrate.websocket.settimeout.call_args[0][0]
+        assert 0 < timeout <= 2.0
+
+
+class TestCircuitBreaker:
+    """Test the per-endpoint circuit breaker."""
+
+    def test_opens_and_recovers(self):
+        """Test the circuit opens after repeated failures and half-opens later."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10)
+
+        with patch("src.htcli.client.transport.time.monotonic", return_value=100):
+            breaker.record_failure()
+            assert breaker.allow()
+            breaker.record_failure()
+            assert not breaker.allow()
+
+        with patch("src.htcli.client.transport.time.monotonic", return_value=111):
+            assert breaker.allow()
+            # Only one trial request while half-open
+            assert not breaker.allow()
+            breaker.record_success()
+            assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_open_circuit_short_circuits_requests(self):
+        """Test requests fail fast while the endpoint's circuit is open."""
+        transport, _ = make_transport("wss://open-circuit", retry_attempts=10)
+        rpc = Mock(side_effect=OSError("connection refused"))
+
+        with pytest.raises(CircuitOpenError):
+            transport.request(rpc, "state_getStorage", ["0x"])
+
+        assert rpc.call_count == transport.breaker.failure_threshold
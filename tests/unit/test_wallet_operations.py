@@ -2,8 +2,13 @@
 Real tests for wallet operations.
 """
 
+import json
+import sqlite3
+import stat
 from unittest.mock import Mock, patch
 
+import pytest
+
 from src.htcli.client import HypertensorClient
 from src.htcli.models.requests import StakeAddRequest, StakeRemoveRequest
 
@@ -172,3 +177,208 @@ class TestWalletKeys:
             assert result[1]["name"] == "test-key-2"
             assert result[0]["key_type"] == "sr25519"
             assert result[1]["key_type"] == "ed25519"
+
+    def test_generate_keypairs_saves_all_or_none(self, tmp_path):
+        """Test bulk generation across processes saves every key or none."""
+        from src.htcli.utils.crypto import generate_keypairs
+
+        wallet_dir = tmp_path / ".htcli" / "wallets"
+        with patch("src.htcli.utils.keystore.Path.home", return_value=tmp_path):
+            keys = generate_keypairs(["node-1", "node-2", "node-3"], processes=2)
+
+            assert [key.name for key in keys] == ["node-1", "node-2", "node-3"]
+            assert len({key.ss58_address for key in keys}) == 3
+            assert all(key.mnemonic is None for key in keys)
+            assert sorted(p.name for p in wallet_dir.iterdir()) == [
+                "node-1.json",
+                "node-2.json",
+                "node-3.json",
+            ]
+
+            with pytest.raises(Exception, match="already exist: node-3"):
+                generate_keypairs(["node-3", "node-4"], processes=1)
+            assert not (wallet_dir / "node-4.json").exists()
+
+    def test_generate_keypairs_returns_mnemonics(self, tmp_path):
+        """Test mnemonics are returned on request and recover the same key."""
+        from substrateinterface import Keypair
+
+        from src.htcli.utils.crypto import generate_keypairs
+
+        with patch("src.htcli.utils.keystore.Path.home", return_value=tmp_path):
+            with patch(
+                "src.htcli.utils.password.prompt_for_password",
+                side_effect=AssertionError("prompted"),
+            ):
+                (key,) = generate_keypairs(["node-1"], with_mnemonics=True)
+
+        recovered = Keypair.create_from_uri(key.mnemonic)
+        assert recovered.ss58_address == key.ss58_address
+
+    def test_generate_keys_command_writes_manifest(self, cli_runner, tmp_path):
+        """Test generate-keys numbers the keys and writes their manifest."""
+        from src.htcli.main import app
+        from src.htcli.utils.crypto import KeypairInfo
+
+        manifest = tmp_path / "manifest.ndjson"
+        keys = [
+            KeypairInfo(f"node-{i:02d}", "sr25519", "ab", f"5addr{i}") for i in (9, 10)
+        ]
+        with patch(
+            "src.htcli.commands.wallet.generate_keypairs", return_value=keys
+        ) as generate:
+            result = cli_runner.invoke(
+                app,
+                ["wallet", "generate-keys", "--count", "2", "--prefix", "node-"]
+                + ["--start", "9", "-o", str(manifest)],
+            )
+
+        assert result.exit_code == 0
+        assert generate.call_args.args[0] == ["node-09", "node-10"]
+        rows = [json.loads(line) for line in manifest.read_text().splitlines()]
+        assert [row["ss58_address"] for row in rows] == ["5addr9", "5addr10"]
+        assert "mnemonic" not in rows[0]
+
+    def test_generate_keys_writes_private_mnemonic_manifest(self, cli_runner, tmp_path):
+        """Test --with-mnemonics adds mnemonics to an owner-only manifest."""
+        from src.htcli.main import app
+        from src.htcli.utils.crypto import KeypairInfo
+
+        manifest = tmp_path / "manifest.ndjson"
+        manifest.write_text("")
+        manifest.chmod(0o644)
+        keys = [KeypairInfo("node-1", "sr25519", "ab", "5addr1", "word " * 12)]
+        with patch("src.htcli.commands.wallet.generate_keypairs", return_value=keys):
+            result = cli_runner.invoke(
+                app,
+                ["wallet", "generate-keys", "--count", "1", "--prefix", "node-"]
+                + ["--with-mnemonics", "-o", str(manifest)],
+            )
+
+        assert result.exit_code == 0
+        assert json.loads(manifest.read_text())["mnemonic"] == "word " * 12
+        assert stat.S_IMODE(manifest.stat().st_mode) == 0o600
+
+
+class TestKeystore:
+    """Test the single-file keystore and migration from JSON key files."""
+
+    def _record(self, name):
+        return {
+            "name": name,
+            "key_type": "sr25519",
+            "public_key": "ab",
+            "ss58_address": f"5{name}",
+            "encrypted_private_key": "secret",
+            "salt": "salt",
+        }
+
+    def test_migrate_json_keys(self, tmp_path):
+        from src.htcli.utils.keystore import (
+            JsonKeystore,
+            SqliteKeystore,
+            migrate_json_keys,
+            open_keystore,
+        )
+
+        JsonKeystore(tmp_path).add([self._record("a"), self._record("b")])
+        assert isinstance(open_keystore(tmp_path), JsonKeystore)
+
+        assert migrate_json_keys(tmp_path) == 2
+
+        keystore = open_keystore(tmp_path)
+        assert isinstance(keystore, SqliteKeystore)
+        assert not list(tmp_path.glob("*.json"))
+        assert [key["name"] for key in keystore.list()] == ["a", "b"]
+        assert "encrypted_private_key" not in keystore.list()[0]
+        assert keystore.get("b")["encrypted_private_key"] == "secret"
+
+    def test_migrate_refuses_different_key(self, tmp_path):
+        from src.htcli.utils.keystore import (
+            KEYSTORE_FILE,
+            JsonKeystore,
+            SqliteKeystore,
+            migrate_json_keys,
+        )
+
+        keystore = SqliteKeystore(tmp_path / KEYSTORE_FILE)
+        keystore.add([self._record("a"), self._record("b")])
+        JsonKeystore(tmp_path).add(
+            [{**self._record("a"), "encrypted_private_key": "other"}, self._record("b")]
+        )
+
+        with pytest.raises(FileExistsError, match="a"):
+            migrate_json_keys(tmp_path)
+
+        assert (tmp_path / "a.json").exists() and (tmp_path / "b.json").exists()
+        assert keystore.get("a")["encrypted_private_key"] == "secret"
+
+        # Files identical to their stored record count as migrated
+        (tmp_path / "a.json").unlink()
+        assert migrate_json_keys(tmp_path) == 0
+        assert not (tmp_path / "b.json").exists()
+
+    def test_sqlite_add_is_all_or_none(self, tmp_path):
+        from src.htcli.utils.keystore import KEYSTORE_FILE, SqliteKeystore
+
+        keystore = SqliteKeystore(tmp_path / KEYSTORE_FILE)
+        connect = sqlite3.connect
+        modes = []
+
+        def record_mode(path):
+            # The file must already be private when SQLite opens it
+            modes.append(stat.S_IMODE(path.stat().st_mode))
+            return connect(path)
+
+        with patch("src.htcli.utils.keystore.sqlite3.connect", record_mode):
+            keystore.add([self._record("a")])
+        assert modes and set(modes) == {0o600}
+
+        with pytest.raises(FileExistsError, match="a"):
+            keystore.add([self._record("c"), self._record("a")])
+        assert keystore.get("c") is None
+
+        assert keystore.delete("a")
+        assert not keystore.delete("a")
+
+    def test_crypto_uses_keystore(self, tmp_path):
+        from src.htcli.utils.crypto import delete_keypair, list_keys
+        from src.htcli.utils.keystore import KEYSTORE_FILE, SqliteKeystore
+
+        wallet_dir = tmp_path / ".htcli" / "wallets"
+        SqliteKeystore(wallet_dir / KEYSTORE_FILE).add([self._record("hot")])
+
+        with patch("src.htcli.utils.keystore.Path.home", return_value=tmp_path):
+            assert list_keys()[0]["address"] == "5hot"
+            assert delete_keypair("hot")
+            assert list_keys() == []
+
+    def test_json_index_reparses_changed_files_only(self, tmp_path):
+        from src.htcli.utils.keystore import JsonKeystore
+
+        wallet_dir = tmp_path / "wallets"
+        keystore = JsonKeystore(wallet_dir)
+        keystore.add([self._record(name) for name in ("a", "b", "c")])
+        (wallet_dir / "broken.json").write_text("{")
+
+        with patch.object(
+            JsonKeystore, "_read_public", wraps=JsonKeystore._read_public
+        ) as read_public:
+            assert [key["name"] for key in keystore.list()] == ["a", "b", "c"]
+            assert read_public.call_count == 4
+            assert keystore.index_path.exists()
+
+            read_public.reset_mock()
+            assert len(keystore.list()) == 3
+            read_public.assert_not_called()
+
+            record = {**self._record("b"), "ss58_address": "5changed-address"}
+            (wallet_dir / "b.json").write_text(json.dumps(record))
+            keystore.add([self._record("d")])
+            keystore.delete("a")
+            keys = keystore.list()
+
+        assert [key["name"] for key in keys] == ["b", "c", "d"]
+        assert keys[0]["ss58_address"] == "5changed-address"
+        parsed = sorted(call.args[0].name for call in read_public.call_args_list)
+        assert parsed == ["b.json", "d.json"]